@@ -0,0 +1,79 @@
+"""
+Deserialization benchmark for the spoonacular models.
+
+Deserializes recorded response payloads (benchmarks/fixtures) with the
+default validating path and with each fast_deserialize mode, and reports
+the median time per response. The lazy mode is timed twice: once as
+returned, and once with an attribute read on every item, which forces the
+validated conversion.
+
+    python benchmarks/deserialize.py [--runs 50]
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from spoonacular.api_client import ApiClient  # noqa: E402
+
+FIXTURES = {
+    "search_recipes_by_ingredients.json": "List[SearchRecipesByIngredients200ResponseInner]",
+    "get_recipe_information_bulk.json": "List[GetRecipeInformationBulk200ResponseInner]",
+}
+
+MODES = [None, "trusted", "records", "lazy"]
+
+
+def touch(items):
+    for item in items:
+        item.id
+
+
+def measure(client, payload, response_type, runs, after=None):
+    timings = []
+    for _ in range(runs):
+        # Like timeit: a collection landing in one run would dominate it
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = client.deserialize(payload, response_type)
+            if after is not None:
+                after(result)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure spoonacular response deserialization")
+    parser.add_argument("--runs", type=int, default=50, help="Runs per mode (default: 50)")
+    args = parser.parse_args()
+
+    for fixture, response_type in FIXTURES.items():
+        with open(os.path.join(ROOT, "benchmarks", "fixtures", fixture)) as f:
+            payload = f.read()
+        print(f"{fixture} ({len(payload) / 1024:.0f} KiB)")
+        print(f"  {'mode':<20} {'median ms':>10} {'speedup':>8}")
+
+        baseline, expected = measure(ApiClient(), payload, response_type, args.runs)
+        expected = [item.to_dict() for item in expected]
+        scenarios = [(mode or "default", mode, None) for mode in MODES]
+        scenarios.append(("lazy + attribute", "lazy", touch))
+        for name, mode, after in scenarios:
+            elapsed, result = measure(ApiClient(fast_deserialize=mode), payload, response_type, args.runs, after)
+            if [item.to_dict() for item in result] != expected:
+                print(f"  {name:<20} mismatch")
+                continue
+            print(f"  {name:<20} {elapsed * 1000:>10.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
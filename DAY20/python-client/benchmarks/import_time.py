@@ -0,0 +1,69 @@
+"""
+Import-time benchmark for the spoonacular package.
+
+Each scenario runs in a fresh interpreter, so nothing is cached between
+runs. Reports the median wall time, the peak RSS and how many spoonacular
+modules were loaded.
+
+    python benchmarks/import_time.py [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import spoonacular": "import spoonacular",
+    "ApiClient + Configuration": "import spoonacular; spoonacular.ApiClient(spoonacular.Configuration())",
+    "one API (WineApi)": "import spoonacular; spoonacular.WineApi",
+    "largest API (RecipesApi)": "import spoonacular; spoonacular.RecipesApi",
+    "everything (eager)": "import spoonacular; [getattr(spoonacular, name) for name in spoonacular.__all__]",
+}
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+modules = sum(1 for name in sys.modules if name.startswith("spoonacular"))
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(__import__("json").dumps([elapsed, modules, rss_kb]))
+"""
+
+
+def measure(statement, runs):
+    timings, modules, rss = [], 0, 0
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        elapsed, modules, rss = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(elapsed)
+    return statistics.median(timings), modules, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure spoonacular import time")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per scenario (default: 10)")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<28} {'median ms':>10} {'modules':>8} {'peak RSS MB':>12}")
+    for name, statement in SCENARIOS.items():
+        try:
+            elapsed, modules, rss_kb = measure(statement, args.runs)
+        except RuntimeError as e:
+            print(f"{name:<28} failed: {e}")
+            continue
+        print(f"{name:<28} {elapsed * 1000:>10.1f} {modules:>8} {rss_kb / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
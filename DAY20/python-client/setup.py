@@ -40,6 +40,7 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "spoonacular API"],
     install_requires=REQUIRES,
+    extras_require={"async": ["aiohttp >= 3.8"]},
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     license="spoonacular API Terms",
@@ -0,0 +1,38 @@
+# coding: utf-8
+
+"""
+    Lazy attribute loading for the spoonacular packages (PEP 562).
+
+    The package __init__ modules map each public name to the module that
+    defines it instead of importing everything up front, so importing the
+    package only pays for the APIs and models that are actually used.
+"""  # noqa: E501
+
+
+import importlib
+import sys
+
+
+def attach(package_name, imports):
+    """Build module-level __getattr__ and __dir__ for a package.
+
+    :param package_name: __name__ of the package.
+    :param imports: dict of public name -> module that defines it.
+    :return: tuple (__getattr__, __dir__, __all__)
+    """
+
+    def __getattr__(name):
+        module_name = imports.get(name)
+        if module_name is None:
+            raise AttributeError(
+                "module %r has no attribute %r" % (package_name, name)
+            )
+        value = getattr(importlib.import_module(module_name), name)
+        # Later lookups find the name directly, without calling __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(imports))
+
+    return __getattr__, __dir__, list(imports)
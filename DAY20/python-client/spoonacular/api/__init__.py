@@ -1,12 +1,17 @@
 # flake8: noqa
 
-# import apis into api package
-from spoonacular.api.default_api import DefaultApi
-from spoonacular.api.ingredients_api import IngredientsApi
-from spoonacular.api.meal_planning_api import MealPlanningApi
-from spoonacular.api.menu_items_api import MenuItemsApi
-from spoonacular.api.misc_api import MiscApi
-from spoonacular.api.products_api import ProductsApi
-from spoonacular.api.recipes_api import RecipesApi
-from spoonacular.api.wine_api import WineApi
+# apis are imported on first access, see spoonacular._lazy
+from spoonacular._lazy import attach
 
+_IMPORTS = {
+    "DefaultApi": "spoonacular.api.default_api",
+    "IngredientsApi": "spoonacular.api.ingredients_api",
+    "MealPlanningApi": "spoonacular.api.meal_planning_api",
+    "MenuItemsApi": "spoonacular.api.menu_items_api",
+    "MiscApi": "spoonacular.api.misc_api",
+    "ProductsApi": "spoonacular.api.products_api",
+    "RecipesApi": "spoonacular.api.recipes_api",
+    "WineApi": "spoonacular.api.wine_api",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _IMPORTS)
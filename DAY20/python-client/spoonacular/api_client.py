@@ -27,6 +27,7 @@ from typing import Tuple, Optional, List, Dict
 
 from spoonacular.configuration import Configuration
 from spoonacular.api_response import ApiResponse, T as ApiResponseT
+from spoonacular.fast_deserialize import MODES as FAST_DESERIALIZE_MODES, build as build_fast
 import spoonacular.models
 from spoonacular import rest
 from spoonacular.exceptions import (
@@ -55,6 +56,11 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param response_cache: optional spoonacular.cache.ResponseCache used to
+        reuse responses to identical requests.
+    :param fast_deserialize: optional fast deserialization mode for trusted
+        responses: "trusted", "records" or "lazy"
+        (see spoonacular.fast_deserialize).
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -75,7 +81,9 @@ class ApiClient:
         configuration=None,
         header_name=None,
         header_value=None,
-        cookie=None
+        cookie=None,
+        response_cache=None,
+        fast_deserialize=None
     ) -> None:
         # use default configuration if none is provided
         if configuration is None:
@@ -83,6 +91,12 @@ class ApiClient:
         self.configuration = configuration
 
         self.rest_client = rest.RESTClientObject(configuration)
+        self.response_cache = response_cache
+        if fast_deserialize and fast_deserialize not in FAST_DESERIALIZE_MODES:
+            raise ApiValueError(
+                "fast_deserialize must be one of %s" % (FAST_DESERIALIZE_MODES,)
+            )
+        self.fast_deserialize = fast_deserialize
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -266,13 +280,25 @@ class ApiClient:
         """
 
         try:
-            # perform request and return response
-            response_data = self.rest_client.request(
-                method, url,
-                headers=header_params,
-                body=body, post_params=post_params,
-                _request_timeout=_request_timeout
-            )
+            if (
+                self.response_cache is not None
+                and self.response_cache.cacheable(method, post_params)
+            ):
+                # answer from the cache, revalidating or fetching as needed
+                response_data = self.response_cache.request(
+                    self.rest_client, method, url,
+                    headers=header_params,
+                    body=body, post_params=post_params,
+                    _request_timeout=_request_timeout
+                )
+            else:
+                # perform request and return response
+                response_data = self.rest_client.request(
+                    method, url,
+                    headers=header_params,
+                    body=body, post_params=post_params,
+                    _request_timeout=_request_timeout
+                )
 
         except ApiException as e:
             raise e
@@ -421,6 +447,7 @@ class ApiClient:
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
             else:
+                # spoonacular.models imports the model's module on first use
                 klass = getattr(spoonacular.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
@@ -756,4 +783,6 @@ class ApiClient:
         :return: model object.
         """
 
+        if self.fast_deserialize:
+            return build_fast(klass, data, self.fast_deserialize)
         return klass.from_dict(data)
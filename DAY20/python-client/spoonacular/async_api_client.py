@@ -0,0 +1,232 @@
+# coding: utf-8
+
+"""
+    Asyncio ApiClient for the spoonacular client.
+
+    AsyncApiClient sends requests through AsyncRESTClientObject (aiohttp)
+    and reuses the generated API classes through AsyncApi, so every
+    generated method, with the same arguments and validation, is available
+    as a coroutine.
+"""  # noqa: E501
+
+
+import functools
+
+from spoonacular.api_client import ApiClient
+from spoonacular.async_rest import AsyncRESTClientObject
+from spoonacular.configuration import Configuration
+
+
+class _Placeholder:
+    """Stands in for the response while a generated method is recorded."""
+
+    def __init__(self, name) -> None:
+        self.name = name
+
+    def read(self):
+        return None
+
+    def __repr__(self):
+        return '<pending %s>' % self.name
+
+
+# What a generated method returns when run against a _RequestRecorder:
+# `<method>` returns ApiResponse.data, `<method>_with_http_info` returns the
+# ApiResponse and `<method>_without_preload_content` returns the raw response.
+_PENDING_RESPONSE = _Placeholder('response')
+_PENDING_RESPONSE.response = _Placeholder('raw response')
+_PENDING_API_RESPONSE = _Placeholder('ApiResponse')
+_PENDING_API_RESPONSE.data = _Placeholder('data')
+
+
+class _RequestRecorder:
+    """ApiClient stand-in that records the request a generated method makes.
+
+    Serialization is delegated to a real ApiClient; call_api and
+    response_deserialize only record their arguments.
+    """
+
+    def __init__(self, api_client) -> None:
+        self._api_client = api_client
+        self.request = None
+        self.response_types_map = None
+
+    def __getattr__(self, name):
+        return getattr(self._api_client, name)
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        self.request = (method, url, header_params, body, post_params, _request_timeout)
+        return _PENDING_RESPONSE
+
+    def response_deserialize(self, response_data, response_types_map=None):
+        self.response_types_map = response_types_map
+        return _PENDING_API_RESPONSE
+
+
+class AsyncApiClient:
+    """Asyncio API client.
+
+    Shares one aiohttp connection pool between all requests and allows at
+    most max_concurrency of them in flight. Use it as an async context
+    manager (or call close()) to release the pool.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    :param response_cache: optional spoonacular.cache.ResponseCache.
+    :param max_concurrency: maximum number of requests in flight at once.
+    :param fast_deserialize: optional fast deserialization mode, as for
+        ApiClient.
+    """
+
+    def __init__(
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+        response_cache=None,
+        max_concurrency=100,
+        fast_deserialize=None
+    ) -> None:
+        if configuration is None:
+            configuration = Configuration.get_default()
+        self.configuration = configuration
+        # Builds requests and deserializes responses; never sends anything
+        self.api_client = ApiClient(
+            configuration, header_name, header_value, cookie,
+            fast_deserialize=fast_deserialize
+        )
+        self.rest_client = AsyncRESTClientObject(configuration, max_concurrency)
+        self.response_cache = response_cache
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    def set_default_header(self, header_name, header_value):
+        self.api_client.set_default_header(header_name, header_value)
+
+    def api(self, api_class):
+        """Return an AsyncApi for a generated API class, e.g. RecipesApi."""
+        return AsyncApi(api_class, self)
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: a response object with the body already read
+        """
+        cache = self.response_cache
+        if cache is None or not cache.cacheable(method, post_params):
+            return await self.rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        key, entry, header_params = cache.prepare(method, url, header_params, body)
+        if entry is not None and entry.is_fresh():
+            response = cache.hit(entry)
+            response.read()
+            return response
+
+        response = await self.rest_client.request(
+            method, url,
+            headers=header_params,
+            body=body, post_params=post_params,
+            _request_timeout=_request_timeout
+        )
+        stored = cache.complete(key, url, entry, response.status, response.reason,
+                                response.getheaders(), response.data)
+        if stored is None:
+            return response
+        response = stored.to_response()
+        response.read()
+        return response
+
+    async def invoke(self, api_class, method_name, args, kwargs):
+        """Run a generated API method asynchronously.
+
+        The generated method runs against a _RequestRecorder, which
+        validates the arguments and builds the request without sending it.
+        The request is then sent with call_api and the response is
+        deserialized as the generated method would have.
+        """
+        recorder = _RequestRecorder(self.api_client)
+        result = getattr(api_class(recorder), method_name)(*args, **kwargs)
+        if recorder.request is None:
+            # Not a request method
+            return result
+
+        response = await self.call_api(*recorder.request)
+        if result is _PENDING_RESPONSE.response:
+            return response
+        api_response = self.api_client.response_deserialize(
+            response_data=response,
+            response_types_map=recorder.response_types_map
+        )
+        if result is _PENDING_API_RESPONSE.data:
+            return api_response.data
+        return api_response
+
+
+class AsyncApi:
+    """Exposes the methods of a generated API class as coroutines.
+
+    >>> recipes = AsyncApi(RecipesApi, async_api_client)
+    >>> info = await recipes.get_recipe_information(716429)
+
+    :param api_class: a generated API class, e.g. RecipesApi.
+    :param api_client: the AsyncApiClient that sends the requests.
+    """
+
+    def __init__(self, api_class, api_client) -> None:
+        self.api_class = api_class
+        self.api_client = api_client
+
+    def __getattr__(self, name):
+        method = getattr(self.api_class, name, None)
+        if name.startswith('_') or not callable(method):
+            raise AttributeError(
+                "%s has no API method %r" % (self.api_class.__name__, name)
+            )
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self.api_client.invoke(self.api_class, name, args, kwargs)
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, call)
+        return call
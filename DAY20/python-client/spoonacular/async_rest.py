@@ -0,0 +1,207 @@
+# coding: utf-8
+
+"""
+    Asyncio REST transport for the spoonacular client, built on aiohttp.
+
+    Mirrors spoonacular.rest: AsyncRESTClientObject.request takes the same
+    arguments as RESTClientObject.request and encodes bodies the same way,
+    but is a coroutine. All requests share one aiohttp session (and so one
+    connection pool), and a semaphore bounds how many are in flight.
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import re
+import ssl
+
+from urllib3._collections import HTTPHeaderDict
+
+from spoonacular.exceptions import ApiException, ApiValueError
+
+
+class AsyncRESTResponse:
+    """A fully read response, with the same accessors as rest.RESTResponse."""
+
+    def __init__(self, status, reason, headers, data) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def read(self):
+        return self.data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+    """aiohttp-based counterpart of rest.RESTClientObject.
+
+    :param configuration: .Configuration object for this client
+    :param max_concurrency: maximum number of requests in flight at once;
+        also the size of the connection pool.
+    """
+
+    def __init__(self, configuration, max_concurrency=100) -> None:
+        self.configuration = configuration
+        self.max_concurrency = max_concurrency
+        self._session = None
+        self._semaphore = None
+
+    def _ssl_context(self):
+        configuration = self.configuration
+        if not configuration.verify_ssl:
+            return False
+        context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.cert_file:
+            context.load_cert_chain(configuration.cert_file, keyfile=configuration.key_file)
+        if configuration.assert_hostname is False:
+            context.check_hostname = False
+        return context
+
+    def _get_session(self):
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ApiValueError(
+                    "The asyncio client requires aiohttp: pip install aiohttp"
+                )
+            # Created lazily so that it binds to the running event loop
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=self._ssl_context()
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _timeout(self, _request_timeout):
+        import aiohttp
+
+        if not _request_timeout:
+            return None
+        if isinstance(_request_timeout, (int, float)):
+            return aiohttp.ClientTimeout(total=_request_timeout)
+        if isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            return aiohttp.ClientTimeout(
+                sock_connect=_request_timeout[0],
+                sock_read=_request_timeout[1]
+            )
+        return None
+
+    def _body(self, method, headers, body, post_params):
+        """Encode the request body like RESTClientObject.request does."""
+        import aiohttp
+
+        if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            return None
+
+        content_type = headers.get('Content-Type')
+        if (
+            not content_type
+            or re.search('json', content_type, re.IGNORECASE)
+        ):
+            return json.dumps(body) if body is not None else None
+        if content_type == 'application/x-www-form-urlencoded':
+            return aiohttp.FormData(post_params)
+        if content_type == 'multipart/form-data':
+            # aiohttp generates the Content-Type with the boundary
+            del headers['Content-Type']
+            form = aiohttp.FormData()
+            for name, value in post_params:
+                if isinstance(value, tuple):
+                    filename, filedata, mimetype = value
+                    form.add_field(name, filedata, filename=filename, content_type=mimetype)
+                else:
+                    form.add_field(name, str(value))
+            return form
+        if isinstance(body, str) or isinstance(body, bytes):
+            return body
+        if headers['Content-Type'] == 'text/plain' and isinstance(body, bool):
+            return "true" if body else "false"
+
+        # Cannot generate the request from given parameters
+        msg = """Cannot prepare a request message for provided
+                 arguments. Please check that your arguments match
+                 declared content type."""
+        raise ApiException(status=0, reason=msg)
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :return: AsyncRESTResponse with the body already read
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        # Fails with a clear message if aiohttp is missing
+        session = self._get_session()
+        import aiohttp
+
+        post_params = post_params or []
+        headers = dict(headers or {})
+        data = self._body(method, headers, body, post_params)
+
+        async with self._semaphore:
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=self._timeout(_request_timeout) or session.timeout,
+                    proxy=self.configuration.proxy,
+                    proxy_headers=self.configuration.proxy_headers
+                ) as r:
+                    response_headers = HTTPHeaderDict()
+                    for name, value in r.headers.items():
+                        response_headers.add(name, value)
+                    return AsyncRESTResponse(r.status, r.reason, response_headers, await r.read())
+            except aiohttp.ClientSSLError as e:
+                msg = "\n".join([type(e).__name__, str(e)])
+                raise ApiException(status=0, reason=msg)
@@ -0,0 +1,290 @@
+# coding: utf-8
+
+"""
+    Response cache for the spoonacular ApiClient.
+
+    Sits between ApiClient.param_serialize and RESTClientObject.request and
+    reuses responses to identical requests while they are fresh, with
+    per-endpoint TTLs, an in-memory LRU tier, an optional on-disk tier and
+    ETag / Last-Modified revalidation once they go stale.
+"""  # noqa: E501
+
+
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from spoonacular import rest
+
+# Only complete, successful responses are stored
+CACHEABLE_STATUS = (200, 203)
+
+# Headers that describe the original transfer rather than the stored body
+TRANSFER_HEADERS = ('Connection', 'Content-Encoding', 'Content-Length', 'Transfer-Encoding')
+
+
+def _compile_endpoint(pattern):
+    """Turn a resource path such as /recipes/{id}/information into a regex."""
+    parts = re.split(r'\{[^}]+\}', pattern)
+    return re.compile('[^/]+'.join(re.escape(part) for part in parts) + '$')
+
+
+class CacheEntry:
+    """A stored response plus the metadata needed to reuse or revalidate it."""
+
+    __slots__ = ('status', 'reason', 'headers', 'data', 'expires')
+
+    def __init__(self, status, reason, headers, data, expires) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = HTTPHeaderDict(headers)
+        for name in TRANSFER_HEADERS:
+            self.headers.discard(name)
+        self.data = data
+        self.expires = expires
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    def is_fresh(self, now=None) -> bool:
+        return (now if now is not None else time.time()) < self.expires
+
+    def to_response(self) -> rest.RESTResponse:
+        """Build a RESTResponse that reads the stored body."""
+        resp = urllib3.HTTPResponse(
+            body=io.BytesIO(self.data),
+            headers=HTTPHeaderDict(self.headers),
+            status=self.status,
+            reason=self.reason,
+            preload_content=False,
+            decode_content=False
+        )
+        return rest.RESTResponse(resp)
+
+    def dump(self) -> bytes:
+        meta = {
+            'status': self.status,
+            'reason': self.reason,
+            'headers': dict(self.headers),
+            'expires': self.expires,
+        }
+        return json.dumps(meta).encode('utf-8') + b'\n' + self.data
+
+    @classmethod
+    def load(cls, raw):
+        meta, _, data = raw.partition(b'\n')
+        meta = json.loads(meta)
+        return cls(meta['status'], meta['reason'], meta['headers'], data, meta['expires'])
+
+
+class ResponseCache:
+    """Response cache for ApiClient.
+
+    Requests are keyed by method, URL (with the query string sorted) and
+    the JSON body with sorted keys. Fresh entries are answered without
+    touching the network. Stale entries that carry an ETag or
+    Last-Modified header are revalidated with If-None-Match /
+    If-Modified-Since, and a 304 answer refreshes the stored entry.
+
+    :param default_ttl: seconds a response stays fresh when no endpoint
+        TTL matches. 0 means always revalidate (if possible).
+    :param ttls: dict of resource path -> TTL in seconds, e.g.
+        {'/recipes/{id}/information': 86400}. Paths use the same
+        placeholders as the generated API and are matched against the end
+        of the request path; the first match wins.
+    :param max_entries: size of the in-memory LRU tier.
+    :param directory: optional directory for the on-disk tier, shared
+        between processes and kept across restarts.
+    :param methods: HTTP methods whose responses may be cached.
+    """
+
+    def __init__(
+        self,
+        default_ttl=300,
+        ttls=None,
+        max_entries=1024,
+        directory=None,
+        methods=('GET',)
+    ) -> None:
+        self.default_ttl = default_ttl
+        self.ttls = [(_compile_endpoint(path), ttl) for path, ttl in (ttls or {}).items()]
+        self.max_entries = max_entries
+        self.directory = directory
+        self.methods = {method.upper() for method in methods}
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, method, url, body=None) -> str:
+        """Return the cache key for a request."""
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        canonical = [method.upper(), urlunsplit(parts._replace(query=query))]
+        if body is not None:
+            canonical.append(json.dumps(body, sort_keys=True, default=str))
+        return hashlib.sha256('\n'.join(canonical).encode('utf-8')).hexdigest()
+
+    def ttl_for(self, url) -> float:
+        """Return the TTL configured for the endpoint a URL belongs to."""
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def cacheable(self, method, post_params=None) -> bool:
+        return method.upper() in self.methods and not post_params
+
+    def get(self, key) -> Optional[CacheEntry]:
+        """Look up an entry, in memory first and then on disk."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = CacheEntry.load(f.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def set(self, key, entry) -> None:
+        """Store an entry in both tiers."""
+        self._remember(key, entry)
+        if self.directory is None:
+            return
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(entry.dump())
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory is None:
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith('.cache'):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def _remember(self, key, entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key) -> str:
+        return os.path.join(self.directory, key + '.cache')
+
+    def prepare(self, method, url, headers, body=None) -> Tuple[str, Optional[CacheEntry], Dict[str, str]]:
+        """Look up a request before it is sent.
+
+        :return: tuple (key, entry, headers). entry is None unless a cached
+            response exists. If the entry is stale, headers is a copy of
+            the request headers with the conditional headers added.
+        """
+        key = self.key(method, url, body)
+        entry = self.get(key)
+        headers = dict(headers or {})
+        if entry is not None and not entry.is_fresh():
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return key, entry, headers
+
+    def hit(self, entry) -> rest.RESTResponse:
+        """Answer a request from a fresh entry."""
+        self.hits += 1
+        return entry.to_response()
+
+    def complete(self, key, url, entry, status, reason, headers, data) -> Optional[CacheEntry]:
+        """Record the network response to a request prepared with prepare().
+
+        :return: the entry to answer from (for a 304, or a new cacheable
+            response), or None if the response should be passed through.
+        """
+        ttl = self.ttl_for(url)
+        headers = HTTPHeaderDict(headers)
+        if status == 304 and entry is not None:
+            self.revalidated += 1
+            # A 304 may carry updated validators and caching headers
+            merged = HTTPHeaderDict(entry.headers)
+            for name, value in headers.items():
+                merged[name] = value
+            entry = CacheEntry(entry.status, entry.reason, merged, entry.data, time.time() + ttl)
+            self.set(key, entry)
+            return entry
+
+        self.misses += 1
+        if status not in CACHEABLE_STATUS or 'no-store' in headers.get('Cache-Control', ''):
+            return None
+        if ttl <= 0 and not (headers.get('ETag') or headers.get('Last-Modified')):
+            # It could never be reused
+            return None
+        entry = CacheEntry(status, reason, headers, data, time.time() + ttl)
+        self.set(key, entry)
+        return entry
+
+    def request(
+        self,
+        rest_client,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Answer a request from the cache or perform it with rest_client."""
+        key, entry, headers = self.prepare(method, url, headers, body)
+        if entry is not None and entry.is_fresh():
+            return self.hit(entry)
+
+        response = rest_client.request(
+            method, url,
+            headers=headers,
+            body=body, post_params=post_params,
+            _request_timeout=_request_timeout
+        )
+        data = response.read()
+        stored = self.complete(key, url, entry, response.status, response.reason,
+                               response.getheaders(), data)
+        if stored is None:
+            # Not cacheable: hand back an unread copy of the response
+            stored = CacheEntry(response.status, response.reason, response.getheaders(), data, 0)
+        return stored.to_response()
@@ -0,0 +1,288 @@
+# coding: utf-8
+
+"""
+    Opt-in fast deserialization for spoonacular response models.
+
+    The generated Model.from_dict rebuilds every dict level in Python and
+    validates each nested object with pydantic. For large, trusted
+    responses that work can cost more than the request itself. This module
+    compiles, once per model class, a field map of (attribute, JSON key,
+    converter) and uses it to build responses in one of three modes:
+
+    * "trusted": real model instances built with model_construct, without
+      validation.
+    * "records": lightweight __slots__ records with the same attribute
+      names, and no pydantic involved at all.
+    * "lazy": the raw dict wrapped in a LazyModel, which runs the normal
+      validated from_dict on first attribute access.
+
+    Enable it with ApiClient(fast_deserialize="trusted") (or "records",
+    "lazy"), or by setting api_client.fast_deserialize.
+"""  # noqa: E501
+
+
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+MODES = ("trusted", "records", "lazy")
+
+# (klass, mode) -> builder, filled on first use of each model
+_builders: Dict[Tuple[type, str], Callable[[Any], Any]] = {}
+# klass -> record class
+_record_classes: Dict[type, type] = {}
+
+
+def _is_model(annotation) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _converter(annotation, mode) -> Optional[Callable[[Any], Any]]:
+    """Return a function converting a raw JSON value to annotation, or None if it can stay raw."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is Annotated:
+        return _converter(args[0], mode)
+    if origin is typing.Union:
+        converters = [c for c in (_converter(arg, mode) for arg in args) if c is not None]
+        # Unions of primitives stay raw; a single model (Optional[Model]) is converted
+        return converters[0] if len(converters) == 1 else None
+    if origin in (list, List):
+        item = _converter(args[0], mode) if args else None
+        if item is None:
+            return None
+        return lambda value: [item(v) for v in value] if value is not None else None
+    if origin in (dict, Dict):
+        item = _converter(args[1], mode) if len(args) == 2 else None
+        if item is None:
+            return None
+        return lambda value: {k: item(v) for k, v in value.items()} if value is not None else None
+    if _is_model(annotation):
+        return _nested(annotation, mode)
+    return None
+
+
+def _nested(klass, mode) -> Callable[[Any], Any]:
+    # The builder is looked up on first call, not at compile time, so that
+    # self-referencing models compile; after that it is called directly.
+    builder = None
+
+    def convert(value):
+        nonlocal builder
+        if not isinstance(value, dict):
+            return build(klass, value, mode) if value is not None else None
+        if builder is None:
+            builder = _builder(klass, mode)
+        return builder(value)
+
+    return convert
+
+
+def _field_map(klass, mode) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str, Callable[[Any], Any]]]]:
+    """Compile the field map of a model.
+
+    :return: tuple (plain, converted): (attribute, JSON key) for fields whose
+        raw JSON value is used as is, and (attribute, JSON key, converter)
+        for fields holding nested models.
+    """
+    plain, converted = [], []
+    for name, field in klass.model_fields.items():
+        convert = _converter(field.annotation, mode)
+        if convert is None:
+            plain.append((name, field.alias or name))
+        else:
+            converted.append((name, field.alias or name, convert))
+    return plain, converted
+
+
+def _compile_trusted(klass):
+    plain, converted = _field_map(klass, "trusted")
+    if klass.__pydantic_post_init__ or klass.__pydantic_root_model__:
+        construct = klass.model_construct
+
+        def build_constructed(obj):
+            values = {name: obj[key] for name, key in plain if key in obj}
+            for name, key, convert in converted:
+                if key in obj:
+                    values[name] = convert(obj[key])
+            return construct(**values)
+
+        return build_constructed
+
+    # What model_construct does, minus its per-call alias resolution: fill
+    # __dict__ directly and default the fields missing from the response.
+    defaults = {
+        name: field.get_default(call_default_factory=True)
+        for name, field in klass.model_fields.items() if not field.is_required()
+    }
+    new = klass.__new__
+    setattr_ = object.__setattr__
+
+    def build_trusted(obj):
+        values = {name: obj[key] for name, key in plain if key in obj}
+        for name, key, convert in converted:
+            if key in obj:
+                values[name] = convert(obj[key])
+        fields_set = set(values)
+        for name, default in defaults.items():
+            if name not in fields_set:
+                values[name] = default
+        instance = new(klass)
+        setattr_(instance, "__dict__", values)
+        setattr_(instance, "__pydantic_fields_set__", fields_set)
+        setattr_(instance, "__pydantic_extra__", None)
+        setattr_(instance, "__pydantic_private__", None)
+        return instance
+
+    return build_trusted
+
+
+class FastRecord:
+    """Base class of the __slots__ records built in "records" mode.
+
+    Attributes have the same names as on the model. Fields missing from the
+    response are None.
+    """
+
+    __slots__ = ()
+    model_class: type = None
+    _fields: Tuple[Tuple[str, str], ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation using the JSON keys."""
+        result = {}
+        for name, key in self._fields:
+            value = getattr(self, name)
+            if value is not None:
+                result[key] = _unrecord(value)
+        return result
+
+    def to_model(self):
+        """Convert to a validated model instance."""
+        return self.model_class.from_dict(self.to_dict())
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name, _ in self._fields)
+
+    def __repr__(self):
+        fields = ", ".join("%s=%r" % (name, getattr(self, name)) for name, _ in self._fields)
+        return "%s(%s)" % (type(self).__name__, fields)
+
+
+def _unrecord(value):
+    if isinstance(value, FastRecord):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_unrecord(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _unrecord(v) for k, v in value.items()}
+    return value
+
+
+def record_class(klass) -> type:
+    """Return the __slots__ record class for a model class."""
+    record = _record_classes.get(klass)
+    if record is None:
+        names = tuple(klass.model_fields)
+        record = type(klass.__name__ + "Record", (FastRecord,), {
+            "__slots__": names,
+            "__module__": __name__,
+            "model_class": klass,
+            "_fields": tuple((name, field.alias or name) for name, field in klass.model_fields.items()),
+        })
+        _record_classes[klass] = record
+    return record
+
+
+def _compile_records(klass):
+    plain, converted = _field_map(klass, "records")
+    record = record_class(klass)
+    new = record.__new__
+    get = dict.get
+
+    def build_record(obj):
+        instance = new(record)
+        for name, key in plain:
+            setattr(instance, name, get(obj, key))
+        for name, key, convert in converted:
+            setattr(instance, name, convert(get(obj, key)))
+        return instance
+
+    return build_record
+
+
+class LazyModel:
+    """A raw response dict that becomes a validated model on first attribute access.
+
+    Item access (lazy["imageType"]) reads the raw dict without converting.
+    """
+
+    __slots__ = ("model_class", "raw", "_model")
+
+    def __init__(self, model_class, raw) -> None:
+        self.model_class = model_class
+        self.raw = raw
+        self._model = None
+
+    @property
+    def model(self):
+        """The validated model, built on first use."""
+        if self._model is None:
+            self._model = self.model_class.from_dict(self.raw)
+        return self._model
+
+    def __getattr__(self, name):
+        # Only called for names that are not slots, i.e. model attributes
+        return getattr(self.model, name)
+
+    def __getitem__(self, key):
+        return self.raw[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.raw
+
+    def __repr__(self):
+        state = "converted" if self._model is not None else "pending"
+        return "<LazyModel %s (%s)>" % (self.model_class.__name__, state)
+
+
+def _compile_lazy(klass):
+    def build_lazy(obj):
+        return LazyModel(klass, obj)
+
+    return build_lazy
+
+
+_COMPILERS = {
+    "trusted": _compile_trusted,
+    "records": _compile_records,
+    "lazy": _compile_lazy,
+}
+
+
+def build(klass, data, mode):
+    """Build a response model from decoded JSON using the fast path.
+
+    :param klass: model class, e.g. GetRecipeInformation200Response.
+    :param data: decoded JSON (normally a dict).
+    :param mode: "trusted", "records" or "lazy".
+    :return: model instance, FastRecord or LazyModel.
+    """
+    if not isinstance(data, dict):
+        # Not an object: leave it to the generated (validating) path
+        return klass.from_dict(data)
+    return _builder(klass, mode)(data)
+
+
+def _builder(klass, mode) -> Callable[[Any], Any]:
+    builder = _builders.get((klass, mode))
+    if builder is None:
+        if mode not in _COMPILERS:
+            raise ValueError("Unknown fast_deserialize mode %r, expected one of %s" % (mode, MODES))
+        builder = _builders[(klass, mode)] = _COMPILERS[mode](klass)
+    return builder
@@ -0,0 +1,135 @@
+# coding: utf-8
+
+"""
+    Tests for the asyncio ApiClient, against a local stub server.
+"""  # noqa: E501
+
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from spoonacular.api.wine_api import WineApi
+from spoonacular.api_response import ApiResponse
+from spoonacular.async_api_client import AsyncApi, AsyncApiClient
+from spoonacular.cache import ResponseCache
+from spoonacular.configuration import Configuration
+from spoonacular.exceptions import NotFoundException
+from spoonacular.models.get_wine_description200_response import GetWineDescription200Response
+
+try:
+    import aiohttp  # noqa: F401
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers wine descriptions slowly, tracking how many requests overlap."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if 'unknown' in self.path:
+                self._send(404, {'message': 'not found'})
+            else:
+                self._send(200, {'wineDescription': 'A wine for ' + self.path})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp is not installed")
+class TestAsyncApiClient(unittest.TestCase):
+    """AsyncApiClient unit tests"""
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.delay = 0.0
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.configuration = Configuration(host='http://127.0.0.1:%d' % self.server.server_address[1])
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_with_client(self, body, **kwargs):
+        async def main():
+            async with AsyncApiClient(self.configuration, **kwargs) as client:
+                return await body(AsyncApi(WineApi, client))
+        return asyncio.run(main())
+
+    def test_methods_return_the_same_types_as_the_sync_api(self) -> None:
+        async def body(wine):
+            return (
+                await wine.get_wine_description('merlot'),
+                await wine.get_wine_description_with_http_info('merlot'),
+                await wine.get_wine_description_without_preload_content('merlot'),
+            )
+
+        data, with_info, raw = self.run_with_client(body)
+        self.assertIsInstance(data, GetWineDescription200Response)
+        self.assertEqual(data.wine_description, 'A wine for /food/wine/description?wine=merlot')
+        self.assertIsInstance(with_info, ApiResponse)
+        self.assertEqual(with_info.status_code, 200)
+        self.assertEqual(json.loads(raw.data)['wineDescription'], data.wine_description)
+
+    def test_concurrency_is_bounded(self) -> None:
+        self.server.delay = 0.05
+        wines = ['wine%d' % i for i in range(20)]
+
+        async def body(wine):
+            return await asyncio.gather(*(wine.get_wine_description(w) for w in wines))
+
+        results = self.run_with_client(body, max_concurrency=4)
+        self.assertEqual(len(results), 20)
+        self.assertEqual(len(self.server.requests), 20)
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_errors_raise_api_exceptions(self) -> None:
+        async def body(wine):
+            return await wine.get_wine_description('unknown')
+
+        with self.assertRaises(NotFoundException):
+            self.run_with_client(body)
+
+    def test_response_cache_is_shared_with_the_sync_client(self) -> None:
+        cache = ResponseCache()
+
+        async def body(wine):
+            return [await wine.get_wine_description('malbec') for _ in range(3)]
+
+        results = self.run_with_client(body, response_cache=cache)
+        self.assertEqual(len({result.wine_description for result in results}), 1)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(cache.hits, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
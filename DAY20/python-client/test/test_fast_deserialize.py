@@ -0,0 +1,119 @@
+# coding: utf-8
+
+"""
+    Tests for the opt-in fast deserialization modes.
+"""  # noqa: E501
+
+
+import json
+import unittest
+
+from spoonacular.api_client import ApiClient
+from spoonacular.exceptions import ApiValueError
+from spoonacular.fast_deserialize import FastRecord, LazyModel, build
+from spoonacular.models.get_recipe_information200_response_extended_ingredients_inner import GetRecipeInformation200ResponseExtendedIngredientsInner
+from spoonacular.models.search_recipes_by_ingredients200_response_inner import SearchRecipesByIngredients200ResponseInner
+
+INGREDIENT = {
+    'aisle': 'Baking',
+    'amount': 1.0,
+    'id': 18371,
+    'image': 'baking-powder.png',
+    'meta': [],
+    'name': 'baking powder',
+    'original': '1 tsp baking powder',
+    'originalName': 'baking powder',
+    'unit': 'tsp',
+    'unitLong': 'teaspoon',
+    'unitShort': 'tsp'
+}
+
+RECIPES = [
+    {
+        'id': 73420,
+        'image': 'https://img.spoonacular.com/recipes/73420-312x231.jpg',
+        'imageType': 'jpg',
+        'likes': 0,
+        'missedIngredientCount': 1,
+        'missedIngredients': [INGREDIENT],
+        'title': 'Apple Or Peach Strudel',
+        'unusedIngredients': [],
+        'usedIngredientCount': 1,
+        'usedIngredients': [dict(INGREDIENT, id=9003, name='apples', meta=None)]
+    },
+    {
+        'id': 632660,
+        'image': 'https://img.spoonacular.com/recipes/632660-312x231.jpg',
+        'imageType': 'jpg',
+        'likes': 3,
+        'missedIngredientCount': 0,
+        'missedIngredients': [],
+        'title': 'Apricot Glazed Apple Tart',
+        'unusedIngredients': [],
+        'usedIngredientCount': 0,
+        'usedIngredients': []
+    }
+]
+
+RESPONSE_TYPE = 'List[SearchRecipesByIngredients200ResponseInner]'
+
+
+def deserialize(mode):
+    return ApiClient(fast_deserialize=mode).deserialize(json.dumps(RECIPES), RESPONSE_TYPE)
+
+
+class TestFastDeserialize(unittest.TestCase):
+    """Fast deserialization unit tests"""
+
+    def setUp(self) -> None:
+        self.expected = deserialize(None)
+
+    def test_trusted_builds_equal_models(self) -> None:
+        results = deserialize('trusted')
+        for result, expected in zip(results, self.expected):
+            self.assertIsInstance(result, SearchRecipesByIngredients200ResponseInner)
+            self.assertEqual(result.to_dict(), expected.to_dict())
+        self.assertEqual(results[0].missed_ingredients[0].original_name, 'baking powder')
+        self.assertIsNone(results[0].used_ingredients[0].meta)
+
+    def test_records_mirror_the_models(self) -> None:
+        results = deserialize('records')
+        self.assertIsInstance(results[0], FastRecord)
+        self.assertFalse(hasattr(results[0], '__dict__'))
+        self.assertEqual(results[0].missed_ingredients[0].unit_short, 'tsp')
+        self.assertEqual([r.to_dict() for r in results], [e.to_dict() for e in self.expected])
+        self.assertEqual([r.to_model() for r in results], self.expected)
+
+    def test_records_default_missing_fields_to_none(self) -> None:
+        ingredient = dict(INGREDIENT)
+        del ingredient['meta']
+        record = build(GetRecipeInformation200ResponseExtendedIngredientsInner, ingredient, 'records')
+        self.assertIsNone(record.meta)
+        self.assertIsNone(record.measures)
+        self.assertNotIn('meta', record.to_dict())
+
+    def test_lazy_converts_on_attribute_access(self) -> None:
+        results = deserialize('lazy')
+        self.assertIsInstance(results[0], LazyModel)
+        self.assertEqual(results[0]['title'], 'Apple Or Peach Strudel')
+        self.assertIsNone(results[0]._model)
+        self.assertEqual(results[0].title, 'Apple Or Peach Strudel')
+        self.assertIsInstance(results[0].model, SearchRecipesByIngredients200ResponseInner)
+        self.assertEqual([r.model for r in results], self.expected)
+        self.assertEqual(results[1].to_dict(), RECIPES[1])
+
+    def test_lazy_validates_on_access(self) -> None:
+        recipe = dict(RECIPES[1], likes='many')
+        result = ApiClient(fast_deserialize='lazy').deserialize(json.dumps([recipe]), RESPONSE_TYPE)[0]
+        with self.assertRaises(ValueError):
+            result.likes
+
+    def test_unknown_mode(self) -> None:
+        with self.assertRaises(ApiValueError):
+            ApiClient(fast_deserialize='unchecked')
+        with self.assertRaises(ValueError):
+            build(SearchRecipesByIngredients200ResponseInner, RECIPES[0], 'unchecked')
+
+
+if __name__ == '__main__':
+    unittest.main()
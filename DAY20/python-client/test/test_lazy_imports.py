@@ -0,0 +1,68 @@
+# coding: utf-8
+
+"""
+    Tests for lazy loading of the spoonacular APIs and models.
+"""  # noqa: E501
+
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(statement):
+    """Run statement in a fresh interpreter and return the spoonacular modules it loaded."""
+    probe = (
+        "import sys, json\n"
+        + statement + "\n"
+        + "print(json.dumps(sorted(m for m in sys.modules if m.startswith('spoonacular'))))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyImports(unittest.TestCase):
+    """Lazy import unit tests"""
+
+    def test_import_loads_no_apis_or_models(self) -> None:
+        modules = loaded_after("import spoonacular")
+        self.assertFalse([m for m in modules if m.startswith(('spoonacular.api.', 'spoonacular.models.'))])
+        self.assertNotIn('spoonacular.api_client', modules)
+
+    def test_api_access_loads_only_that_api(self) -> None:
+        modules = loaded_after("import spoonacular; spoonacular.WineApi")
+        self.assertIn('spoonacular.api.wine_api', modules)
+        self.assertNotIn('spoonacular.api.recipes_api', modules)
+
+    def test_deserialize_imports_models_on_demand(self) -> None:
+        modules = loaded_after(
+            "from spoonacular.api_client import ApiClient\n"
+            "result = ApiClient().deserialize('{\"wineDescription\": \"dry\"}', 'GetWineDescription200Response')\n"
+            "assert result.wine_description == 'dry'"
+        )
+        self.assertEqual(
+            [m for m in modules if m.startswith('spoonacular.models.')],
+            ['spoonacular.models.get_wine_description200_response']
+        )
+
+    def test_public_names(self) -> None:
+        import spoonacular
+        import spoonacular.models
+        from spoonacular.api.recipes_api import RecipesApi
+
+        self.assertIs(spoonacular.RecipesApi, RecipesApi)
+        self.assertIn('RecipesApi', dir(spoonacular))
+        self.assertIn('ApiClient', spoonacular.__all__)
+        self.assertIn('GetWineDescription200Response', spoonacular.models.__all__)
+        with self.assertRaises(AttributeError):
+            spoonacular.NoSuchApi
+
+
+if __name__ == '__main__':
+    unittest.main()
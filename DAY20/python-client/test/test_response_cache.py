@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+    Tests for the ApiClient response cache, against a local stub server.
+"""  # noqa: E501
+
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from spoonacular.api_client import ApiClient
+from spoonacular.cache import ResponseCache
+from spoonacular.configuration import Configuration
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every path with a JSON body and an ETag, honouring If-None-Match."""
+
+    def do_GET(self):
+        self.server.requests.append((self.command, self.path, self.headers.get('If-None-Match')))
+        if self.path.startswith('/missing'):
+            self._send(404, b'{"message": "not found"}')
+            return
+        etag = '"%s"' % self.server.version
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        body = json.dumps({'path': self.path, 'version': self.server.version}).encode('utf-8')
+        self._send(200, body, etag)
+
+    do_POST = do_GET
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+    """ResponseCache unit tests"""
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.requests = []
+        self.server.version = 1
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.configuration = Configuration(host='http://127.0.0.1:%d' % self.server.server_address[1])
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def client(self, cache):
+        return ApiClient(self.configuration, response_cache=cache)
+
+    def get(self, client, resource_path, query_params=None, method='GET'):
+        params = client.param_serialize(method, resource_path, query_params=query_params)
+        response = client.call_api(*params)
+        return response.status, json.loads(response.read())
+
+    def test_identical_requests_hit_the_cache(self) -> None:
+        cache = ResponseCache(default_ttl=60)
+        client = self.client(cache)
+        first = self.get(client, '/recipes/1/information', [('includeNutrition', False), ('a', 1)])
+        second = self.get(client, '/recipes/1/information', [('a', 1), ('includeNutrition', False)])
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_stale_entries_are_revalidated_with_etag(self) -> None:
+        cache = ResponseCache(default_ttl=60, ttls={'/recipes/{id}/information': 0})
+        client = self.client(cache)
+        first = self.get(client, '/recipes/7/information')
+        second = self.get(client, '/recipes/7/information')
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.requests[1][2], '"1"')
+        self.assertEqual(cache.revalidated, 1)
+
+        # A changed resource is fetched again
+        self.server.version = 2
+        self.assertEqual(self.get(client, '/recipes/7/information')[1]['version'], 2)
+
+    def test_disk_tier_survives_a_new_client(self) -> None:
+        self.get(self.client(ResponseCache(directory=self.directory)), '/food/ingredients/9/information')
+        cache = ResponseCache(directory=self.directory)
+        status, data = self.get(self.client(cache), '/food/ingredients/9/information')
+        self.assertEqual(status, 200)
+        self.assertEqual(data['path'], '/food/ingredients/9/information')
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_memory_tier_evicts_least_recently_used(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        client = self.client(cache)
+        for path in ('/a', '/b', '/a', '/c', '/a', '/b'):
+            self.get(client, path)
+        # /b was evicted by /c, every other repeat was a hit
+        self.assertEqual([request[1] for request in self.server.requests], ['/a', '/b', '/c', '/b'])
+
+    def test_errors_and_other_methods_are_not_cached(self) -> None:
+        cache = ResponseCache()
+        client = self.client(cache)
+        for _ in range(2):
+            self.assertEqual(self.get(client, '/missing')[0], 404)
+            self.assertEqual(self.get(client, '/recipes/analyze', method='POST')[0], 200)
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(cache.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
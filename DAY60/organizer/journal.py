@@ -0,0 +1,170 @@
+"""
+Move journal for resuming or undoing an organize run.
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+from .sorters import move_file
+
+class MoveJournal:
+    """
+    Append-only JSON Lines log of planned and completed moves.
+    
+    Each organize run is one batch: the full plan (and any category
+    directories about to be created) is written and synced before the first
+    file is moved, completed moves are appended as they finish, and a commit
+    record closes the batch. An interrupted batch can then be resumed, and
+    any batch can be undone, by comparing the log with what is on disk.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._last_batch = None
+    
+    def _append(self, records: List[dict], sync: bool = False) -> None:
+        with open(self.path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+    
+    def read(self) -> Dict[int, dict]:
+        """
+        Load the journal.
+    
+        Returns:
+            Dictionary mapping batch ids to their moves, completed move ids,
+            created directories and commit/undo state, in journal order
+        """
+        batches = {}
+        if not os.path.exists(self.path):
+            return batches
+    
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted write
+                    continue
+                op = record["op"]
+                if op == "begin":
+                    batches[record["batch"]] = {"directory": record["directory"], "moves": {}, "done": set(),
+                                                "mkdirs": [], "committed": False, "undone": False}
+                    continue
+                batch = batches.get(record["batch"])
+                if batch is None:
+                    continue
+                if op == "mkdir":
+                    batch["mkdirs"].append(record["path"])
+                elif op == "move":
+                    batch["moves"][record["id"]] = (record["src"], record["dst"])
+                elif op == "done":
+                    batch["done"].update(record["ids"])
+                elif op == "commit":
+                    batch["committed"] = True
+                elif op == "undo":
+                    batch["undone"] = True
+        return batches
+    
+    def begin(self, directory: str, moves: List[Tuple[str, str]], mkdirs: List[str]) -> int:
+        """
+        Record a new batch before any file is touched.
+    
+        Args:
+            directory: The directory being organized
+            moves: (source, destination) absolute paths, in execution order
+            mkdirs: Category directories that will be created
+    
+        Returns:
+            The batch id
+        """
+        if self._last_batch is None:
+            self._last_batch = max(self.read(), default=0)
+        self._last_batch += 1
+        batch_id = self._last_batch
+        records = [{"op": "begin", "batch": batch_id, "directory": os.path.abspath(directory), "time": time.time()}]
+        records += [{"op": "mkdir", "batch": batch_id, "path": path} for path in mkdirs]
+        records += [{"op": "move", "batch": batch_id, "id": i, "src": src, "dst": dst}
+                    for i, (src, dst) in enumerate(moves)]
+        self._append(records, sync=True)
+        return batch_id
+    
+    def mark_done(self, batch_id: int, ids: List[int]) -> None:
+        """Record that the given moves of a batch have completed."""
+        if ids:
+            self._append([{"op": "done", "batch": batch_id, "ids": ids}])
+    
+    def commit(self, batch_id: int) -> None:
+        """Record that a batch ran to completion."""
+        self._append([{"op": "commit", "batch": batch_id}], sync=True)
+    
+    def resume(self) -> int:
+        """
+        Finish every uncommitted batch.
+    
+        Moves whose source is gone or whose destination already exists are
+        treated as done.
+    
+        Returns:
+            The number of files moved
+        """
+        moved = 0
+        for batch_id, batch in self.read().items():
+            if batch["committed"] or batch["undone"]:
+                continue
+            # As in execute_plan, files named like a new category directory
+            # move first, and directories are created just before use
+            mkdirs = set(batch["mkdirs"])
+            moves = sorted(batch["moves"].items(), key=lambda item: (item[1][0] not in mkdirs, item[0]))
+            done = []
+            for move_id, (src, dst) in moves:
+                if move_id in batch["done"] or not os.path.lexists(src) or os.path.lexists(dst):
+                    continue
+                try:
+                    os.makedirs(os.path.dirname(dst), exist_ok=True)
+                    move_file(src, dst)
+                except OSError as e:
+                    print(f"Error moving {src}: {e}")
+                    continue
+                done.append(move_id)
+                moved += 1
+            self.mark_done(batch_id, done)
+            self.commit(batch_id)
+        return moved
+    
+    def undo(self, count: int = 1) -> int:
+        """
+        Move files of the most recent batches back to where they came from.
+    
+        Args:
+            count: Number of batches to undo, newest first
+    
+        Returns:
+            The number of files moved back
+        """
+        restored = 0
+        batches = [(batch_id, batch) for batch_id, batch in self.read().items() if not batch["undone"]]
+        for batch_id, batch in reversed(batches[-count:] if count > 0 else []):
+            for _, (src, dst) in sorted(batch["moves"].items(), reverse=True):
+                # Only restore files that are where the journal put them
+                if not os.path.lexists(dst) or os.path.lexists(src):
+                    continue
+                try:
+                    os.makedirs(os.path.dirname(src), exist_ok=True)
+                    move_file(dst, src)
+                except OSError as e:
+                    print(f"Error restoring {src}: {e}")
+                    continue
+                restored += 1
+            for path in reversed(batch["mkdirs"]):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    # Not empty (or already gone): leave it
+                    pass
+            self._append([{"op": "undo", "batch": batch_id}], sync=True)
+        return restored
@@ -2,166 +2,364 @@
 File sorting implementations for the organizer.
 """
 
+import errno
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 from .utils import get_file_size_category
 
-def organize_by_extension(directory: str, reverse: bool = False) -> Dict[str, List[str]]:
+if TYPE_CHECKING:
+    from .journal import MoveJournal
+
+# Number of renames handed to a worker thread at a time
+MOVE_BATCH_SIZE = 256
+
+class PlannedMove(NamedTuple):
     """
-    Organize files by their extension.
+    A single file move: directory/source -> directory/category/name.
+    
+    source is the path relative to the organized directory and defaults to
+    name for files directly inside it.
+    """
+    name: str
+    category: str
+    source: Optional[str] = None
+    
+    def source_path(self, directory: str) -> str:
+        return os.path.join(directory, self.source or self.name)
+    
+    def destination_path(self, directory: str) -> str:
+        return os.path.join(directory, self.category, self.name)
+
+def extension_category(name: str, stat: os.stat_result) -> str:
+    """Category for a file by its extension (or "no_extension" if none)."""
+    _, ext = os.path.splitext(name)
+    return ext[1:].lower() if ext else "no_extension"
+
+def date_category(name: str, stat: os.stat_result) -> str:
+    """Category for a file by its modification month, formatted as YYYY-MM."""
+    return datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m")
+
+def size_category(name: str, stat: os.stat_result) -> str:
+    """Category for a file by its size bracket."""
+    return get_file_size_category(stat.st_size)
+
+# For each criterion: (category function, sort key over (name, stat))
+CRITERIA: Dict[str, Tuple[Callable[[str, os.stat_result], str], Callable]] = {
+    "ext": (extension_category, lambda item: os.path.splitext(item[0])[1].lower()),
+    "date": (date_category, lambda item: item[1].st_mtime),
+    "size": (size_category, lambda item: item[1].st_size),
+}
+
+def unique_name(name: str, taken: Set[str]) -> str:
+    """
+    Return name, or name with a numeric suffix if it is already taken.
     
     Args:
-        directory: The directory to organize
-        reverse: Whether to sort in reverse alphabetical order
+        name: The file name to place
+        taken: Names already present (or planned) in the target directory
         
     Returns:
-        Dictionary mapping each category to a list of moved files
+        A file name not in taken
     """
-    moved_files = {}
+    if name not in taken:
+        return name
+    stem, ext = os.path.splitext(name)
+    counter = 1
+    while f"{stem}_{counter}{ext}" in taken:
+        counter += 1
+    return f"{stem}_{counter}{ext}"
+
+def is_in_place(rel_path: str, category: str) -> bool:
+    """Whether a file (relative path) already sits in its top-level category directory."""
+    parts = Path(rel_path).parts
+    return len(parts) == 2 and parts[0] == category
+
+def plan_moves(directory: str, by: str = "ext", reverse: bool = False,
+               recursive: bool = False) -> List[PlannedMove]:
+    """
+    Compute the moves needed to organize a directory, in one scandir pass.
+    
+    In recursive mode files from all subdirectories are gathered into the
+    top-level category directories. Files already in their category
+    directory stay put, and name clashes get a numeric suffix.
+    
+    Args:
+        directory: The directory to organize
+        by: Criteria to organize by ("ext", "date" or "size")
+        reverse: Whether to order the plan in reverse
+        recursive: Whether to include files in subdirectories
     
-    # Get all files in the directory (non-recursive)
-    files = [f for f in os.listdir(directory) 
-             if os.path.isfile(os.path.join(directory, f))]
+    Returns:
+        The planned moves, in the order they are reported
+    """
+    category_of, sort_key = CRITERIA[by]
     
-    # Sort files by extension if requested
-    if reverse:
-        files.sort(key=lambda x: os.path.splitext(x)[1].lower(), reverse=True)
-    else:
-        files.sort(key=lambda x: os.path.splitext(x)[1].lower())
+    # (name, stat, path relative to directory) for every file to place
+    entries = []
+    taken = defaultdict(set)
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(directory, rel_dir)) as it:
+                for entry in it:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    try:
+                        if entry.is_file():
+                            entries.append((entry.name, entry.stat(), rel_path))
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(rel_path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            if not rel_dir:
+                raise
+            print(f"Error reading {rel_dir}: {e}")
     
-    for file in files:
-        file_path = os.path.join(directory, file)
-        
-        # Skip directories
-        if os.path.isdir(file_path):
+    entries.sort(key=sort_key, reverse=reverse)
+    
+    if not recursive:
+        return [PlannedMove(name, category_of(name, stat)) for name, stat, _ in entries]
+    
+    categorized = [(name, category_of(name, stat), rel_path) for name, stat, rel_path in entries]
+    to_move = []
+    for name, category, rel_path in categorized:
+        if is_in_place(rel_path, category):
+            taken[category].add(name)
+        else:
+            to_move.append((name, category, rel_path))
+    
+    plan = []
+    for name, category, rel_path in to_move:
+        target = unique_name(name, taken[category])
+        taken[category].add(target)
+        plan.append(PlannedMove(target, category, rel_path))
+    return plan
+
+def plan_paths(directory: str, paths: Iterable[str], by: str = "ext") -> List[PlannedMove]:
+    """
+    Plan moves for specific files only, e.g. ones reported by a watcher.
+    
+    Files that no longer exist or already sit in their category directory
+    are skipped, and existing destinations are never overwritten.
+    
+    Args:
+        directory: The directory being organized
+        paths: Paths of the files to place
+        by: Criteria to organize by ("ext", "date" or "size")
+    
+    Returns:
+        The planned moves
+    """
+    category_of, sort_key = CRITERIA[by]
+    
+    entries = []
+    for path in dict.fromkeys(paths):
+        rel_path = os.path.relpath(path, directory)
+        if rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
             continue
-        
-        # Get the file extension (or "no_extension" if none)
-        _, ext = os.path.splitext(file)
-        category = ext[1:].lower() if ext else "no_extension"
-        
-        # Create category directory if it doesn't exist
-        category_dir = os.path.join(directory, category)
-        if not os.path.exists(category_dir):
-            os.makedirs(category_dir)
-        
-        # Move the file
-        destination = os.path.join(category_dir, file)
         try:
-            shutil.move(file_path, destination)
-            
-            # Track moved files
-            if category not in moved_files:
-                moved_files[category] = []
-            moved_files[category].append(file)
-            
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if not S_ISREG(stat.st_mode):
+            continue
+        entries.append((os.path.basename(path), stat, rel_path))
+    entries.sort(key=sort_key)
+    
+    plan = []
+    planned = defaultdict(set)
+    for name, stat, rel_path in entries:
+        category = category_of(name, stat)
+        if is_in_place(rel_path, category):
+            continue
+        taken = planned[category]
+        stem, ext = os.path.splitext(name)
+        target = name
+        counter = 0
+        while target in taken or os.path.lexists(os.path.join(directory, category, target)):
+            counter += 1
+            target = f"{stem}_{counter}{ext}"
+        taken.add(target)
+        plan.append(PlannedMove(target, category, rel_path))
+    return plan
+
+def move_file(source: str, destination: str) -> None:
+    """
+    Move a file with a single rename, copying across file systems.
+    
+    Args:
+        source: The file to move
+        destination: The path to move it to
+    """
+    try:
+        os.rename(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Cross-device: copy (with metadata), then remove the original
+        shutil.copy2(source, destination)
+        os.unlink(source)
+
+def _move_batch(directory: str, batch: List[PlannedMove]) -> List[Optional[Exception]]:
+    """Move a batch of planned files, returning the error (or None) for each."""
+    errors = []
+    for move in batch:
+        try:
+            move_file(move.source_path(directory), move.destination_path(directory))
+            errors.append(None)
         except Exception as e:
-            print(f"Error moving {file}: {e}")
+            errors.append(e)
+    return errors
+
+def _run_stage(directory: str, stage: List[Tuple[int, PlannedMove]], executor: ThreadPoolExecutor,
+               moved_files: Dict[str, List[str]], journal: Optional["MoveJournal"], batch_id: Optional[int]) -> None:
+    """Create the category directories of some planned moves, then run them in batches."""
+    failed_categories = set()
+    for category in dict.fromkeys(move.category for _, move in stage):
+        try:
+            os.makedirs(os.path.join(directory, category), exist_ok=True)
+        except OSError as e:
+            print(f"Error creating {category}: {e}")
+            failed_categories.add(category)
     
-    return moved_files
+    runnable = [(i, move) for i, move in stage if move.category not in failed_categories]
+    batches = [runnable[i:i + MOVE_BATCH_SIZE] for i in range(0, len(runnable), MOVE_BATCH_SIZE)]
+    
+    results = executor.map(lambda batch: _move_batch(directory, [move for _, move in batch]), batches)
+    for batch, errors in zip(batches, results):
+        done = []
+        for (move_id, move), error in zip(batch, errors):
+            if error is not None:
+                print(f"Error moving {move.source or move.name}: {error}")
+                continue
+            # Track moved files
+            moved_files.setdefault(move.category, []).append(move.name)
+            done.append(move_id)
+        if journal is not None:
+            journal.mark_done(batch_id, done)
 
-def organize_by_date(directory: str, reverse: bool = False) -> Dict[str, List[str]]:
+def execute_plan(directory: str, plan: List[PlannedMove], dry_run: bool = False,
+                 workers: Optional[int] = None, journal: Optional["MoveJournal"] = None) -> Dict[str, List[str]]:
     """
-    Organize files by their creation/modification date (by month).
+    Carry out a move plan.
+    
+    Each category directory is created once, just before its moves, and the
+    renames run in batches on a thread pool. Files named like a category
+    directory that does not exist yet are moved first.
     
     Args:
-        directory: The directory to organize
-        reverse: Whether to sort from newest to oldest
-        
+        directory: The directory being organized
+        plan: Moves computed by plan_moves
+        dry_run: Only print the plan, without touching any files
+        workers: Number of worker threads (default: ThreadPoolExecutor's)
+        journal: Optional MoveJournal recording the run for resume/undo
+    
     Returns:
-        Dictionary mapping each category to a list of moved files
+        Dictionary mapping each category to a list of moved (or, in a dry
+        run, to-be-moved) files
     """
     moved_files = {}
     
-    # Get all files in the directory (non-recursive)
-    files = [f for f in os.listdir(directory) 
-             if os.path.isfile(os.path.join(directory, f))]
+    if dry_run:
+        for move in plan:
+            print(f"{move.source or move.name} -> {os.path.join(move.category, move.name)}")
+            moved_files.setdefault(move.category, []).append(move.name)
+        return moved_files
     
-    # Create a list of (file, modification_time) tuples
-    file_times = []
-    for file in files:
-        file_path = os.path.join(directory, file)
-        mod_time = os.path.getmtime(file_path)
-        file_times.append((file, mod_time))
+    if not plan:
+        return moved_files
     
-    # Sort files by modification time
-    file_times.sort(key=lambda x: x[1], reverse=reverse)
+    categories = list(dict.fromkeys(move.category for move in plan))
+    new_dirs = [os.path.join(directory, category) for category in categories
+                if not os.path.isdir(os.path.join(directory, category))]
     
-    for file, mod_time in file_times:
-        file_path = os.path.join(directory, file)
-        
-        # Format the date as YYYY-MM
-        date_obj = datetime.fromtimestamp(mod_time)
-        category = date_obj.strftime("%Y-%m")
-        
-        # Create category directory if it doesn't exist
-        category_dir = os.path.join(directory, category)
-        if not os.path.exists(category_dir):
-            os.makedirs(category_dir)
-        
-        # Move the file
-        destination = os.path.join(category_dir, file)
-        try:
-            shutil.move(file_path, destination)
-            
-            # Track moved files
-            if category not in moved_files:
-                moved_files[category] = []
-            moved_files[category].append(file)
-            
-        except Exception as e:
-            print(f"Error moving {file}: {e}")
+    batch_id = None
+    if journal is not None:
+        batch_id = journal.begin(directory, [(move.source_path(directory), move.destination_path(directory))
+                                             for move in plan], new_dirs)
+    
+    # A file named like a category (e.g. "txt") has to be moved out of the
+    # way before that category's directory can be created
+    blocked = {category for category in categories if os.path.lexists(os.path.join(directory, category))
+               and not os.path.isdir(os.path.join(directory, category))}
+    first = [(i, move) for i, move in enumerate(plan) if (move.source or move.name) in blocked]
+    first_ids = {i for i, _ in first}
+    rest = [(i, move) for i, move in enumerate(plan) if i not in first_ids]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for stage in (first, rest):
+            _run_stage(directory, stage, executor, moved_files, journal, batch_id)
+    
+    if journal is not None:
+        journal.commit(batch_id)
     
     return moved_files
 
-def organize_by_size(directory: str, reverse: bool = False) -> Dict[str, List[str]]:
+def organize(directory: str, by: str = "ext", reverse: bool = False, dry_run: bool = False,
+             workers: Optional[int] = None, recursive: bool = False,
+             journal: Optional["MoveJournal"] = None) -> Dict[str, List[str]]:
     """
-    Organize files by their size.
+    Organize the files in a directory into category subdirectories.
     
     Args:
         directory: The directory to organize
-        reverse: Whether to sort from largest to smallest
-        
+        by: Criteria to organize by ("ext", "date" or "size")
+        reverse: Whether to sort in reverse order
+        dry_run: Only print the plan, without touching any files
+        workers: Number of worker threads for the renames
+        recursive: Whether to also gather files from subdirectories
+        journal: Optional MoveJournal recording the run for resume/undo
+    
     Returns:
         Dictionary mapping each category to a list of moved files
     """
-    moved_files = {}
+    return execute_plan(directory, plan_moves(directory, by, reverse, recursive), dry_run, workers, journal)
 
-    files = [f for f in os.listdir(directory) 
-             if os.path.isfile(os.path.join(directory, f))]
-    
-    file_sizes = []
-    for file in files:
-        file_path = os.path.join(directory, file)
-        size = os.path.getsize(file_path)
-        file_sizes.append((file, size))
+def organize_by_extension(directory: str, reverse: bool = False, dry_run: bool = False) -> Dict[str, List[str]]:
+    """
+    Organize files by their extension.
     
-    file_sizes.sort(key=lambda x: x[1], reverse=reverse)
+    Args:
+        directory: The directory to organize
+        reverse: Whether to sort in reverse alphabetical order
+        dry_run: Only print the plan, without touching any files
     
-    for file, size in file_sizes:
-        file_path = os.path.join(directory, file)
-        
-
-        category = get_file_size_category(size)
-        
-
-        category_dir = os.path.join(directory, category)
-        if not os.path.exists(category_dir):
-            os.makedirs(category_dir)
-        
+    Returns:
+        Dictionary mapping each category to a list of moved files
+    """
+    return organize(directory, "ext", reverse, dry_run)
 
-        destination = os.path.join(category_dir, file)
-        try:
-            shutil.move(file_path, destination)
+def organize_by_date(directory: str, reverse: bool = False, dry_run: bool = False) -> Dict[str, List[str]]:
+    """
+    Organize files by their creation/modification date (by month).
+    
+    Args:
+        directory: The directory to organize
+        reverse: Whether to sort from newest to oldest
+        dry_run: Only print the plan, without touching any files
+    
+    Returns:
+        Dictionary mapping each category to a list of moved files
+    """
+    return organize(directory, "date", reverse, dry_run)
 
-            if category not in moved_files:
-                moved_files[category] = []
-            moved_files[category].append(file)
-            
-        except Exception as e:
-            print(f"Error moving {file}: {e}")
+def organize_by_size(directory: str, reverse: bool = False, dry_run: bool = False) -> Dict[str, List[str]]:
+    """
+    Organize files by their size.
     
-    return moved_files
\ No newline at end of file
+    Args:
+        directory: The directory to organize
+        reverse: Whether to sort from largest to smallest
+        dry_run: Only print the plan, without touching any files
+    
+    Returns:
+        Dictionary mapping each category to a list of moved files
+    """
+    return organize(directory, "size", reverse, dry_run)
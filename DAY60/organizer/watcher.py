@@ -0,0 +1,282 @@
+"""
+Watch mode: organize new files as they appear.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from .journal import MoveJournal
+from .sorters import execute_plan, plan_paths
+from .utils import print_summary
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+EVENT_HEADER = struct.Struct("iIII")
+
+def _list_files(directory: str, recursive: bool) -> Tuple[List[str], List[str]]:
+    """Return (files, subdirectories) below a directory, following recursive."""
+    files, dirs = [], []
+    pending = [directory]
+    while pending:
+        path = pending.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                dirs.append(entry.path)
+                                pending.append(entry.path)
+                        elif entry.is_file():
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return files, dirs
+
+class InotifyWatcher:
+    """
+    Report files written or moved into a directory, using Linux inotify.
+    
+    In recursive mode new subdirectories are watched as they appear, and the
+    files already inside them are reported, since they may have been created
+    before the watch was added.
+    """
+    
+    def __init__(self, directory: str, recursive: bool = False):
+        self.directory = directory
+        self.recursive = recursive
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        self._paths: Dict[int, str] = {}
+        self._add_watch(directory)
+        if recursive:
+            for path in _list_files(directory, True)[1]:
+                self._add_watch(path)
+    
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._paths[wd] = path
+    
+    def poll(self, timeout: float) -> List[str]:
+        """Wait up to timeout seconds and return the paths of new or rewritten files."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+    
+        paths = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+    
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: fall back to listing everything once
+                paths.extend(_list_files(self.directory, self.recursive)[0])
+                continue
+            if mask & IN_IGNORED:
+                self._paths.pop(wd, None)
+                continue
+            parent = self._paths.get(wd)
+            if parent is None or not name:
+                continue
+            path = os.path.join(parent, os.fsdecode(name))
+    
+            if mask & IN_ISDIR:
+                if self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_watch(path)
+                    files, subdirs = _list_files(path, True)
+                    for subdir in subdirs:
+                        self._add_watch(subdir)
+                    paths.extend(files)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                paths.append(path)
+        return paths
+    
+    def close(self) -> None:
+        os.close(self._fd)
+
+class PollingWatcher:
+    """
+    Report new or changed files by polling directory modification times.
+    
+    Only directories whose mtime changed since the last poll are listed again,
+    so an idle tree costs one stat per directory per interval.
+    """
+    
+    def __init__(self, directory: str, recursive: bool = False, interval: float = 1.0):
+        self.directory = directory
+        self.recursive = recursive
+        self.interval = interval
+        self._dir_mtimes: Dict[str, int] = {}
+        # directory -> {file name: (size, mtime_ns)} as of its last listing
+        self._files: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        for path in [directory] + (_list_files(directory, True)[1] if recursive else []):
+            self._snapshot(path)
+    
+    def _snapshot(self, path: str) -> List[str]:
+        """List one directory, returning files that are new or changed since the last listing."""
+        try:
+            self._dir_mtimes[path] = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            self._dir_mtimes.pop(path, None)
+            self._files.pop(path, None)
+            return []
+    
+        previous = self._files.get(path, {})
+        current = {}
+        changed = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if self.recursive and entry.path not in self._dir_mtimes:
+                        changed.extend(self._snapshot(entry.path))
+                    continue
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            current[entry.name] = signature
+            if previous.get(entry.name) != signature:
+                changed.append(entry.path)
+        self._files[path] = current
+        return changed
+    
+    def poll(self, timeout: float) -> List[str]:
+        """Wait up to timeout seconds and return the paths of new or changed files."""
+        time.sleep(min(timeout, self.interval))
+        changed = []
+        for path, mtime in list(self._dir_mtimes.items()):
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                self._dir_mtimes.pop(path, None)
+                self._files.pop(path, None)
+                continue
+            if current != mtime:
+                changed.extend(self._snapshot(path))
+        return changed
+    
+    def close(self) -> None:
+        pass
+
+def create_watcher(directory: str, recursive: bool = False, polling: bool = False, interval: float = 1.0):
+    """
+    Create an inotify watcher where available, otherwise a polling one.
+    
+    Args:
+        directory: The directory to watch
+        recursive: Whether to watch subdirectories too
+        polling: Force the polling watcher
+        interval: Polling interval in seconds
+    
+    Returns:
+        A watcher with poll(timeout) and close() methods
+    """
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, recursive)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, recursive, interval)
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def watch(directory: str, by: str = "ext", recursive: bool = False, debounce: float = 1.0,
+          journal: Optional[MoveJournal] = None, workers: Optional[int] = None, polling: bool = False,
+          interval: float = 1.0, stop_event: Optional[threading.Event] = None,
+          on_batch: Callable[[Dict[str, List[str]]], None] = print_summary) -> None:
+    """
+    Organize files as they appear, until interrupted.
+    
+    Reported files are collected until no new events arrive for debounce
+    seconds (or 10 * debounce has passed since the first one), and files
+    still changing size are held back. Only the collected files are planned
+    and moved; the directory is never rescanned as a whole.
+    
+    Args:
+        directory: The directory to watch and organize
+        by: Criteria to organize by ("ext", "date" or "size")
+        recursive: Whether to watch subdirectories too
+        debounce: Quiet period in seconds before a batch is organized
+        journal: Optional MoveJournal recording each batch
+        workers: Number of worker threads for the renames
+        polling: Force the polling watcher instead of inotify
+        interval: Polling interval in seconds
+        stop_event: Event that ends the watch when set
+        on_batch: Called with the moved files of each batch
+    """
+    watcher = create_watcher(directory, recursive, polling, interval)
+    pending: Dict[str, Optional[Tuple[int, int]]] = {}
+    first_event = last_event = 0.0
+    
+    try:
+        while stop_event is None or not stop_event.is_set():
+            paths = watcher.poll(min(debounce, interval) if pending else interval)
+            now = time.monotonic()
+            if paths:
+                if not pending:
+                    first_event = now
+                last_event = now
+                for path in paths:
+                    pending[path] = _signature(path)
+    
+            if not pending or (now - last_event < debounce and now - first_event < 10 * debounce):
+                continue
+    
+            # Hold back files that are still being written
+            ready, still_changing = [], {}
+            for path, signature in pending.items():
+                current = _signature(path)
+                if current is None:
+                    continue
+                if current == signature:
+                    ready.append(path)
+                else:
+                    still_changing[path] = current
+            pending = still_changing
+            first_event = last_event = now
+    
+            plan = plan_paths(directory, ready, by)
+            if plan:
+                on_batch(execute_plan(directory, plan, workers=workers, journal=journal))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
@@ -3,8 +3,10 @@
 import argparse
 import os
 import sys
-from organizer.sorters import organize_by_extension, organize_by_date, organize_by_size
+from organizer.journal import MoveJournal
+from organizer.sorters import organize
 from organizer.utils import count_files_in_dir, print_summary
+from organizer.watcher import watch
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -15,6 +17,26 @@ def parse_arguments():
                         default="ext", help="Criteria to organize by (default: ext)")
     parser.add_argument("--reverse", action="store_true",
                         help="Sort in reverse order")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the planned moves without moving anything")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of threads used to move files")
+    parser.add_argument("--recursive", action="store_true",
+                        help="Also organize files in subdirectories")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and organize new files as they appear")
+    parser.add_argument("--debounce", type=float, default=1.0,
+                        help="Seconds without new files before a batch is organized (default: 1.0)")
+    parser.add_argument("--poll", action="store_true",
+                        help="Watch by polling instead of inotify")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Polling interval in seconds (default: 1.0)")
+    parser.add_argument("--journal", type=str, default=None,
+                        help="Journal file recording moves, for --resume and --undo")
+    parser.add_argument("--resume", action="store_true",
+                        help="Finish an interrupted run recorded in the journal")
+    parser.add_argument("--undo", type=int, nargs="?", const=1, default=None, metavar="N",
+                        help="Undo the last N runs recorded in the journal (default: 1)")
     
     return parser.parse_args()
 
@@ -26,19 +48,37 @@ def main():
         print(f"Error: '{args.dir}' is not a valid directory.")
         sys.exit(1)
     
+    journal = MoveJournal(args.journal) if args.journal else None
+    if (args.resume or args.undo is not None) and journal is None:
+        print("Error: --resume and --undo need a --journal file.")
+        sys.exit(1)
+    
+    if args.resume:
+        print(f"Resumed: moved {journal.resume()} remaining files.")
+        return
+    
+    if args.undo is not None:
+        print(f"Undo: restored {journal.undo(args.undo)} files.")
+        return
+    
     initial_count = count_files_in_dir(args.dir)
     print(f"Found {initial_count} files in '{args.dir}'")
     
-    if args.by == "ext":
-        moved_files = organize_by_extension(args.dir, args.reverse)
-    elif args.by == "date":
-        moved_files = organize_by_date(args.dir, args.reverse)
-    elif args.by == "size":
-        moved_files = organize_by_size(args.dir, args.reverse)
+    moved_files = organize(args.dir, args.by, args.reverse, args.dry_run, args.workers,
+                           args.recursive, journal)
+    
+    if args.dry_run:
+        print(f"\nDry run: {sum(len(files) for files in moved_files.values())} files would be moved.")
+        return
     
     print_summary(moved_files)
     
     print(f"\nOrganization complete! Files organized by {args.by}.")
+    
+    if args.watch:
+        print(f"\nWatching '{args.dir}' for new files (Ctrl+C to stop)...")
+        watch(args.dir, args.by, args.recursive, args.debounce, journal, args.workers,
+              args.poll, args.interval)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
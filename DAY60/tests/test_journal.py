@@ -0,0 +1,83 @@
+"""
+Tests for the journal module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from organizer.journal import MoveJournal
+from organizer.sorters import organize, plan_moves
+
+class TestJournal(unittest.TestCase):
+    """Test cases for resuming and undoing organize runs."""
+    
+    def setUp(self):
+        """Set up a temporary directory with a nested layout."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.temp_dir, "files")
+        os.makedirs(os.path.join(self.root, "sub"))
+        
+        for name in ["a.txt", "b.py", os.path.join("sub", "a.txt")]:
+            with open(os.path.join(self.root, name), "w") as f:
+                f.write(name)
+        
+        self.journal = MoveJournal(os.path.join(self.temp_dir, "journal.jsonl"))
+    
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_recursive_plan_renames_clashes(self):
+        """Test that recursive mode gives clashing names a numeric suffix."""
+        plan = plan_moves(self.root, "ext", recursive=True)
+        
+        self.assertEqual(sorted((move.source, move.category, move.name) for move in plan),
+                         [("a.txt", "txt", "a.txt"), ("b.py", "py", "b.py"),
+                          (os.path.join("sub", "a.txt"), "txt", "a_1.txt")])
+    
+    def test_undo_restores_files(self):
+        """Test that undo moves files back and removes created directories."""
+        organize(self.root, "ext", recursive=True, journal=self.journal)
+        self.assertTrue(os.path.exists(os.path.join(self.root, "txt", "a_1.txt")))
+        
+        restored = self.journal.undo()
+        
+        self.assertEqual(restored, 3)
+        self.assertEqual(sorted(os.listdir(self.root)), ["a.txt", "b.py", "sub"])
+        with open(os.path.join(self.root, "sub", "a.txt")) as f:
+            self.assertEqual(f.read(), os.path.join("sub", "a.txt"))
+    
+    def test_resume_finishes_interrupted_run(self):
+        """Test that resume completes a batch that was never committed."""
+        plan = plan_moves(self.root, "ext", recursive=True)
+        moves = [(move.source_path(self.root), move.destination_path(self.root)) for move in plan]
+        batch_id = self.journal.begin(self.root, moves, [os.path.join(self.root, "txt"),
+                                                         os.path.join(self.root, "py")])
+        
+        # Simulate a crash after the first move
+        os.makedirs(os.path.dirname(moves[0][1]))
+        os.rename(*moves[0])
+        self.journal.mark_done(batch_id, [0])
+        
+        self.assertEqual(self.journal.resume(), 2)
+        for _, destination in moves:
+            self.assertTrue(os.path.exists(destination))
+        self.assertTrue(self.journal.read()[batch_id]["committed"])
+        self.assertEqual(self.journal.resume(), 0)
+    
+    def test_resume_moves_file_named_like_a_category_first(self):
+        """Test that resume moves a file named like a new category directory before creating it."""
+        with open(os.path.join(self.root, "txt"), "w") as f:
+            f.write("no extension")
+        plan = plan_moves(self.root, "ext")
+        moves = [(move.source_path(self.root), move.destination_path(self.root)) for move in plan]
+        self.journal.begin(self.root, moves, [os.path.join(self.root, category)
+                                              for category in ("no_extension", "py", "txt")])
+        
+        self.assertEqual(self.journal.resume(), 3)
+        self.assertTrue(os.path.isfile(os.path.join(self.root, "no_extension", "txt")))
+        self.assertTrue(os.path.isfile(os.path.join(self.root, "txt", "a.txt")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,14 @@
 Tests for the sorters module.
 """
 
+import errno
 import os
 import shutil
 import tempfile
 import unittest
-from organizer.sorters import organize_by_extension, organize_by_date, organize_by_size
+from unittest import mock
+from organizer.sorters import (organize, organize_by_extension, organize_by_date, organize_by_size,
+                               plan_moves, plan_paths, move_file)
 
 class TestSorters(unittest.TestCase):
     """Test cases for file sorting functions."""
@@ -48,6 +51,79 @@ class TestSorters(unittest.TestCase):
         self.assertEqual(result["txt"], ["test.txt"])
         self.assertEqual(result["py"], ["example.py"])
         self.assertEqual(result["csv"], ["data.csv"])
+    
+    def test_organize_by_size(self):
+        """Test organizing files by size."""
+        result = organize_by_size(self.temp_dir)
+        
+        self.assertEqual(set(result.keys()), {"tiny_less_than_1KB"})
+        self.assertEqual(sorted(result["tiny_less_than_1KB"]), ["data.csv", "example.py", "test.txt"])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["tiny_less_than_1KB"])
+    
+    def test_organize_by_date(self):
+        """Test organizing files by modification month, oldest first."""
+        os.utime(os.path.join(self.temp_dir, "test.txt"), (0, 1577880000))  # 2020-01-01
+        os.utime(os.path.join(self.temp_dir, "example.py"), (0, 1609588800))  # 2021-01-02
+        os.utime(os.path.join(self.temp_dir, "data.csv"), (0, 1609675200))  # 2021-01-03
+        
+        result = organize_by_date(self.temp_dir)
+        
+        self.assertEqual(result, {"2020-01": ["test.txt"], "2021-01": ["example.py", "data.csv"]})
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "2021-01", "data.csv")))
+    
+    def test_plan_ignores_directories(self):
+        """Test that existing category directories are not planned as moves."""
+        os.makedirs(os.path.join(self.temp_dir, "txt"))
+        
+        plan = plan_moves(self.temp_dir, "ext", reverse=True)
+        
+        self.assertEqual([(move.name, move.category) for move in plan],
+                         [("test.txt", "txt"), ("example.py", "py"), ("data.csv", "csv")])
+    
+    def test_plan_paths_skips_only_outside_paths(self):
+        """Test that paths outside the directory are skipped, but not names starting with '..'."""
+        dotted = os.path.join(self.temp_dir, "..notes.txt")
+        with open(dotted, "w") as f:
+            f.write("notes")
+        outside = tempfile.NamedTemporaryFile(suffix=".txt", delete=False)
+        outside.close()
+        self.addCleanup(os.unlink, outside.name)
+        
+        plan = plan_paths(self.temp_dir, [dotted, outside.name], "ext")
+        
+        self.assertEqual([(move.name, move.category) for move in plan], [("..notes.txt", "txt")])
+    
+    def test_file_named_like_a_category(self):
+        """Test that a file named like a category directory is moved before that directory is created."""
+        with open(os.path.join(self.temp_dir, "txt"), "w") as f:
+            f.write("no extension")
+        
+        result = organize(self.temp_dir, "ext", reverse=True)
+        
+        self.assertEqual(result["no_extension"], ["txt"])
+        self.assertEqual(result["txt"], ["test.txt"])
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir, "no_extension", "txt")))
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir, "txt", "test.txt")))
+    
+    def test_dry_run_does_not_move(self):
+        """Test that a dry run reports the plan but leaves files in place."""
+        with mock.patch("builtins.print"):
+            result = organize(self.temp_dir, "ext", dry_run=True)
+        
+        self.assertEqual(result, {"csv": ["data.csv"], "py": ["example.py"], "txt": ["test.txt"]})
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["data.csv", "example.py", "test.txt"])
+    
+    def test_move_file_cross_device(self):
+        """Test that a cross-device rename falls back to copy and unlink."""
+        source = os.path.join(self.temp_dir, "test.txt")
+        destination = os.path.join(self.temp_dir, "moved.txt")
+        
+        with mock.patch("organizer.sorters.os.rename", side_effect=OSError(errno.EXDEV, "cross-device")):
+            move_file(source, destination)
+        
+        self.assertFalse(os.path.exists(source))
+        with open(destination) as f:
+            self.assertEqual(f.read(), "test content")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Tests for the watcher module.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from organizer.watcher import InotifyWatcher, PollingWatcher, create_watcher, watch
+
+class TestWatcher(unittest.TestCase):
+    """Test cases for watch mode."""
+    
+    def setUp(self):
+        """Set up a temporary directory with one existing file."""
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.temp_dir, "old.txt"), "w") as f:
+            f.write("old")
+    
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+    
+    def write(self, name, content="new"):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+    
+    def check_watcher(self, watcher):
+        try:
+            self.assertEqual(watcher.poll(0.05), [])
+            new_file = self.write("new.csv")
+            reported = []
+            for _ in range(20):
+                reported += watcher.poll(0.05)
+                if reported:
+                    break
+            self.assertEqual(reported, [new_file])
+        finally:
+            watcher.close()
+    
+    def test_polling_watcher_reports_new_files(self):
+        """Test that the polling watcher reports only files created after it started."""
+        # Make sure the directory mtime visibly changes
+        os.utime(self.temp_dir, ns=(0, 0))
+        self.check_watcher(PollingWatcher(self.temp_dir, interval=0.05))
+    
+    def test_inotify_watcher_reports_new_files(self):
+        """Test that the inotify watcher reports closed-after-write files."""
+        watcher = create_watcher(self.temp_dir)
+        if not isinstance(watcher, InotifyWatcher):
+            watcher.close()
+            self.skipTest("inotify is not available")
+        self.check_watcher(watcher)
+    
+    def test_watch_organizes_new_files(self):
+        """Test that watch mode moves new files but leaves existing ones."""
+        stop = threading.Event()
+        batches = []
+        
+        def on_batch(moved):
+            batches.append(moved)
+            stop.set()
+        
+        thread = threading.Thread(target=watch, args=(self.temp_dir,),
+                                  kwargs={"debounce": 0.1, "interval": 0.05, "polling": True,
+                                          "stop_event": stop, "on_batch": on_batch})
+        os.utime(self.temp_dir, ns=(0, 0))
+        thread.start()
+        time.sleep(0.2)
+        self.write("report.pdf")
+        thread.join(timeout=5)
+        stop.set()
+        
+        self.assertEqual(batches, [{"pdf": ["report.pdf"]}])
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "pdf", "report.pdf")))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "old.txt")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,28 +1,35 @@
 
 
 import argparse
+import asyncio
 import concurrent.futures
+import cProfile
 import csv
 import functools
+import hashlib
+import inspect
 import io
 import json
 import logging
 import multiprocessing
 import os
+import pickle
+import pstats
 import random
 import re
 import statistics
 import sys
 import time
+import tracemalloc
 import traceback
-from concurrent.futures import ProcessPoolExecutor
-from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from functools import lru_cache, partial, wraps
 from pathlib import Path
-from typing import (Any, Callable, Dict, Generator, Iterable, List, 
+from typing import (Any, AsyncGenerator, Callable, Dict, Generator, Iterable, List, 
                    Optional, Set, Tuple, TypeVar, Union, cast)
 
 # Third-party imports - these would normally be installed with pip
@@ -32,6 +39,7 @@ try:
     import pandas as pd
     import requests
     import seaborn as sns
+    from requests.adapters import HTTPAdapter
     from scipy import stats
     from sklearn.cluster import KMeans
     from sklearn.decomposition import PCA
@@ -76,7 +84,14 @@ class DataSource(Enum):
 
 @dataclass
 class PipelineConfig:
-    """Configuration for the data pipeline."""
+    """
+    Configuration for the data pipeline.
+    
+    With the defaults (cache_results=True, output_path="output"), every
+    preprocess_data and load_and_preprocess run writes each preprocessing
+    stage's output as a Parquet file under output/cache, up to
+    cache_max_bytes. Set cache_results=False to disable the stage cache.
+    """
     input_path: str = ""
     output_path: str = "output"
     data_source: DataSource = DataSource.SYNTHETIC
@@ -87,12 +102,23 @@ class PipelineConfig:
     visualize: bool = True
     batch_size: int = 1000
     cache_results: bool = True
+    cache_max_bytes: int = 2 * 1024 ** 3
     api_url: str = ""
     api_key: str = ""
+    api_paginated: bool = False
+    api_page_param: str = "page"
+    api_first_page: int = 1
+    api_max_pages: int = 0
+    api_concurrency: int = 8
     db_connection_string: str = ""
+    db_table: str = ""
+    db_filters: Dict[str, Any] = field(default_factory=dict)
     features: List[str] = field(default_factory=list)
     target: str = ""
     test_size: float = 0.2
+    chunked: bool = False
+    compact_dtypes: bool = False
+    inplace: bool = False
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -104,6 +130,14 @@ class PipelineConfig:
             logger.warning("Invalid sample_size, setting to 1000")
             self.sample_size = 1000
         
+        if self.api_concurrency <= 0:
+            logger.warning("Invalid api_concurrency, setting to 1")
+            self.api_concurrency = 1
+        
+        if self.batch_size <= 0:
+            logger.warning("Invalid batch_size, setting to 1000")
+            self.batch_size = 1000
+        
         # Create output directory if it doesn't exist
         if self.output_path:
             os.makedirs(self.output_path, exist_ok=True)
@@ -171,6 +205,45 @@ def performance_monitor(operation_name: str) -> Generator[None, None, None]:
         pass
 
 
+def _read_peak_rss_mb(reset: bool = False) -> Optional[float]:
+    """
+    Read the peak resident set size of this process in MB.
+    
+    On Linux the peak is read from /proc and can be reset, so it can be
+    measured per operation. Elsewhere the lifetime peak from getrusage is used.
+    """
+    try:
+        if reset:
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        return None
+
+
+@contextmanager
+def peak_memory_monitor(operation_name: str) -> Generator[None, None, None]:
+    """
+    Context manager to log the peak RSS reached during a code block.
+    
+    On Linux this resets the process-wide peak RSS counter on entry.
+    """
+    _read_peak_rss_mb(reset=True)
+    yield
+    peak = _read_peak_rss_mb()
+    if peak is not None:
+        logger.info(f"Peak RSS for '{operation_name}': {peak:.2f} MB")
+
+
 def validate_data(df: pd.DataFrame, rules: Dict[str, Callable[[pd.Series], bool]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Validate dataframe against a set of rules and return valid and invalid data.
@@ -242,71 +315,510 @@ def expensive_calculation(x: float, y: float) -> float:
     return np.sqrt(x**2 + y**2)
 
 
+def hash_dataframe(df: pd.DataFrame) -> str:
+    """
+    Compute a content hash of a dataframe, including its index, columns and dtypes.
+    
+    Object columns holding unhashable values (lists, dicts, as parsed from
+    nested JSON) are hashed from their pickled values instead.
+    
+    Args:
+        df: Input dataframe
+        
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(list(df.columns)).encode())
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode())
+    digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        try:
+            digest.update(pd.util.hash_pandas_object(column, index=False).to_numpy().tobytes())
+        except TypeError:
+            digest.update(pickle.dumps(column.tolist()))
+    return digest.hexdigest()
+
+
+# PipelineConfig fields that change what load_data_from_source returns
+_SOURCE_FIELDS = (
+    'data_source', 'input_path', 'api_url', 'api_paginated', 'api_page_param', 'api_first_page',
+    'api_max_pages', 'db_connection_string', 'db_table', 'db_filters', 'features', 'target',
+    'sample_size', 'random_seed', 'compact_dtypes',
+)
+
+
+def source_fingerprint(config: PipelineConfig) -> Optional[str]:
+    """
+    Compute a hash identifying the data that load_data_from_source would return,
+    without loading it.
+    
+    Database tables and API responses can change without any change to the
+    configuration, and there is no cheap content stamp to detect it, so they
+    have no fingerprint.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Returns:
+        Hex digest, or None if the data cannot be identified without loading it
+    """
+    if config.data_source in (DataSource.API, DataSource.DATABASE):
+        return None
+    
+    parts: Dict[str, Any] = {name: getattr(config, name) for name in _SOURCE_FIELDS}
+    parts['data_source'] = config.data_source.name
+    if config.data_source in (DataSource.CSV, DataSource.JSON):
+        try:
+            file_stat = os.stat(config.input_path)
+        except OSError:
+            return None
+        parts['input_stat'] = (file_stat.st_size, file_stat.st_mtime_ns)
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class StageCache:
+    """
+    Content-addressed on-disk cache of intermediate dataframes.
+    
+    Each stage key chains the key of its input with the stage name, the source
+    of the stage function and its arguments, so changing one stage only
+    invalidates that stage and the ones after it. Frames are stored as Parquet
+    (pickle if pyarrow is unavailable) and evicted least recently used first
+    once the cache exceeds max_bytes.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> Optional['StageCache']:
+        """Create the cache configured for a pipeline, or None if caching is disabled."""
+        if not config.cache_results or not config.output_path:
+            return None
+        return cls(os.path.join(config.output_path, "cache"), config.cache_max_bytes)
+    
+    @staticmethod
+    def stage_key(input_key: str, stage_name: str, func: Callable, 
+                  kwargs: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Derive the key of a stage's output from the key of its input.
+        
+        Args:
+            input_key: Key of the data the stage is applied to
+            stage_name: Name of the stage
+            func: Stage function
+            kwargs: Keyword arguments the stage function is called with
+            
+        Returns:
+            Hex digest
+        """
+        try:
+            func_source = inspect.getsource(func)
+        except (OSError, TypeError):
+            func_source = getattr(func, '__qualname__', repr(func))
+        digest = hashlib.sha256()
+        for part in (input_key, stage_name, func_source, json.dumps(kwargs or {}, sort_keys=True, default=str)):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def _paths(self, key: str) -> List[str]:
+        base = os.path.join(self.cache_dir, key)
+        return [base + ".parquet", base + ".pkl"]
+    
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame for a key, or None on a miss."""
+        parquet_path, pickle_path = self._paths(key)
+        try:
+            if os.path.exists(parquet_path):
+                df = pd.read_parquet(parquet_path)
+                os.utime(parquet_path)
+                return df
+            if os.path.exists(pickle_path):
+                df = pd.read_pickle(pickle_path)
+                os.utime(pickle_path)
+                return df
+        except Exception as e:
+            logger.warning(f"Could not read cache entry {key[:12]}: {e}")
+        return None
+    
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Store a frame under a key and evict old entries if over budget."""
+        parquet_path, pickle_path = self._paths(key)
+        try:
+            df.to_parquet(parquet_path)
+        except Exception as e:
+            logger.debug(f"Parquet unavailable for cache entry {key[:12]}, using pickle: {e}")
+            if os.path.exists(parquet_path):
+                os.remove(parquet_path)
+            df.to_pickle(pickle_path)
+        self.evict()
+    
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file():
+                entry_stat = entry.stat()
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+        
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            os.remove(path)
+            total_size -= size
+            logger.debug(f"Evicted cache entry {os.path.basename(path)}")
+
+
+# -------------------------------------------------------------------------
+# Profiling
+# -------------------------------------------------------------------------
+
+@dataclass
+class StepProfile:
+    """Resource usage of one profiled pipeline step."""
+    name: str
+    depth: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory_mb: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    columns_in: Optional[int] = None
+    columns_out: Optional[int] = None
+    columns_added: List[str] = field(default_factory=list)
+    top_functions: List[str] = field(default_factory=list)
+    top_allocations: List[str] = field(default_factory=list)
+    _input_columns: Optional[Set[Any]] = field(default=None, repr=False)
+    _peak_so_far: int = field(default=0, repr=False)
+    _profiler: Optional[cProfile.Profile] = field(default=None, repr=False)
+    
+    def record_output(self, result: Any) -> None:
+        """Record the shape of a step's result (ignored unless it is a dataframe)."""
+        if isinstance(result, pd.DataFrame):
+            self.rows_out = len(result)
+            self.columns_out = len(result.columns)
+            if self._input_columns is not None:
+                self.columns_added = [col for col in result.columns if col not in self._input_columns]
+
+
+class PipelineProfiler:
+    """
+    Collects a structured, per-step profile of a pipeline run.
+    
+    Each step records wall and CPU time, the peak memory traced by
+    tracemalloc, and rows and columns in and out. Steps can be nested, e.g. the
+    preprocessing steps inside preprocess_data. With top_n > 0, each step also
+    keeps its top cProfile functions (self time, excluding nested steps) and the
+    top allocation sites from a tracemalloc snapshot diff.
+    """
+    
+    def __init__(self, top_n: int = 0, trace_memory: bool = True):
+        self.top_n = top_n
+        self.trace_memory = trace_memory
+        self.records: List[StepProfile] = []
+        self._stack: List[StepProfile] = []
+    
+    @contextmanager
+    def profile(self, name: str, df: Any = None) -> Generator[StepProfile, None, None]:
+        """
+        Profile a block of code as one step.
+        
+        Args:
+            name: Step name
+            df: Step input, used for the rows and columns in
+            
+        Yields:
+            The step's record; call record_output on it with the result
+        """
+        record = StepProfile(name=name, depth=len(self._stack))
+        if isinstance(df, pd.DataFrame):
+            record.rows_in = len(df)
+            record.columns_in = len(df.columns)
+            record._input_columns = set(df.columns)
+        self.records.append(record)
+        
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            if tracemalloc.is_tracing():
+                parent._peak_so_far = max(parent._peak_so_far, tracemalloc.get_traced_memory()[1])
+            if parent._profiler is not None:
+                parent._profiler.disable()
+        
+        start_traced = 0
+        snapshot = None
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            start_traced = tracemalloc.get_traced_memory()[0]
+            if self.top_n > 0:
+                snapshot = tracemalloc.take_snapshot()
+        if self.top_n > 0:
+            record._profiler = cProfile.Profile()
+            record._profiler.enable()
+        
+        self._stack.append(record)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_time = time.perf_counter() - start_wall
+            record.cpu_time = time.process_time() - start_cpu
+            self._stack.pop()
+            
+            if record._profiler is not None:
+                record._profiler.disable()
+                stats_stream = io.StringIO()
+                pstats.Stats(record._profiler, stream=stats_stream).sort_stats('tottime').print_stats(self.top_n)
+                record.top_functions = [line.strip() for line in stats_stream.getvalue().splitlines()
+                                        if re.match(r'\s*[\d/]+\s+[\d.]+\s', line)][:self.top_n]
+                record._profiler = None
+            
+            if tracemalloc.is_tracing():
+                peak = max(record._peak_so_far, tracemalloc.get_traced_memory()[1])
+                record.peak_memory_mb = max(0, peak - start_traced) / 1024 / 1024
+                if snapshot is not None:
+                    diff = tracemalloc.take_snapshot().compare_to(snapshot, 'lineno')
+                    record.top_allocations = [str(stat) for stat in diff[:self.top_n]]
+                if parent is not None:
+                    parent._peak_so_far = max(parent._peak_so_far, peak)
+                tracemalloc.reset_peak()
+            if started_tracing:
+                tracemalloc.stop()
+            if parent is not None and parent._profiler is not None:
+                parent._profiler.enable()
+    
+    def run(self, name: str, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call func as a profiled step, using its first argument as the step input."""
+        with self.profile(name, args[0] if args else None) as record:
+            result = func(*args, **kwargs)
+            record.record_output(result)
+        return result
+    
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """Return the step records as a list of dictionaries."""
+        return [{key: value for key, value in vars(record).items() if not key.startswith('_')}
+                for record in self.records]
+    
+    def to_json(self, indent: int = 2) -> str:
+        """Return the step records as JSON."""
+        return json.dumps(self.to_dict(), indent=indent)
+    
+    def flame_summary(self, width: int = 40) -> str:
+        """
+        Render a flame-style text summary, one line per step, with bars
+        proportional to wall time and nested steps indented under their parent.
+        """
+        total = sum(record.wall_time for record in self.records if record.depth == 0) or 1.0
+        name_width = max([len(record.name) + 2 * record.depth for record in self.records] + [4])
+        lines = []
+        for record in self.records:
+            share = record.wall_time / total
+            label = "  " * record.depth + record.name
+            rows = f"{record.rows_in}->{record.rows_out}" if record.rows_in is not None else "-"
+            lines.append(
+                f"{label:<{name_width}} {record.wall_time:9.4f}s {record.cpu_time:9.4f}s cpu "
+                f"{record.peak_memory_mb:9.2f} MB {share:6.1%} rows {rows:<15} "
+                f"+{len(record.columns_added)} cols {'#' * int(round(share * width))}"
+            )
+            for line in record.top_functions + record.top_allocations:
+                lines.append("  " * (record.depth + 1) + "| " + line)
+        return "\n".join(lines)
+    
+    def save(self, output_path: str, prefix: str = "profile") -> None:
+        """Write the JSON report and the text summary to output_path."""
+        os.makedirs(output_path, exist_ok=True)
+        with open(os.path.join(output_path, f"{prefix}.json"), "w") as f:
+            f.write(self.to_json())
+        with open(os.path.join(output_path, f"{prefix}.txt"), "w") as f:
+            f.write(self.flame_summary() + "\n")
+        logger.info(f"Saved profile to {os.path.join(output_path, prefix)}.json/.txt")
+
+
 # -------------------------------------------------------------------------
 # Data Generation and Loading Functions
 # -------------------------------------------------------------------------
 
-def generate_synthetic_data(config: PipelineConfig) -> pd.DataFrame:
+SYNTHETIC_CATEGORIES = {
+    'gender': (['M', 'F', 'Other'], [0.48, 0.48, 0.04]),
+    'location': (['Urban', 'Suburban', 'Rural'], [0.6, 0.3, 0.1]),
+    'membership': (['Bronze', 'Silver', 'Gold', 'Platinum'], [0.4, 0.3, 0.2, 0.1]),
+}
+
+# Memory-lean dtypes used when PipelineConfig.compact_dtypes is set
+COMPACT_DTYPES = {
+    'age': 'float32',
+    'income': 'float32',
+    'spending_score': 'float32',
+    'loyalty_years': 'float32',
+    'products_purchased': 'int16',
+    'satisfaction': 'float32',
+    'last_purchase_days': 'int16',
+    'website_visits': 'int16',
+    'returns': 'int8',
+    'high_value_customer': 'int8',
+    'recency_score': 'int8',
+    'frequency_score': 'int8',
+    'monetary_score': 'int8',
+    'rfm_score': 'int8',
+}
+
+
+def _generate_synthetic_columns(rng: Any, size: int, first_id: int, start_date: datetime,
+                                compact: bool) -> Dict[str, Any]:
     """
-    Generate synthetic data for testing and development.
+    Draw the raw synthetic columns, fully vectorized.
     
     Args:
-        config: Pipeline configuration
+        rng: np.random or a np.random.RandomState to draw from
+        size: Number of rows
+        first_id: First customer id
+        start_date: Earliest registration date
+        compact: Whether to build categorical columns as pandas categoricals
         
     Returns:
-        DataFrame with synthetic data
+        Dictionary of column arrays
     """
-    logger.info(f"Generating synthetic dataset with {config.sample_size} samples")
-    np.random.seed(config.random_seed)
-    
-    # Generate synthetic customer data
     data = {
-        'customer_id': range(1, config.sample_size + 1),
-        'age': np.random.normal(40, 15, config.sample_size).astype(int),
-        'income': np.random.lognormal(10, 1, config.sample_size).astype(int),
-        'spending_score': np.random.uniform(1, 100, config.sample_size).astype(int),
-        'loyalty_years': np.random.exponential(5, config.sample_size).astype(int),
-        'products_purchased': np.random.poisson(5, config.sample_size),
-        'satisfaction': np.random.choice([1, 2, 3, 4, 5], config.sample_size, p=[0.1, 0.2, 0.4, 0.2, 0.1]),
-        'last_purchase_days': np.random.exponential(30, config.sample_size).astype(int),
-        'website_visits': np.random.poisson(8, config.sample_size),
-        'returns': np.random.binomial(1, 0.2, config.sample_size),
+        'customer_id': np.arange(first_id, first_id + size, dtype=np.int64),
+        'age': rng.normal(40, 15, size).astype(int),
+        'income': rng.lognormal(10, 1, size).astype(int),
+        'spending_score': rng.uniform(1, 100, size).astype(int),
+        'loyalty_years': rng.exponential(5, size).astype(int),
+        'products_purchased': rng.poisson(5, size),
+        'satisfaction': rng.choice([1, 2, 3, 4, 5], size, p=[0.1, 0.2, 0.4, 0.2, 0.1]),
+        'last_purchase_days': rng.exponential(30, size).astype(int),
+        'website_visits': rng.poisson(8, size),
+        'returns': rng.binomial(1, 0.2, size),
     }
     
-    # Add some categorical features
-    data['gender'] = np.random.choice(['M', 'F', 'Other'], config.sample_size, p=[0.48, 0.48, 0.04])
-    data['location'] = np.random.choice(['Urban', 'Suburban', 'Rural'], config.sample_size, p=[0.6, 0.3, 0.1])
-    data['membership'] = np.random.choice(['Bronze', 'Silver', 'Gold', 'Platinum'], config.sample_size, p=[0.4, 0.3, 0.2, 0.1])
+    # Add some categorical features, drawn as codes
+    for col, (choices, p) in SYNTHETIC_CATEGORIES.items():
+        codes = rng.choice(len(choices), size, p=p)
+        if compact:
+            # Codes are remapped so categories are sorted like get_dummies would sort strings
+            order = np.argsort(choices)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(choices))
+            data[col] = pd.Categorical.from_codes(rank[codes], categories=sorted(choices))
+        else:
+            data[col] = np.array(choices, dtype=object)[codes]
     
     # Add some missing values
     for col in ['age', 'income', 'loyalty_years', 'satisfaction']:
-        mask = np.random.random(config.sample_size) < 0.05
+        mask = rng.random(size) < 0.05
         data[col] = np.where(mask, np.nan, data[col])
     
     # Add some outliers
     for col in ['age', 'income', 'spending_score']:
-        outlier_mask = np.random.random(config.sample_size) < 0.01
+        outlier_mask = rng.random(size) < 0.01
         if col == 'income':
-            data[col] = np.where(outlier_mask, np.random.uniform(500000, 1000000, config.sample_size), data[col])
+            data[col] = np.where(outlier_mask, rng.uniform(500000, 1000000, size), data[col])
         elif col == 'age':
-            data[col] = np.where(outlier_mask, np.random.uniform(90, 120, config.sample_size), data[col])
+            data[col] = np.where(outlier_mask, rng.uniform(90, 120, size), data[col])
         else:
-            data[col] = np.where(outlier_mask, np.random.uniform(150, 200, config.sample_size), data[col])
+            data[col] = np.where(outlier_mask, rng.uniform(150, 200, size), data[col])
     
     # Add a timestamp column
-    start_date = datetime.now() - timedelta(days=365)
-    data['registration_date'] = [
-        start_date + timedelta(days=np.random.randint(0, 365)) for _ in range(config.sample_size)
-    ]
+    data['registration_date'] = (
+        pd.Timestamp(start_date) + pd.to_timedelta(rng.randint(0, 365, size), unit='D')
+    )
+    
+    return data
+
+
+def _fit_synthetic_reference(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the distribution statistics the derived synthetic columns depend on.
+    
+    Args:
+        data: Raw columns from _generate_synthetic_columns
+        
+    Returns:
+        Dictionary of z-score moments, caps and quintile edges
+    """
+    def quintile_edges(values: np.ndarray) -> List[float]:
+        edges = np.quantile(values, np.linspace(0, 1, 6))
+        return [-np.inf] + edges[1:-1].tolist() + [np.inf]
+    
+    income = pd.Series(data['income'])
+    products = pd.Series(data['products_purchased'])
+    spending = pd.Series(data['spending_score'])
+    frequency_cap = products.quantile(0.99)
+    monetary_cap = spending.quantile(0.99)
+    income_median = income.median()
+    
+    return {
+        # A constant column (e.g. a one-row batch) has zero spread; avoid dividing by it
+        'zscore': {col: (float(np.mean(values)), float(np.std(values)) or 1.0)
+                   for col, values in (('income', np.nan_to_num(data['income'])),
+                                       ('spending_score', data['spending_score']),
+                                       ('loyalty_years', np.nan_to_num(data['loyalty_years'])))},
+        'income_median': income_median,
+        'income_edges': quintile_edges(income.fillna(income_median)),
+        'recency_edges': quintile_edges(data['last_purchase_days']),
+        'frequency_cap': frequency_cap,
+        'frequency_edges': quintile_edges(products.clip(upper=frequency_cap)),
+        'monetary_cap': monetary_cap,
+        'monetary_edges': quintile_edges(spending.clip(upper=monetary_cap)),
+    }
+
+
+def _quintile_cut(values: pd.Series, edges: List[float], labels: List[Any]) -> pd.Series:
+    """
+    pd.cut on fitted quintile edges.
+    
+    Quantiles of a small batch often repeat, so each empty bin between two
+    equal edges is dropped along with its label; the result keeps every
+    label as a category so batches still line up.
+    
+    Args:
+        values: Values to bin
+        edges: Sorted bin edges, one more than labels
+        labels: Label of each bin
+        
+    Returns:
+        Categorical series
+    """
+    keep = [i for i in range(len(labels)) if edges[i + 1] > edges[i]]
+    binned = pd.cut(values, bins=[edges[0]] + [edges[i + 1] for i in keep], 
+                    labels=[labels[i] for i in keep])
+    return binned.cat.set_categories(labels)
+
+
+def _build_synthetic_frame(data: Dict[str, Any], reference: Dict[str, Any], 
+                           compact: bool) -> pd.DataFrame:
+    """
+    Add the target and derived columns and assemble the dataframe.
+    
+    Args:
+        data: Raw columns from _generate_synthetic_columns
+        reference: Statistics from _fit_synthetic_reference
+        compact: Whether to downcast to COMPACT_DTYPES
+        
+    Returns:
+        DataFrame with synthetic data
+    """
+    def zscore(col: str, values: np.ndarray) -> np.ndarray:
+        mean, std = reference['zscore'][col]
+        return (values - mean) / std
     
     # Create a target variable (high_value_customer) based on income and spending
-    income_z = stats.zscore(np.nan_to_num(data['income']))
-    spending_z = stats.zscore(data['spending_score'])
-    loyalty_z = stats.zscore(np.nan_to_num(data['loyalty_years']))
+    income_z = zscore('income', np.nan_to_num(data['income']))
+    spending_z = zscore('spending_score', data['spending_score'])
+    loyalty_z = zscore('loyalty_years', np.nan_to_num(data['loyalty_years']))
     
     data['high_value_customer'] = (
         (income_z + spending_z + loyalty_z > 1) | 
-        (data['membership'] == 'Platinum')
+        (np.asarray(data['membership']) == 'Platinum')
     ).astype(int)
     
     df = pd.DataFrame(data)
@@ -318,41 +830,100 @@ def generate_synthetic_data(config: PipelineConfig) -> pd.DataFrame:
         labels=['Under 18', '18-24', '25-34', '35-49', '50-64', '65+']
     )
     
-    df['income_bracket'] = pd.qcut(
-        df['income'].fillna(df['income'].median()), 
-        q=5, 
-        labels=['Very Low', 'Low', 'Medium', 'High', 'Very High']
+    df['income_bracket'] = _quintile_cut(
+        df['income'].fillna(reference['income_median']), 
+        reference['income_edges'], 
+        ['Very Low', 'Low', 'Medium', 'High', 'Very High']
     )
     
     # Create a recency-frequency-monetary (RFM) score
-    df['recency_score'] = pd.qcut(
+    df['recency_score'] = _quintile_cut(
         df['last_purchase_days'], 
-        q=5, 
-        labels=[5, 4, 3, 2, 1]  # Lower days = higher score
+        reference['recency_edges'], 
+        [5, 4, 3, 2, 1]  # Lower days = higher score
     ).astype(int)
     
-    df['frequency_score'] = pd.qcut(
-        df['products_purchased'].clip(upper=df['products_purchased'].quantile(0.99)), 
-        q=5, 
-        labels=[1, 2, 3, 4, 5]
+    df['frequency_score'] = _quintile_cut(
+        df['products_purchased'].clip(upper=reference['frequency_cap']), 
+        reference['frequency_edges'], 
+        [1, 2, 3, 4, 5]
     ).astype(int)
     
-    df['monetary_score'] = pd.qcut(
-        df['spending_score'].clip(upper=df['spending_score'].quantile(0.99)), 
-        q=5, 
-        labels=[1, 2, 3, 4, 5]
+    df['monetary_score'] = _quintile_cut(
+        df['spending_score'].clip(upper=reference['monetary_cap']), 
+        reference['monetary_edges'], 
+        [1, 2, 3, 4, 5]
     ).astype(int)
     
     df['rfm_score'] = df['recency_score'] + df['frequency_score'] + df['monetary_score']
     
+    if compact:
+        dtypes = dict(COMPACT_DTYPES)
+        dtypes['customer_id'] = 'int32' if df['customer_id'].max() < 2 ** 31 else 'int64'
+        df = df.astype(dtypes)
+    
     return df
 
 
-@retry(max_attempts=3)
+def generate_synthetic_data(config: PipelineConfig) -> pd.DataFrame:
+    """
+    Generate synthetic data for testing and development.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Returns:
+        DataFrame with synthetic data
+    """
+    logger.info(f"Generating synthetic dataset with {config.sample_size} samples")
+    np.random.seed(config.random_seed)
+    
+    start_date = datetime.now() - timedelta(days=365)
+    data = _generate_synthetic_columns(np.random, config.sample_size, 1, start_date, 
+                                       config.compact_dtypes)
+    return _build_synthetic_frame(data, _fit_synthetic_reference(data), config.compact_dtypes)
+
+
+def generate_synthetic_data_chunks(config: PipelineConfig, 
+                                   chunk_size: Optional[int] = None) -> Generator[pd.DataFrame, None, None]:
+    """
+    Generate config.sample_size rows of synthetic data in chunks.
+    
+    The derived columns (target, income brackets, RFM scores) use statistics
+    fitted on the first chunk, so memory stays bounded by the chunk size even
+    for 100M-row load tests.
+    
+    Args:
+        config: Pipeline configuration
+        chunk_size: Rows per chunk (if None, config.batch_size)
+        
+    Yields:
+        DataFrame chunks with consecutive customer ids
+    """
+    chunk_size = chunk_size or config.batch_size
+    logger.info(f"Generating synthetic dataset with {config.sample_size} samples "
+                f"in chunks of {chunk_size}")
+    rng = np.random.RandomState(config.random_seed)
+    start_date = datetime.now() - timedelta(days=365)
+    reference = None
+    
+    for first_row in range(0, config.sample_size, chunk_size):
+        size = min(chunk_size, config.sample_size - first_row)
+        data = _generate_synthetic_columns(rng, size, first_row + 1, start_date, config.compact_dtypes)
+        if reference is None:
+            reference = _fit_synthetic_reference(data)
+        df = _build_synthetic_frame(data, reference, config.compact_dtypes)
+        df.index = pd.RangeIndex(first_row, first_row + size)
+        yield df
+
+
 def load_data_from_source(config: PipelineConfig) -> pd.DataFrame:
     """
     Load data from the configured source.
     
+    API requests are retried individually (each page of a paginated API on
+    its own), so a failing page is not refetched along with every other page.
+    
     Args:
         config: Pipeline configuration
         
@@ -371,23 +942,265 @@ def load_data_from_source(config: PipelineConfig) -> pd.DataFrame:
             logger.info(f"Loading data from JSON: {config.input_path}")
             return pd.read_json(config.input_path)
         
+        elif config.data_source == DataSource.API and config.api_paginated:
+            logger.info(f"Fetching paginated data from API: {config.api_url}")
+            pages = list(stream_api_pages(config))
+            return pd.concat(pages, ignore_index=True) if pages else pd.DataFrame()
+        
         elif config.data_source == DataSource.API:
             logger.info(f"Fetching data from API: {config.api_url}")
-            headers = {'Authorization': f'Bearer {config.api_key}'} if config.api_key else {}
-            response = requests.get(config.api_url, headers=headers)
-            response.raise_for_status()
-            return pd.DataFrame(response.json())
+            return fetch_api_data(config)
         
         elif config.data_source == DataSource.DATABASE:
-            logger.info(f"Loading data from database")
-            # This would normally use SQLAlchemy or another DB library
-            # For this example, we'll just return synthetic data
-            return generate_synthetic_data(config)
+            logger.info(f"Loading data from database table: {config.db_table}")
+            chunks = list(stream_database_chunks(config))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
         
         else:
             raise ValueError(f"Unsupported data source: {config.data_source}")
 
 
+@retry(max_attempts=3)
+def fetch_api_data(config: PipelineConfig) -> pd.DataFrame:
+    """
+    Fetch a non-paginated API response as a dataframe.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Returns:
+        DataFrame with the response records
+    """
+    headers = {'Authorization': f'Bearer {config.api_key}'} if config.api_key else {}
+    response = requests.get(config.api_url, headers=headers)
+    response.raise_for_status()
+    return pd.DataFrame(response.json())
+
+
+def _records_from_payload(payload: Any) -> List[Dict[str, Any]]:
+    """Extract the list of records from an API page (a list, or a dict wrapping one)."""
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in ('data', 'results', 'items', 'records'):
+            if isinstance(payload.get(key), list):
+                return payload[key]
+    raise ValueError(f"Unrecognized API page payload of type {type(payload).__name__}")
+
+
+async def fetch_api_pages(config: PipelineConfig) -> AsyncGenerator[pd.DataFrame, None]:
+    """
+    Fetch a paginated API concurrently, yielding one dataframe per page in order.
+    
+    Pages are requested as config.api_page_param=N starting at
+    config.api_first_page, through one pooled session with at most
+    config.api_concurrency requests in flight. Each page is parsed into its own
+    dataframe as it arrives and retried on failure like any other @retry call.
+    Fetching stops at the first empty page or after config.api_max_pages pages.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Yields:
+        One DataFrame per page
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.api_concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if config.api_key:
+        session.headers['Authorization'] = f'Bearer {config.api_key}'
+    
+    @retry(max_attempts=3)
+    def fetch_page(page: int) -> pd.DataFrame:
+        response = session.get(config.api_url, params={config.api_page_param: page}, timeout=30)
+        response.raise_for_status()
+        return pd.DataFrame(_records_from_payload(response.json()))
+    
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=config.api_concurrency)
+    pending: Dict[int, asyncio.Future] = {}
+    next_page = config.api_first_page
+    last_page = config.api_first_page + config.api_max_pages - 1 if config.api_max_pages else None
+    
+    try:
+        page = config.api_first_page
+        while True:
+            # Keep the window of in-flight pages full
+            while len(pending) < config.api_concurrency and (last_page is None or next_page <= last_page):
+                pending[next_page] = loop.run_in_executor(executor, fetch_page, next_page)
+                next_page += 1
+            
+            if page not in pending:
+                break
+            df = await pending.pop(page)
+            if df.empty:
+                break
+            logger.debug(f"Fetched API page {page} with {len(df)} rows")
+            yield df
+            page += 1
+    finally:
+        for future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        session.close()
+
+
+def stream_api_pages(config: PipelineConfig) -> Generator[pd.DataFrame, None, None]:
+    """
+    Synchronous wrapper around fetch_api_pages for use in the pipeline.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Yields:
+        One DataFrame per page
+    """
+    loop = asyncio.new_event_loop()
+    pages = fetch_api_pages(config)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(pages.aclose())
+        loop.close()
+
+
+SQL_FILTER_OPERATORS = {'=', '!=', '<', '<=', '>', '>='}
+
+
+@lru_cache(maxsize=8)
+def get_db_engine(connection_string: str) -> Any:
+    """
+    Return a pooled SQLAlchemy engine, shared by every pipeline run that uses
+    the same connection string.
+    
+    Args:
+        connection_string: SQLAlchemy database URL
+        
+    Returns:
+        SQLAlchemy engine
+    """
+    from sqlalchemy import create_engine
+    logger.info("Creating database engine")
+    return create_engine(connection_string, pool_pre_ping=True)
+
+
+def build_database_query(config: PipelineConfig, engine: Any) -> Any:
+    """
+    Build the SELECT for the configured table, pushing column projection and
+    simple filters down to the database.
+    
+    Only config.features (plus config.target) are selected when features are
+    set. Each entry of config.db_filters is a column mapped to a value
+    (equality), None (IS NULL), a list (IN) or an (operator, value) tuple with
+    one of =, !=, <, <=, >, >=.
+    
+    Args:
+        config: Pipeline configuration
+        engine: SQLAlchemy engine
+        
+    Returns:
+        SQLAlchemy select statement
+    """
+    from sqlalchemy import MetaData, Table, select
+    
+    table = Table(config.db_table, MetaData(), autoload_with=engine)
+    
+    columns = list(config.features)
+    if columns and config.target and config.target not in columns:
+        columns.append(config.target)
+    missing = [col for col in columns + list(config.db_filters) if col not in table.c]
+    if missing:
+        raise ValueError(f"Columns not found in table {config.db_table}: {missing}")
+    
+    query = select(*[table.c[col] for col in columns]) if columns else select(table)
+    
+    for col, condition in config.db_filters.items():
+        column = table.c[col]
+        if isinstance(condition, tuple) and len(condition) == 2 and condition[0] in SQL_FILTER_OPERATORS:
+            operator, value = condition
+            clause = {
+                '=': column == value, '!=': column != value,
+                '<': column < value, '<=': column <= value,
+                '>': column > value, '>=': column >= value,
+            }[operator]
+        elif condition is None:
+            clause = column.is_(None)
+        elif isinstance(condition, (list, tuple, set)):
+            clause = column.in_(list(condition))
+        else:
+            clause = column == condition
+        query = query.where(clause)
+    
+    return query
+
+
+def stream_database_chunks(config: PipelineConfig) -> Generator[pd.DataFrame, None, None]:
+    """
+    Read the configured table in chunks of config.batch_size rows.
+    
+    Results are streamed with a server-side cursor where the driver supports
+    one, so the table is never materialized in a single read_sql call.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Yields:
+        DataFrame chunks
+    """
+    if not config.db_connection_string or not config.db_table:
+        raise ValueError("db_connection_string and db_table must be set for the DATABASE source")
+    
+    engine = get_db_engine(config.db_connection_string)
+    query = build_database_query(config, engine)
+    with engine.connect() as connection:
+        connection = connection.execution_options(stream_results=True, max_row_buffer=config.batch_size)
+        yield from pd.read_sql(query, connection, chunksize=config.batch_size)
+
+
+def stream_data_from_source(config: PipelineConfig) -> Generator[pd.DataFrame, None, None]:
+    """
+    Yield the configured source as dataframe chunks of config.batch_size rows.
+    
+    CSV and JSON Lines files and database tables are read incrementally,
+    synthetic data is generated per chunk and paginated APIs yield one chunk
+    per page, so memory is bounded by the chunk size. Other sources are loaded whole and then sliced.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Yields:
+        DataFrame chunks
+    """
+    if config.data_source == DataSource.CSV:
+        logger.info(f"Streaming data from CSV: {config.input_path}")
+        yield from pd.read_csv(config.input_path, chunksize=config.batch_size)
+    
+    elif config.data_source == DataSource.JSON and config.input_path.endswith(('.jsonl', '.ndjson')):
+        logger.info(f"Streaming data from JSON Lines: {config.input_path}")
+        with pd.read_json(config.input_path, lines=True, chunksize=config.batch_size) as reader:
+            yield from reader
+    
+    elif config.data_source == DataSource.SYNTHETIC:
+        yield from generate_synthetic_data_chunks(config)
+    
+    elif config.data_source == DataSource.API and config.api_paginated:
+        yield from stream_api_pages(config)
+    
+    elif config.data_source == DataSource.DATABASE:
+        yield from stream_database_chunks(config)
+    
+    else:
+        logger.warning(f"Source {config.data_source.name} does not support streaming, loading it whole")
+        df = load_data_from_source(config)
+        for i in range(0, len(df), config.batch_size):
+            yield df[i:i + config.batch_size]
+
+
 # -------------------------------------------------------------------------
 # Data Preprocessing Functions
 # -------------------------------------------------------------------------
@@ -406,18 +1219,24 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+def remove_duplicates(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """
     Remove duplicate rows from dataframe.
     
     Args:
         df: Input dataframe
+        inplace: Return the input itself when it has no duplicates
         
     Returns:
         DataFrame with duplicates removed
     """
     initial_rows = len(df)
-    df = df.drop_duplicates()
+    if inplace:
+        duplicated = df.duplicated()
+        if duplicated.any():
+            df = df[~duplicated]
+    else:
+        df = df.drop_duplicates()
     removed = initial_rows - len(df)
     if removed > 0:
         logger.info(f"Removed {removed} duplicate rows")
@@ -454,6 +1273,11 @@ def handle_missing_values(df: pd.DataFrame, strategy: str = 'median') -> pd.Data
                 df[col] = df[col].fillna(0)
         
         for col in categorical_cols:
+            if not df[col].isna().any():
+                continue
+            # Categoricals reject fill values that are not already a category
+            if isinstance(df[col].dtype, pd.CategoricalDtype) and "Unknown" not in df[col].cat.categories:
+                df[col] = df[col].cat.add_categories("Unknown")
             if strategy == 'mode':
                 df[col] = df[col].fillna(df[col].mode()[0] if not df[col].mode().empty else "Unknown")
             else:
@@ -467,7 +1291,8 @@ def handle_missing_values(df: pd.DataFrame, strategy: str = 'median') -> pd.Data
 
 
 def detect_and_handle_outliers(df: pd.DataFrame, method: str = 'iqr', 
-                              columns: Optional[List[str]] = None) -> pd.DataFrame:
+                              columns: Optional[List[str]] = None, 
+                              inplace: bool = False) -> pd.DataFrame:
     """
     Detect and handle outliers in numerical columns.
     
@@ -475,6 +1300,7 @@ def detect_and_handle_outliers(df: pd.DataFrame, method: str = 'iqr',
         df: Input dataframe
         method: Method for outlier detection ('iqr', 'zscore', 'none')
         columns: List of columns to check for outliers (if None, all numerical columns)
+        inplace: Modify the input dataframe instead of a copy
         
     Returns:
         DataFrame with outliers handled
@@ -482,7 +1308,7 @@ def detect_and_handle_outliers(df: pd.DataFrame, method: str = 'iqr',
     if method == 'none':
         return df
     
-    result_df = df.copy()
+    result_df = df if inplace else df.copy()
     
     if columns is None:
         columns = df.select_dtypes(include=['number']).columns.tolist()
@@ -528,14 +1354,19 @@ def detect_and_handle_outliers(df: pd.DataFrame, method: str = 'iqr',
 
 
 def encode_categorical_variables(df: pd.DataFrame, encoding_method: str = 'onehot', 
-                               max_categories: int = 10) -> pd.DataFrame:
+                               max_categories: int = 10, inplace: bool = False) -> pd.DataFrame:
     """
     Encode categorical variables using the specified method.
     
+    Encoded columns are collected first and attached in one batch by a single
+    concat, which when inplace shares the input dataframe's data instead of
+    copying it.
+    
     Args:
         df: Input dataframe
         encoding_method: Method for encoding ('onehot', 'label', 'binary', 'none')
         max_categories: Maximum number of categories to one-hot encode
+        inplace: Modify the input dataframe instead of building a new one
         
     Returns:
         DataFrame with encoded categorical variables
@@ -543,36 +1374,44 @@ def encode_categorical_variables(df: pd.DataFrame, encoding_method: str = 'oneho
     if encoding_method == 'none':
         return df
     
-    result_df = df.copy()
     categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    encoded = []
+    onehot_cols = []
     
     for col in categorical_cols:
         unique_values = df[col].nunique()
         
         if encoding_method == 'onehot' and unique_values <= max_categories:
             # One-hot encoding
-            dummies = pd.get_dummies(df[col], prefix=col, drop_first=False)
-            result_df = pd.concat([result_df, dummies], axis=1)
-            result_df = result_df.drop(col, axis=1)
+            encoded.append(pd.get_dummies(df[col], prefix=col, drop_first=False))
+            onehot_cols.append(col)
             
         elif encoding_method == 'label' or (encoding_method == 'onehot' and unique_values > max_categories):
             # Label encoding
             from sklearn.preprocessing import LabelEncoder
             le = LabelEncoder()
-            result_df[f"{col}_encoded"] = le.fit_transform(df[col].fillna('Unknown'))
+            encoded.append(pd.Series(le.fit_transform(df[col].fillna('Unknown')), 
+                                     index=df.index, name=f"{col}_encoded"))
             
         elif encoding_method == 'binary' and unique_values == 2:
             # Binary encoding
             unique_cats = df[col].dropna().unique()
             if len(unique_cats) == 2:
-                result_df[f"{col}_binary"] = df[col].map({unique_cats[0]: 0, unique_cats[1]: 1})
+                encoded.append(df[col].map({unique_cats[0]: 0, unique_cats[1]: 1}).rename(f"{col}_binary"))
+    
+    if inplace:
+        # Without copy, the concat reuses the input's column blocks
+        df.drop(columns=onehot_cols, inplace=True)
+        result_df = pd.concat([df] + encoded, axis=1, copy=False)
+    else:
+        result_df = pd.concat([df.drop(columns=onehot_cols)] + encoded, axis=1)
     
     logger.info(f"Encoded {len(categorical_cols)} categorical variables using {encoding_method} encoding")
     return result_df
 
 
 def normalize_features(df: pd.DataFrame, method: str = 'standard', 
-                     columns: Optional[List[str]] = None) -> pd.DataFrame:
+                     columns: Optional[List[str]] = None, inplace: bool = False) -> pd.DataFrame:
     """
     Normalize numerical features using the specified method.
     
@@ -580,6 +1419,7 @@ def normalize_features(df: pd.DataFrame, method: str = 'standard',
         df: Input dataframe
         method: Method for normalization ('standard', 'minmax', 'robust', 'none')
         columns: List of columns to normalize (if None, all numerical columns)
+        inplace: Modify the input dataframe instead of a copy
         
     Returns:
         DataFrame with normalized features
@@ -591,7 +1431,7 @@ def normalize_features(df: pd.DataFrame, method: str = 'standard',
         columns = df.select_dtypes(include=['number']).columns.tolist()
     
     # Make a copy to avoid modifying the original
-    result_df = df.copy()
+    result_df = df if inplace else df.copy()
     
     if method == 'standard':
         from sklearn.preprocessing import StandardScaler
@@ -614,18 +1454,22 @@ def normalize_features(df: pd.DataFrame, method: str = 'standard',
     return result_df
 
 
-def create_date_features(df: pd.DataFrame, date_columns: List[str]) -> pd.DataFrame:
+def create_date_features(df: pd.DataFrame, date_columns: List[str], 
+                         reference_date: Optional[datetime] = None, 
+                         inplace: bool = False) -> pd.DataFrame:
     """
     Extract useful features from date columns.
     
     Args:
         df: Input dataframe
         date_columns: List of date columns to process
+        reference_date: Date used for the 'days_since' features (if None, now)
+        inplace: Modify the input dataframe instead of a copy
         
     Returns:
         DataFrame with additional date-based features
     """
-    result_df = df.copy()
+    result_df = df if inplace else df.copy()
     
     for col in date_columns:
         if col in df.columns:
@@ -645,7 +1489,8 @@ def create_date_features(df: pd.DataFrame, date_columns: List[str]) -> pd.DataFr
             result_df[f"{col}_quarter"] = result_df[col].dt.quarter
             
             # Calculate days since a reference date
-            reference_date = datetime.now()
+            if reference_date is None:
+                reference_date = datetime.now()
             result_df[f"days_since_{col}"] = (reference_date - result_df[col]).dt.days
             
             logger.info(f"Created date features from column: {col}")
@@ -653,17 +1498,22 @@ def create_date_features(df: pd.DataFrame, date_columns: List[str]) -> pd.DataFr
     return result_df
 
 
-def feature_engineering(df: pd.DataFrame) -> pd.DataFrame:
+def feature_engineering(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """
     Create new features from existing ones.
     
     Args:
         df: Input dataframe
+        inplace: Modify the input dataframe instead of a copy
         
     Returns:
         DataFrame with engineered features
     """
-    result_df = df.copy()
+    result_df = df if inplace else df.copy()
+    initial_columns = len(df.columns)
+    
+    # Count the number of non-null values per row as a measure of data completeness
+    completeness = df.notnull().sum(axis=1) / initial_columns
     
     # Example feature engineering for customer data
     if all(col in df.columns for col in ['income', 'age']):
@@ -687,63 +1537,983 @@ def feature_engineering(df: pd.DataFrame) -> pd.DataFrame:
         # Customer satisfaction adjusted by returns
         result_df['adjusted_satisfaction'] = df['satisfaction'] * (1 - 0.5 * df['returns'])
     
-    # Count the number of non-null values per row as a measure of data completeness
-    result_df['data_completeness'] = df.notnull().sum(axis=1) / len(df.columns)
+    result_df['data_completeness'] = completeness
     
-    logger.info(f"Added {len(result_df.columns) - len(df.columns)} engineered features")
+    logger.info(f"Added {len(result_df.columns) - initial_columns} engineered features")
     return result_df
 
 
 @timer
-def preprocess_data(df: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
+def preprocess_data(df: pd.DataFrame, config: PipelineConfig, 
+                    state: Optional['PreprocessingState'] = None,
+                    profiler: Optional[PipelineProfiler] = None) -> pd.DataFrame:
     """
     Apply the full preprocessing pipeline to the data.
     
+    With config.inplace the steps mutate the input dataframe rather than
+    copying it at every step, so the caller should not reuse it afterwards.
+    
     Args:
         df: Input dataframe
         config: Pipeline configuration
+        state: Previously fitted state to apply instead of refitting
+        profiler: Profiler recording the run and each of its steps
         
     Returns:
         Preprocessed dataframe
     """
+    if profiler is None:
+        return _preprocess_data(df, config, state)
+    
+    with profiler.profile("preprocess_data", df) as record:
+        result = _preprocess_data(df, config, state, profiler)
+        record.record_output(result)
+    return result
+
+
+def _preprocess_data(df: pd.DataFrame, config: PipelineConfig, 
+                     state: Optional['PreprocessingState'] = None,
+                     profiler: Optional[PipelineProfiler] = None) -> pd.DataFrame:
+    """Run preprocess_data without the outer profiling step."""
+    if state is not None:
+        with performance_monitor("data_preprocessing"):
+            logger.info(f"Applying fitted preprocessing state to {len(df)} rows")
+            return state.transform(df)
+    
+    if config.chunked:
+        return preprocess_data_chunked(df, config, profiler)
+    
     with performance_monitor("data_preprocessing"):
         logger.info(f"Starting data preprocessing on {len(df)} rows and {len(df.columns)} columns")
+        cache = StageCache.from_config(config)
+        input_key = hash_dataframe(df) if cache else ""
+        df = run_preprocessing_steps(lambda: df, get_preprocessing_steps(), cache, input_key,
+                                     inplace=config.inplace, profiler=profiler)
+        logger.info(f"Completed preprocessing: {len(df)} rows and {len(df.columns)} columns")
+        return df
+
+
+def get_preprocessing_steps() -> List[Tuple[str, Callable[..., pd.DataFrame], Dict[str, Any]]]:
+    """
+    Define the preprocessing steps as (name, function, keyword arguments).
+    
+    Returns:
+        List of preprocessing steps
+    """
+    return [
+        ("Cleaning column names", clean_column_names, {}),
+        ("Removing duplicates", remove_duplicates, {}),
+        ("Handling missing values", handle_missing_values, {'strategy': 'median'}),
+        ("Handling outliers", detect_and_handle_outliers, {'method': 'iqr'}),
+        # Keyed on the current date since 'days_since' features depend on it
+        ("Creating date features", create_date_features, 
+         {'date_columns': ['registration_date'], '_cache_date': datetime.now().date()}),
+        ("Feature engineering", feature_engineering, {}),
+        ("Encoding categorical variables", encode_categorical_variables, {'encoding_method': 'onehot'}),
+        ("Normalizing features", normalize_features, {'method': 'standard'}),
+    ]
+
+
+def run_preprocessing_steps(load: Callable[[], pd.DataFrame], 
+                            steps: List[Tuple[str, Callable[..., pd.DataFrame], Dict[str, Any]]],
+                            cache: Optional[StageCache] = None, input_key: str = "",
+                            inplace: bool = False, 
+                            profiler: Optional[PipelineProfiler] = None) -> pd.DataFrame:
+    """
+    Apply preprocessing steps, resuming from the latest cached stage.
+    
+    Args:
+        load: Callable returning the input data, only called if no stage is cached
+        steps: Steps as returned by get_preprocessing_steps
+        cache: Stage cache (if None, every step runs)
+        input_key: Cache key of the data returned by load
+        inplace: Let steps mutate the frame returned by load instead of copying it
+        profiler: Profiler recording each step that runs
         
-        # Define preprocessing steps
-        preprocessing_steps = [
-            ("Cleaning column names", clean_column_names),
-            ("Removing duplicates", remove_duplicates),
-            ("Handling missing values", lambda x: handle_missing_values(x, strategy='median')),
-            ("Handling outliers", lambda x: detect_and_handle_outliers(x, method='iqr')),
-            ("Creating date features", lambda x: create_date_features(x, ['registration_date'] if 'registration_date' in df.columns else [])),
-            ("Feature engineering", feature_engineering),
-            ("Encoding categorical variables", lambda x: encode_categorical_variables(x, encoding_method='onehot')),
-            ("Normalizing features", lambda x: normalize_features(x, method='standard'))
-        ]
-        
-        # Apply each preprocessing step
-        for step_name, step_func in preprocessing_steps:
-            logger.info(f"Applying preprocessing step: {step_name}")
-            df = step_func(df)
+    Returns:
+        Preprocessed dataframe
+    """
+    keys: List[Optional[str]] = [None] * len(steps)
+    df = None
+    start = 0
+    if cache is not None:
+        key = input_key
+        for i, (step_name, step_func, step_kwargs) in enumerate(steps):
+            key = StageCache.stage_key(key, step_name, step_func, step_kwargs)
+            keys[i] = key
         
-        logger.info(f"Completed preprocessing: {len(df)} rows and {len(df.columns)} columns")
+        for i in reversed(range(len(steps))):
+            df = cache.get(keys[i])
+            if df is not None:
+                start = i + 1
+                logger.info(f"Loaded cached result of step: {steps[i][0]}")
+                break
+    
+    if df is None:
+        df = load()
+    
+    for (step_name, step_func, step_kwargs), key in zip(steps[start:], keys[start:]):
+        logger.info(f"Applying preprocessing step: {step_name}")
+        kwargs = {name: value for name, value in step_kwargs.items() if not name.startswith('_')}
+        if inplace and 'inplace' in inspect.signature(step_func).parameters:
+            kwargs['inplace'] = True
+        # Measuring the peak resets the process-wide peak RSS counter, so it
+        # is only done when the in-place mode's memory use was asked for
+        with peak_memory_monitor(step_name) if inplace else nullcontext():
+            if profiler is not None:
+                df = profiler.run(step_name, step_func, df, **kwargs)
+            else:
+                df = step_func(df, **kwargs)
+        if cache is not None:
+            cache.put(key, df)
+    
+    return df
+
+
+@timer
+def load_and_preprocess(config: PipelineConfig, 
+                        profiler: Optional[PipelineProfiler] = None) -> pd.DataFrame:
+    """
+    Load and preprocess data, skipping the load and every step whose
+    result is already in the stage cache.
+    
+    Database and API sources have no fingerprint (see source_fingerprint),
+    so their data is loaded on every call and the stages are cached by a
+    hash of the loaded data instead.
+    
+    Args:
+        config: Pipeline configuration
+        profiler: Profiler recording the load and each step that runs
+        
+    Returns:
+        Preprocessed dataframe
+    """
+    cache = StageCache.from_config(config)
+    source_key = source_fingerprint(config)
+    def load() -> pd.DataFrame:
+        if profiler is None:
+            return load_data_from_source(config)
+        return profiler.run("load_data_from_source", load_data_from_source, config)
+    
+    if cache is None or source_key is None:
+        return preprocess_data(load(), config, profiler=profiler)
+    
+    steps = get_chunked_preprocessing_steps(config) if config.chunked else get_preprocessing_steps()
+    with performance_monitor("data_preprocessing"):
+        return run_preprocessing_steps(load, steps, cache, source_key,
+                                       inplace=config.inplace, profiler=profiler)
+
+
+# -------------------------------------------------------------------------
+# Preprocessing State
+# -------------------------------------------------------------------------
+
+@dataclass
+class PreprocessingState:
+    """
+    Fitted parameters of the preprocessing pipeline.
+    
+    Captures imputation medians, IQR bounds, date reference, encoding
+    vocabularies and scaler parameters once, so new batches can be transformed
+    without refitting and without drifting from the training data.
+    """
+    medians: Dict[str, float] = field(default_factory=dict)
+    unknown_categories: List[str] = field(default_factory=list)
+    outlier_bounds: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    date_columns: List[str] = field(default_factory=list)
+    reference_date: datetime = field(default_factory=datetime.now)
+    onehot: Dict[str, List[Any]] = field(default_factory=dict)
+    label: Dict[str, List[Any]] = field(default_factory=dict)
+    scaler_mean: Dict[str, float] = field(default_factory=dict)
+    scaler_scale: Dict[str, float] = field(default_factory=dict)
+    
+    @classmethod
+    def fit(cls, df: pd.DataFrame, max_categories: int = 10,
+            reference_date: Optional[datetime] = None) -> 'PreprocessingState':
+        """
+        Fit every pipeline parameter on a dataframe.
+        
+        Args:
+            df: Training dataframe
+            max_categories: Maximum number of categories to one-hot encode
+            reference_date: Date used for the 'days_since' features (if None, now)
+            
+        Returns:
+            Fitted state
+        """
+        df = remove_duplicates(clean_column_names(df.copy(deep=False)))
+        state = fit_partition_params(df, max_categories, reference_date)
+        state.fit_scaler(state.transform_rows(df))
+        return state
+    
+    def fit_scaler(self, df: pd.DataFrame) -> None:
+        """Fit the standard scaler on the numerical columns of a transformed dataframe."""
+        columns = df.select_dtypes(include=['number']).columns.tolist()
+        self.scaler_mean, self.scaler_scale = {}, {}
+        if columns:
+            scaler = StandardScaler().fit(df[columns].fillna(0))
+            self.scaler_mean = dict(zip(columns, scaler.mean_.tolist()))
+            self.scaler_scale = dict(zip(columns, scaler.scale_.tolist()))
+    
+    def transform_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the row-local steps (imputation, outlier capping, date features,
+        feature engineering, encoding) with the fitted parameters.
+        
+        Args:
+            df: Dataframe or partition with cleaned column names
+            
+        Returns:
+            Transformed dataframe
+        """
+        result_df = df.copy()
+        
+        # Missing values
+        for col, median in self.medians.items():
+            if col in result_df.columns:
+                result_df[col] = result_df[col].fillna(median)
+        for col in result_df.select_dtypes(include=['object', 'category']).columns:
+            # Batches read from CSV/JSON hold object columns, not categoricals
+            if (col in self.unknown_categories and isinstance(result_df[col].dtype, pd.CategoricalDtype)
+                    and "Unknown" not in result_df[col].cat.categories):
+                result_df[col] = result_df[col].cat.add_categories("Unknown")
+            if result_df[col].isna().any():
+                result_df[col] = result_df[col].fillna("Unknown")
+        
+        # Outliers
+        for col, (lower_bound, upper_bound) in self.outlier_bounds.items():
+            if col in result_df.columns:
+                result_df[col] = result_df[col].clip(lower=lower_bound, upper=upper_bound)
+        
+        result_df = create_date_features(result_df, self.date_columns,
+                                         reference_date=self.reference_date, inplace=True)
+        result_df = feature_engineering(result_df, inplace=True)
+        
+        # Encoding against the fitted vocabularies, built in one concat
+        encoded = []
+        for col in result_df.select_dtypes(include=['object', 'category']).columns:
+            if col in self.onehot:
+                values = pd.Categorical(result_df[col], categories=self.onehot[col])
+                encoded.append(pd.get_dummies(pd.Series(values, index=result_df.index), prefix=col))
+            elif col in self.label:
+                values = pd.Categorical(result_df[col].astype(object), categories=self.label[col])
+                encoded.append(pd.Series(values.codes.astype(np.int64), index=result_df.index,
+                                         name=f"{col}_encoded"))
+        
+        result_df = result_df.drop(columns=[col for col in self.onehot if col in result_df.columns])
+        if encoded:
+            result_df = pd.concat([result_df] + encoded, axis=1)
+        
+        return result_df
+    
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize the fitted numerical columns of a transformed dataframe."""
+        columns = [col for col in self.scaler_mean if col in df.columns]
+        if columns:
+            df = df.copy()
+            mean = np.array([self.scaler_mean[col] for col in columns])
+            scale = np.array([self.scaler_scale[col] for col in columns])
+            df[columns] = (df[columns].fillna(0).to_numpy(dtype=float) - mean) / scale
         return df
+    
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the whole pipeline with the fitted parameters.
+        
+        Unlike preprocess_data, rows are never dropped, so the output lines up
+        with the input batch for scoring.
+        
+        Args:
+            df: Input dataframe
+            
+        Returns:
+            Preprocessed dataframe
+        """
+        df = clean_column_names(df.copy(deep=False))
+        return self.normalize(self.transform_rows(df))
+    
+    def save(self, path: str) -> None:
+        """Save the state as JSON."""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data['reference_date'] = self.reference_date.isoformat()
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=lambda o: o.item() if hasattr(o, 'item') else str(o))
+        logger.info(f"Saved preprocessing state to {path}")
+    
+    @classmethod
+    def load(cls, path: str) -> 'PreprocessingState':
+        """Load a state saved with save()."""
+        with open(path) as f:
+            data = json.load(f)
+        data['reference_date'] = datetime.fromisoformat(data['reference_date'])
+        data['outlier_bounds'] = {col: tuple(bounds) for col, bounds in data['outlier_bounds'].items()}
+        logger.info(f"Loaded preprocessing state from {path}")
+        return cls(**data)
+
+
+# -------------------------------------------------------------------------
+# Chunked Preprocessing Functions
+# -------------------------------------------------------------------------
+
+def fit_partition_params(df: pd.DataFrame, max_categories: int = 10,
+                         reference_date: Optional[datetime] = None) -> PreprocessingState:
+    """
+    Fit the global statistics used by the row-local preprocessing steps.
+    
+    Mirrors the serial pipeline (median imputation, IQR capping, date features,
+    one-hot encoding) so that partitions transformed with these parameters
+    match what the serial steps would produce on the whole dataframe.
+    
+    Args:
+        df: Input dataframe (column names cleaned, duplicates removed)
+        max_categories: Maximum number of categories to one-hot encode
+        reference_date: Date used for the 'days_since' features (if None, now)
+        
+    Returns:
+        State with every parameter fitted except the scaler
+    """
+    state = PreprocessingState(
+        date_columns=['registration_date'] if 'registration_date' in df.columns else [],
+        reference_date=reference_date or datetime.now(),
+    )
+    
+    numerical_cols = df.select_dtypes(include=['number']).columns
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    
+    for col in numerical_cols:
+        median = df[col].median()
+        state.medians[col] = median
+        
+        # IQR bounds are computed on the imputed column, as in the serial path
+        imputed = df[col].fillna(median)
+        if imputed.isna().mean() > 0.5:
+            continue
+        q1 = imputed.quantile(0.25)
+        q3 = imputed.quantile(0.75)
+        iqr = q3 - q1
+        state.outlier_bounds[col] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+    
+    for col in categorical_cols:
+        column = df[col]
+        if column.isna().any():
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                state.unknown_categories.append(col)
+                if "Unknown" not in column.cat.categories:
+                    column = column.cat.add_categories("Unknown")
+            column = column.fillna("Unknown")
+        
+        if column.nunique() <= max_categories:
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                state.onehot[col] = list(column.cat.categories)
+            else:
+                state.onehot[col] = sorted(column.unique())
+        else:
+            state.label[col] = sorted(column.astype(object).unique())
+    
+    return state
+
+
+@timer
+def transform_partitions(df: pd.DataFrame, n_cores: int, batch_size: int) -> pd.DataFrame:
+    """
+    Fit the global statistics on the whole dataframe and apply the row-local
+    steps per partition across a process pool.
+    
+    Args:
+        df: Input dataframe (column names cleaned, duplicates removed)
+        n_cores: Number of worker processes
+        batch_size: Rows per partition
+        
+    Returns:
+        Transformed dataframe, not yet normalized
+    """
+    state = fit_partition_params(df)
+    return parallelize_dataframe(df, state.transform_rows, n_cores=n_cores, batch_size=batch_size)
+
+
+def get_chunked_preprocessing_steps(config: PipelineConfig) -> List[Tuple[str, Callable[..., pd.DataFrame], Dict[str, Any]]]:
+    """
+    Define the steps of the chunked pipeline, in the format of get_preprocessing_steps.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Returns:
+        List of preprocessing steps
+    """
+    return [
+        ("Cleaning column names", clean_column_names, {}),
+        ("Removing duplicates", remove_duplicates, {}),
+        # Keyed on the current date since 'days_since' features depend on it
+        ("Transforming partitions", transform_partitions,
+         {'n_cores': config.num_processes, 'batch_size': config.batch_size,
+          '_cache_date': datetime.now().date()}),
+        ("Normalizing features", normalize_features, {'method': 'standard'}),
+    ]
+
+
+def preprocess_data_chunked(df: pd.DataFrame, config: PipelineConfig,
+                            profiler: Optional[PipelineProfiler] = None) -> pd.DataFrame:
+    """
+    Apply the preprocessing pipeline in partitions across a process pool.
+    
+    Duplicate removal and the fit of global statistics run once on the whole
+    dataframe; the row-local steps then run per partition of
+    config.batch_size rows on config.num_processes workers. Normalization is
+    fitted and applied on the concatenated result, since it is a single
+    vectorized operation that would not gain from another round trip
+    through the pool. Steps are cached and profiled as in preprocess_data.
+    
+    Args:
+        df: Input dataframe
+        config: Pipeline configuration
+        profiler: Profiler recording each step that runs
+        
+    Returns:
+        Preprocessed dataframe, identical to the serial preprocess_data output
+    """
+    with performance_monitor("chunked_data_preprocessing"):
+        logger.info(f"Starting chunked preprocessing on {len(df)} rows with "
+                    f"{config.num_processes} processes and batch size {config.batch_size}")
+        cache = StageCache.from_config(config)
+        input_key = hash_dataframe(df) if cache else ""
+        df = run_preprocessing_steps(lambda: df, get_chunked_preprocessing_steps(config), cache, input_key,
+                                     inplace=config.inplace, profiler=profiler)
+        logger.info(f"Completed chunked preprocessing: {len(df)} rows and {len(df.columns)} columns")
+        return df
+
+
+# -------------------------------------------------------------------------
+# Streaming Preprocessing Functions
+# -------------------------------------------------------------------------
+
+class RunningMoments:
+    """
+    Mergeable running moments of a numeric stream.
+    
+    Keeps count, mean, the central moment sums M2..M4, min and max, merged
+    with the pairwise update formulas of Chan and Pébay, so partial moments
+    from chunks or worker processes combine exactly (up to rounding).
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def update(self, values: Iterable[float]) -> None:
+        """Add a batch of values, ignoring NaNs."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        batch = RunningMoments()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        deviations = values - batch.mean
+        squared = deviations ** 2
+        batch.m2 = float(squared.sum())
+        batch.m3 = float((squared * deviations).sum())
+        batch.m4 = float((squared ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        self.merge(batch)
+    
+    def merge(self, other: 'RunningMoments') -> None:
+        """Combine another set of moments into this one."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return
+        n_a, n_b = self.count, other.count
+        total = n_a + n_b
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta ** 2 * n_a * n_b / total
+        m3 = (self.m3 + other.m3 
+              + delta ** 3 * n_a * n_b * (n_a - n_b) / total ** 2 
+              + 3 * delta * (n_a * other.m2 - n_b * self.m2) / total)
+        m4 = (self.m4 + other.m4 
+              + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / total ** 3 
+              + 6 * delta ** 2 * (n_a ** 2 * other.m2 + n_b ** 2 * self.m2) / total ** 2 
+              + 4 * delta * (n_a * other.m3 - n_b * self.m3) / total)
+        self.mean += delta * n_b / total
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count = total
+    
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0, as used by StandardScaler)."""
+        return self.m2 / self.count if self.count else float('nan')
+    
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+    
+    @property
+    def sample_std(self) -> float:
+        """Sample standard deviation (ddof=1, as reported by describe())."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float('nan')
+    
+    @property
+    def skew(self) -> float:
+        """Bias-corrected sample skewness, as computed by pandas."""
+        n = self.count
+        if n < 3 or self.m2 == 0:
+            return float('nan') if n < 3 else 0.0
+        return float(np.sqrt(n * (n - 1)) / (n - 2) * (self.m3 / n) / (self.m2 / n) ** 1.5)
+    
+    @property
+    def kurtosis(self) -> float:
+        """Bias-corrected excess kurtosis, as computed by pandas."""
+        n = self.count
+        if n < 4 or self.m2 == 0:
+            return float('nan') if n < 4 else 0.0
+        adjustment = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        return float(n * (n + 1) * (n - 1) * self.m4 / ((n - 2) * (n - 3) * self.m2 ** 2) - adjustment)
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch.
+    
+    Items are kept in a hierarchy of compactors where an item at level h stands
+    for 2**h observations, so memory stays around 3 * k items regardless of the
+    stream length while rank error stays around 1.7 / k.
+    """
+    
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.count = 0
+        self.compactors: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+    
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+    
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.compactors):
+            items = self.compactors[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                items = np.sort(items)
+                leftover = items[len(items) - len(items) % 2:]
+                promoted = items[self._rng.integers(2):len(items) - len(leftover):2]
+                self.compactors[level] = leftover
+                self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+            level += 1
+    
+    def update(self, values: Iterable[float]) -> None:
+        """Add a batch of values, ignoring NaNs."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+    
+    def add_weighted(self, value: float, weight: int) -> None:
+        """Add a single value observed `weight` times."""
+        if weight <= 0 or np.isnan(value):
+            return
+        self.count += weight
+        level = 0
+        while weight:
+            if weight & 1:
+                while level >= len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                self.compactors[level] = np.append(self.compactors[level], value)
+            weight >>= 1
+            level += 1
+        self._compress()
+    
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Combine another sketch into this one."""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.count += other.count
+        self._compress()
+    
+    def copy(self) -> 'QuantileSketch':
+        sketch = QuantileSketch(self.k)
+        sketch.count = self.count
+        sketch.compactors = [items.copy() for items in self.compactors]
+        sketch._rng = np.random.default_rng(self._rng.integers(2 ** 32))
+        return sketch
+    
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile of everything added so far."""
+        if self.count == 0:
+            return float('nan')
+        values = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype=float)
+                                  for level, items in enumerate(self.compactors)])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(values[order][min(index, len(values) - 1)])
+
+
+def fit_streaming_params(chunks: Iterable[pd.DataFrame], max_categories: int = 10,
+                         reference_date: Optional[datetime] = None) -> PreprocessingState:
+    """
+    Fit the row-local preprocessing parameters over a stream of chunks.
+    
+    Equivalent to fit_partition_params, with medians and IQR bounds estimated
+    from mergeable quantile sketches.
+    
+    Args:
+        chunks: Iterable of dataframe chunks
+        max_categories: Maximum number of categories to one-hot encode
+        reference_date: Date used for the 'days_since' features (if None, now)
+        
+    Returns:
+        State with every parameter fitted except the scaler
+    """
+    sketches: Dict[str, QuantileSketch] = {}
+    null_counts: Dict[str, int] = {}
+    row_counts: Dict[str, int] = {}
+    vocabularies: Dict[str, Set[Any]] = {}
+    categorical_dtypes: Dict[str, pd.CategoricalDtype] = {}
+    date_columns: List[str] = []
+    
+    for chunk in chunks:
+        chunk = remove_duplicates(clean_column_names(chunk))
+        if 'registration_date' in chunk.columns and not date_columns:
+            date_columns.append('registration_date')
+        
+        for col in chunk.select_dtypes(include=['number']).columns:
+            sketches.setdefault(col, QuantileSketch(seed=0)).update(chunk[col].to_numpy(dtype=float))
+            null_counts[col] = null_counts.get(col, 0) + int(chunk[col].isna().sum())
+            row_counts[col] = row_counts.get(col, 0) + len(chunk)
+        
+        for col in chunk.select_dtypes(include=['object', 'category']).columns:
+            if isinstance(chunk[col].dtype, pd.CategoricalDtype):
+                categorical_dtypes[col] = chunk[col].dtype
+            values = vocabularies.setdefault(col, set())
+            values.update(chunk[col].dropna().unique())
+            if chunk[col].isna().any():
+                values.add("Unknown")
+                null_counts[col] = null_counts.get(col, 0) + 1
+    
+    state = PreprocessingState(date_columns=date_columns,
+                               reference_date=reference_date or datetime.now())
+    
+    for col, sketch in sketches.items():
+        median = sketch.quantile(0.5)
+        state.medians[col] = median
+        
+        # Missing values are imputed with the median before outlier detection
+        imputed = sketch.copy()
+        imputed.add_weighted(median, null_counts[col])
+        if imputed.count <= 0.5 * row_counts[col]:
+            continue
+        q1 = imputed.quantile(0.25)
+        q3 = imputed.quantile(0.75)
+        iqr = q3 - q1
+        state.outlier_bounds[col] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+    
+    for col, values in vocabularies.items():
+        if col in categorical_dtypes and null_counts.get(col):
+            state.unknown_categories.append(col)
+        if len(values) <= max_categories:
+            if col in categorical_dtypes:
+                categories = list(categorical_dtypes[col].categories)
+                state.onehot[col] = categories + (["Unknown"] if "Unknown" in values and "Unknown" not in categories else [])
+            else:
+                state.onehot[col] = sorted(values)
+        else:
+            state.label[col] = sorted(values)
+    
+    return state
+
+
+@timer
+def preprocess_data_streaming(config: PipelineConfig) -> str:
+    """
+    Preprocess a source out of core, writing the result chunk by chunk.
+    
+    The source is read three times: once to fit imputation, outlier and
+    encoding parameters, once to accumulate standardization moments of the
+    transformed columns, and once to transform, standardize and append each
+    chunk to the output file. Peak memory is bounded by config.batch_size.
+    Duplicates are only removed within a chunk.
+    
+    Args:
+        config: Pipeline configuration
+        
+    Returns:
+        Path of the preprocessed CSV file
+    """
+    with performance_monitor("streaming_data_preprocessing"):
+        output_file = os.path.join(config.output_path, "preprocessed_data.csv")
+        logger.info(f"Starting streaming preprocessing to {output_file} "
+                    f"with chunk size {config.batch_size}")
+        
+        def transformed_chunks(state: PreprocessingState) -> Generator[pd.DataFrame, None, None]:
+            for chunk in stream_data_from_source(config):
+                chunk = remove_duplicates(clean_column_names(chunk))
+                yield state.transform_rows(chunk)
+        
+        state = fit_streaming_params(stream_data_from_source(config))
+        
+        moments: Dict[str, RunningMoments] = {}
+        for chunk in transformed_chunks(state):
+            for col in chunk.select_dtypes(include=['number']).columns:
+                moments.setdefault(col, RunningMoments()).update(chunk[col].fillna(0))
+        for col, col_moments in moments.items():
+            state.scaler_mean[col] = col_moments.mean
+            state.scaler_scale[col] = col_moments.std if col_moments.std > 0 else 1.0
+        
+        total_rows = 0
+        for i, chunk in enumerate(transformed_chunks(state)):
+            chunk = state.normalize(chunk)
+            chunk.to_csv(output_file, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+            total_rows += len(chunk)
+        
+        logger.info(f"Completed streaming preprocessing: {total_rows} rows written to {output_file}")
+        return output_file
+
+
+# -------------------------------------------------------------------------
+# Approximate Summary Statistics
+# -------------------------------------------------------------------------
+
+class HyperLogLog:
+    """
+    Mergeable HyperLogLog distinct-count sketch.
+    
+    Uses 2**precision one-byte registers (16 KB at the default precision 14)
+    for a standard error of about 1.04 / sqrt(2**precision), i.e. 0.8%.
+    """
+    
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+    
+    def update(self, values: Union[pd.Series, np.ndarray]) -> None:
+        """Add a batch of values, ignoring nulls."""
+        values = pd.Series(values).dropna()
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(values.to_numpy())
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << width) - 1)
+        
+        # Exact bit length of the remainder, computed on 32-bit halves so the
+        # conversion to float is lossless
+        high = (remainder >> np.uint64(32)).astype(np.float64)
+        low = (remainder & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        bit_length = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+    
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Combine another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+    
+    def count(self) -> int:
+        """Estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class SummarySketch:
+    """
+    Single-pass, mergeable summary of a dataframe.
+    
+    Numerical columns keep running moments and a KLL quantile sketch,
+    categorical columns keep exact value counts (which also give their exact
+    distinct count), and all other columns keep a HyperLogLog distinct count. Sketches built on separate chunks or in
+    separate processes can be merged, so summaries can be computed over
+    streamed or partitioned data. Counts, means, moments, min and max merge
+    exactly; quantiles and distinct counts carry the sketches' bounded error.
+    """
+    
+    def __init__(self, k: int = 200, hll_precision: int = 14):
+        self.k = k
+        self.hll_precision = hll_precision
+        self.row_count = 0
+        self.dtypes: Dict[str, str] = {}
+        self.missing: Dict[str, int] = {}
+        self.moments: Dict[str, RunningMoments] = {}
+        self.quantiles: Dict[str, QuantileSketch] = {}
+        self.value_counts: Dict[str, Dict[Any, int]] = {}
+        self.distinct: Dict[str, HyperLogLog] = {}
+    
+    def update(self, df: pd.DataFrame) -> None:
+        """Add a chunk of rows to the summary."""
+        self.row_count += len(df)
+        numerical_cols = set(df.select_dtypes(include=['number']).columns)
+        categorical_cols = set(df.select_dtypes(include=['object', 'category']).columns)
+        
+        for col in df.columns:
+            column = df[col]
+            self.dtypes.setdefault(col, str(column.dtype))
+            
+            if col in categorical_cols:
+                value_counts = column.value_counts()
+                self.missing[col] = self.missing.get(col, 0) + len(column) - int(value_counts.sum())
+                counts = self.value_counts.setdefault(col, {})
+                for value, count in value_counts.items():
+                    counts[value] = counts.get(value, 0) + int(count)
+                continue
+            
+            if col in numerical_cols:
+                values = column.to_numpy(dtype=float, na_value=np.nan)
+                values = values[~np.isnan(values)]
+                self.missing[col] = self.missing.get(col, 0) + len(column) - len(values)
+                self.moments.setdefault(col, RunningMoments()).update(values)
+                self.quantiles.setdefault(col, QuantileSketch(self.k, seed=0)).update(values)
+            else:
+                values = column.dropna().to_numpy()
+                self.missing[col] = self.missing.get(col, 0) + len(column) - len(values)
+            self.distinct.setdefault(col, HyperLogLog(self.hll_precision)).update(values)
+    
+    def merge(self, other: 'SummarySketch') -> None:
+        """Combine another summary into this one."""
+        self.row_count += other.row_count
+        for col, dtype in other.dtypes.items():
+            self.dtypes.setdefault(col, dtype)
+        for col, missing in other.missing.items():
+            self.missing[col] = self.missing.get(col, 0) + missing
+        for col, moments in other.moments.items():
+            self.moments.setdefault(col, RunningMoments()).merge(moments)
+        for col, sketch in other.quantiles.items():
+            self.quantiles.setdefault(col, QuantileSketch(self.k, seed=0)).merge(sketch)
+        for col, sketch in other.distinct.items():
+            self.distinct.setdefault(col, HyperLogLog(self.hll_precision)).merge(sketch)
+        for col, counts in other.value_counts.items():
+            merged = self.value_counts.setdefault(col, {})
+            for value, count in counts.items():
+                merged[value] = merged.get(value, 0) + count
+    
+    def to_summary(self) -> Dict[str, Any]:
+        """
+        Build a summary in the layout returned by compute_summary_statistics.
+        
+        Returns:
+            Dictionary of summary statistics
+        """
+        summary: Dict[str, Any] = {}
+        summary['row_count'] = self.row_count
+        summary['column_count'] = len(self.dtypes)
+        
+        type_counts: Dict[str, int] = {}
+        for dtype in self.dtypes.values():
+            type_counts[dtype] = type_counts.get(dtype, 0) + 1
+        summary['data_types'] = type_counts
+        
+        total_missing = sum(self.missing.values())
+        summary['missing_values'] = {
+            'total_missing': total_missing,
+            'percent_missing': (sum(count / self.row_count * 100 for count in self.missing.values()) 
+                                / len(self.dtypes)) if self.row_count and self.dtypes else 0.0,
+            'columns_with_missing': {col: count for col, count in self.missing.items() if count > 0}
+        }
+        
+        if self.moments:
+            numerical_stats: Dict[str, Dict[str, float]] = {
+                stat: {} for stat in ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+            }
+            for col, moments in self.moments.items():
+                sketch = self.quantiles[col]
+                numerical_stats['count'][col] = float(moments.count)
+                numerical_stats['mean'][col] = moments.mean if moments.count else float('nan')
+                numerical_stats['std'][col] = moments.sample_std
+                numerical_stats['min'][col] = moments.min if moments.count else float('nan')
+                numerical_stats['25%'][col] = sketch.quantile(0.25)
+                numerical_stats['50%'][col] = sketch.quantile(0.5)
+                numerical_stats['75%'][col] = sketch.quantile(0.75)
+                numerical_stats['max'][col] = moments.max if moments.count else float('nan')
+            summary['numerical_stats'] = numerical_stats
+            summary['skew'] = {col: moments.skew for col, moments in self.moments.items()}
+            summary['kurtosis'] = {col: moments.kurtosis for col, moments in self.moments.items()}
+        
+        if self.value_counts:
+            summary['categorical_stats'] = {
+                col: dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+                for col, counts in self.value_counts.items()
+            }
+        
+        summary['distinct_counts'] = {
+            col: len(self.value_counts[col]) if col in self.value_counts else self.distinct[col].count()
+            for col in self.dtypes
+        }
+        return summary
+
+
+def _summarize_partition(df: pd.DataFrame) -> SummarySketch:
+    """Build the summary sketch of one partition (runs in a worker process)."""
+    sketch = SummarySketch()
+    sketch.update(df)
+    return sketch
+
+
+def compute_summary_statistics_partitioned(chunks: Iterable[pd.DataFrame], 
+                                           n_cores: int = 1) -> Dict[str, Any]:
+    """
+    Compute approximate summary statistics over chunks, in parallel when
+    n_cores > 1, by merging per-chunk summary sketches.
+    
+    Args:
+        chunks: Iterable of dataframe chunks, e.g. from stream_data_from_source
+        n_cores: Number of worker processes
+        
+    Returns:
+        Dictionary of summary statistics
+    """
+    summary = SummarySketch()
+    if n_cores > 1:
+        with ProcessPoolExecutor(max_workers=n_cores) as executor:
+            for partial_summary in executor.map(_summarize_partition, chunks):
+                summary.merge(partial_summary)
+    else:
+        for chunk in chunks:
+            summary.update(chunk)
+    return summary.to_summary()
 
 
 # -------------------------------------------------------------------------
 # Analysis and Modeling Functions
 # -------------------------------------------------------------------------
 
-def compute_summary_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+def compute_summary_statistics(df: pd.DataFrame, approximate: bool = False) -> Dict[str, Any]:
     """
     Compute summary statistics for the dataset.
     
     Args:
         df: Input dataframe
+        approximate: Use the single-pass SummarySketch (sketched quantiles and
+            distinct counts) instead of describe(), skew() and kurtosis()
         
     Returns:
         Dictionary of summary statistics
     """
+    if approximate:
+        return compute_summary_statistics_partitioned([df])
+    
     summary = {}
     
     # Basic counts
@@ -751,8 +2521,9 @@ def compute_summary_statistics(df: pd.DataFrame) -> Dict[str, Any]:
     summary['column_count'] = len(df.columns)
     
     # Data types
-    type_counts = df.dtypes.value_counts().to_dict()
-    summary['data_types'] = {str(k): v for k, v in type_counts.items()}
+    # Counted by name, since categorical dtypes with different categories
+    # are distinct keys that would all be reported as 'category'
+    summary['data_types'] = df.dtypes.astype(str).value_counts().to_dict()
     
     # Missing values
     missing = df.isnull().sum()
@@ -780,4 +2551,7 @@ def compute_summary_statistics(df: pd.DataFrame) -> Dict[str, Any]:
     if not categorical_cols.empty:
         cat_stats = {}
         for col in categorical_cols:
-            cat_stats[col] = df[col].value_counts().to_dict()
\ No newline at end of file
+            cat_stats[col] = df[col].value_counts().to_dict()
+        summary['categorical_stats'] = cat_stats
+    
+    return summary
@@ -0,0 +1,167 @@
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app import (PipelineConfig, _read_peak_rss_mb, compute_summary_statistics,
+                 generate_synthetic_data, logger, preprocess_data)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_MODES = ["serial", "chunked"]
+STAGES = ["generate_synthetic_data", "preprocess_data", "compute_summary_statistics"]
+
+
+def git_revision() -> Optional[str]:
+    """Return the current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(func: Callable, *args, **kwargs) -> Tuple[Any, float, Optional[float]]:
+    """
+    Run a function and measure its wall time and the peak RSS of this process.
+
+    Memory used by pool workers in chunked mode is not included.
+
+    Returns:
+        Tuple of (result, seconds, peak RSS in MB)
+    """
+    _read_peak_rss_mb(reset=True)
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    return result, elapsed, _read_peak_rss_mb()
+
+
+def run_benchmark(size: int, mode: str, num_processes: int, batch_size: int,
+                  seed: int) -> List[Dict[str, Any]]:
+    """
+    Run generate -> preprocess -> summarize once on synthetic data.
+
+    Args:
+        size: Number of synthetic rows
+        mode: 'serial' or 'chunked'
+        num_processes: Worker processes for chunked mode
+        batch_size: Rows per partition for chunked mode
+        seed: Random seed for the synthetic data
+
+    Returns:
+        One result per stage
+    """
+    config = PipelineConfig(
+        output_path="",
+        sample_size=size,
+        random_seed=seed,
+        num_processes=num_processes,
+        batch_size=batch_size,
+        cache_results=False,
+        chunked=(mode == "chunked"),
+    )
+
+    results = []
+    df = None
+    for stage in STAGES:
+        if stage == "generate_synthetic_data":
+            df, elapsed, peak = measure(generate_synthetic_data, config)
+        elif stage == "preprocess_data":
+            df, elapsed, peak = measure(preprocess_data, df, config)
+        else:
+            _, elapsed, peak = measure(compute_summary_statistics, df)
+
+        results.append({
+            "size": size,
+            "mode": mode,
+            "stage": stage,
+            "seconds": elapsed,
+            "rows_per_second": size / elapsed if elapsed > 0 else None,
+            "peak_rss_mb": peak,
+        })
+    return results
+
+
+def load_history(path: str) -> List[Dict[str, Any]]:
+    """Load the benchmark history file, or an empty history if it does not exist."""
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def previous_results(history: List[Dict[str, Any]]) -> Dict[Tuple[int, str, str], Dict[str, Any]]:
+    """Index the most recent result of each (size, mode, stage) in the history."""
+    latest = {}
+    for run in history:
+        for result in run["results"]:
+            latest[(result["size"], result["mode"], result["stage"])] = result
+    return latest
+
+
+def print_results(results: List[Dict[str, Any]],
+                  previous: Dict[Tuple[int, str, str], Dict[str, Any]]) -> None:
+    """Print a results table, with the throughput change against the previous run."""
+    print(f"{'rows':>10} {'mode':<8} {'stage':<28} {'seconds':>9} {'rows/s':>12} {'peak MB':>9} {'vs prev':>8}")
+    for result in results:
+        change = ""
+        before = previous.get((result["size"], result["mode"], result["stage"]))
+        if before and before.get("rows_per_second") and result["rows_per_second"]:
+            change = f"{result['rows_per_second'] / before['rows_per_second'] - 1:+.1%}"
+        peak = f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "-"
+        print(f"{result['size']:>10} {result['mode']:<8} {result['stage']:<28} "
+              f"{result['seconds']:>9.3f} {result['rows_per_second'] or 0:>12,.0f} {peak:>9} {change:>8}")
+
+
+def main():
+    """Main function to parse arguments and run the benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmark the DAY63 data pipeline on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Dataset sizes in rows (default: 10k 100k 1M 10M)")
+    parser.add_argument("--modes", nargs="+", choices=DEFAULT_MODES, default=DEFAULT_MODES,
+                        help="Preprocessing modes to compare (default: serial chunked)")
+    parser.add_argument("--processes", type=int, default=PipelineConfig.num_processes,
+                        help="Worker processes for chunked mode")
+    parser.add_argument("--batch-size", type=int, default=100_000,
+                        help="Rows per partition for chunked mode (default: 100000)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--history", default="benchmark_history.json",
+                        help="JSON file the results are appended to (default: benchmark_history.json)")
+    args = parser.parse_args()
+
+    # Keep the pipeline's own logging out of the measurements
+    logger.setLevel(logging.WARNING)
+
+    results = []
+    for size in args.sizes:
+        for mode in args.modes:
+            print(f"Running {mode} benchmark on {size} rows...", file=sys.stderr)
+            results.extend(run_benchmark(size, mode, args.processes, args.batch_size, args.seed))
+
+    history = load_history(args.history)
+    print_results(results, previous_results(history))
+
+    history.append({
+        "timestamp": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "cpu_count": os.cpu_count(),
+        "processes": args.processes,
+        "batch_size": args.batch_size,
+        "results": results,
+    })
+    with open(args.history, "w") as f:
+        json.dump(history, f, indent=2)
+    print(f"Results appended to {args.history}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
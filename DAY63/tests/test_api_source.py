@@ -0,0 +1,111 @@
+"""
+Tests for the paginated API source, against a local stub server.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+import app
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves pages of three records; later pages answer first."""
+
+    def do_GET(self):
+        server = self.server
+        page = int(parse_qs(urlparse(self.path).query)["page"][0])
+        with server.lock:
+            server.requests.append(page)
+            failures = server.failures.get(page, 0)
+            if failures:
+                server.failures[page] = failures - 1
+        if failures:
+            self._send(500, {"error": "unavailable"})
+            return
+        # Earlier pages are slower, so responses arrive out of order
+        threading.Event().wait(max(0, server.pages - page) * 0.02)
+        records = [{"page": page, "item": i} for i in range(3)] if page <= server.pages else []
+        self._send(200, {"data": records})
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPaginatedApiSource(unittest.TestCase):
+    """Test cases for fetching a paginated API."""
+
+    def setUp(self):
+        """Start the stub server."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.failures = {}
+        self.server.pages = 5
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.output_dir = tempfile.mkdtemp()
+        # Retries are not delayed in tests
+        patcher = mock.patch("app.time.sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Stop the stub server."""
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.output_dir)
+
+    def config(self, **kwargs):
+        return app.PipelineConfig(
+            data_source=app.DataSource.API, api_paginated=True, api_concurrency=4, output_path=self.output_dir,
+            api_url="http://127.0.0.1:%d/records" % self.server.server_address[1], **kwargs
+        )
+
+    def test_pages_in_order(self):
+        """Test that pages are returned in page order and fetching stops at the first empty page."""
+        df = app.load_data_from_source(self.config())
+        self.assertEqual(df["page"].tolist(), [page for page in range(1, 6) for _ in range(3)])
+        self.assertEqual(df["item"].tolist(), [0, 1, 2] * 5)
+        self.assertIn(6, self.server.requests)
+
+    def test_max_pages(self):
+        """Test that no more than api_max_pages pages are requested."""
+        pages = list(app.stream_api_pages(self.config(api_max_pages=2, api_first_page=2)))
+        self.assertEqual([page["page"].iloc[0] for page in pages], [2, 3])
+        self.assertEqual(sorted(self.server.requests), [2, 3])
+
+    def test_failed_page_is_retried(self):
+        """Test that a page that fails once is fetched again, on its own."""
+        self.server.failures[3] = 1
+        df = app.load_data_from_source(self.config())
+        self.assertEqual(df["page"].unique().tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(self.server.requests.count(3), 2)
+        self.assertEqual(self.server.requests.count(1), 1)
+
+    def test_failing_page_raises_after_three_attempts(self):
+        """Test that a page that keeps failing is tried three times, then raises."""
+        self.server.failures[2] = 100
+        with self.assertRaises(requests.HTTPError):
+            app.load_data_from_source(self.config())
+        self.assertEqual(self.server.requests.count(2), 3)
+        self.assertEqual(self.server.requests.count(1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for the database source, against a SQLite file.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import pandas as pd
+
+import app
+
+
+class TestDatabaseSource(unittest.TestCase):
+    """Test cases for query building and chunked database reads."""
+
+    def setUp(self):
+        """Create a SQLite database with a small customers table."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "customers.sqlite")
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("CREATE TABLE customers (id INTEGER, city TEXT, income REAL, churned INTEGER)")
+            conn.execute("CREATE TABLE empty (id INTEGER, city TEXT)")
+            conn.executemany("INSERT INTO customers VALUES (?, ?, ?, ?)", [
+                (i, ["Paris", "Oslo", "Lima", None][i % 4], 1000.0 * i, i % 2) for i in range(25)
+            ])
+        conn.close()
+
+    def tearDown(self):
+        """Dispose of the pooled engine and clean up."""
+        app.get_db_engine(f"sqlite:///{self.path}").dispose()
+        app.get_db_engine.cache_clear()
+        shutil.rmtree(self.temp_dir)
+
+    def config(self, **kwargs):
+        kwargs.setdefault('db_table', "customers")
+        return app.PipelineConfig(data_source=app.DataSource.DATABASE, output_path=self.temp_dir,
+                                  db_connection_string=f"sqlite:///{self.path}", **kwargs)
+
+    def read(self, config):
+        chunks = list(app.stream_database_chunks(config))
+        return chunks, pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+    def test_engine_is_shared(self):
+        """Test that runs with the same connection string share one engine."""
+        self.assertIs(app.get_db_engine(f"sqlite:///{self.path}"), app.get_db_engine(f"sqlite:///{self.path}"))
+
+    def test_filters_and_features_are_pushed_down(self):
+        """Test the projection and every filter form, with values bound as parameters."""
+        config = self.config(features=["id", "income"], target="churned", db_filters={
+            "city": ["Paris", "Oslo"],
+            "income": (">=", 4000),
+            "churned": 0,
+        })
+        query = app.build_database_query(config, app.get_db_engine(config.db_connection_string))
+        compiled = query.compile()
+        sql = str(compiled)
+
+        self.assertEqual([column.name for column in query.selected_columns], ["id", "income", "churned"])
+        self.assertNotIn("Paris", sql)
+        self.assertNotIn("4000", sql)
+        self.assertIn(4000, compiled.params.values())
+        self.assertIn(0, compiled.params.values())
+
+        _, df = self.read(config)
+        self.assertEqual(list(df.columns), ["id", "income", "churned"])
+        self.assertEqual(df["id"].tolist(), [4, 8, 12, 16, 20, 24])
+
+    def test_null_and_comparison_filters(self):
+        """Test IS NULL filters and comparison operators."""
+        _, df = self.read(self.config(db_filters={"city": None, "id": ("<", 12)}))
+        self.assertEqual(df["id"].tolist(), [3, 7, 11])
+        self.assertTrue(df["city"].isna().all())
+
+    def test_filter_values_are_not_interpolated(self):
+        """Test that a filter value containing SQL is matched literally."""
+        _, df = self.read(self.config(db_filters={"city": "Paris' OR '1'='1"}))
+        self.assertTrue(df.empty)
+
+    def test_unknown_columns_are_rejected(self):
+        """Test that features and filters must name existing columns."""
+        with self.assertRaises(ValueError):
+            self.read(self.config(features=["missing"]))
+        with self.assertRaises(ValueError):
+            self.read(self.config(db_filters={"missing": 1}))
+
+    def test_chunked_streaming(self):
+        """Test that the table is read in batch_size chunks."""
+        chunks, df = self.read(self.config(batch_size=10))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertEqual(df["id"].tolist(), list(range(25)))
+        self.assertEqual(len(app.load_data_from_source(self.config(batch_size=10))), 25)
+
+    def test_empty_table(self):
+        """Test reading a table without rows."""
+        chunks, df = self.read(self.config(db_table="empty"))
+        self.assertTrue(all(chunk.empty for chunk in chunks))
+        self.assertTrue(df.empty)
+        self.assertTrue(app.load_data_from_source(self.config(db_table="empty")).empty)
+
+    def test_missing_settings(self):
+        """Test that the connection string and table are required."""
+        with self.assertRaises(ValueError):
+            list(app.stream_database_chunks(self.config(db_table="")))
+
+
+if __name__ == '__main__':
+    unittest.main()
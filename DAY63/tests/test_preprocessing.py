@@ -0,0 +1,146 @@
+"""
+Tests for the fitted preprocessing pipeline.
+"""
+
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from dataclasses import replace
+from unittest import mock
+
+import pandas as pd
+
+import app
+
+
+class TestPreprocessingState(unittest.TestCase):
+    """Test cases for PreprocessingState."""
+
+    def setUp(self):
+        """Fit the pipeline on a small synthetic dataset."""
+        self.output_dir = tempfile.mkdtemp()
+        self.config = app.PipelineConfig(output_path=self.output_dir, sample_size=500)
+        self.data = app.generate_synthetic_data(self.config)
+        self.state = app.PreprocessingState.fit(self.data)
+
+    def tearDown(self):
+        """Clean up the output directory."""
+        shutil.rmtree(self.output_dir)
+
+    def test_transform_object_batch(self):
+        """Test scoring a batch whose columns were read back as object dtype."""
+        self.assertTrue(self.state.unknown_categories)
+        batch = self.data.head(50).copy()
+        for col in batch.select_dtypes(include=['category']).columns:
+            batch[col] = batch[col].astype(object)
+        batch.loc[batch.index[0], self.state.unknown_categories[0]] = None
+
+        result = self.state.transform(batch)
+        expected = self.state.transform(self.data.head(50))
+
+        self.assertEqual(len(result), 50)
+        self.assertEqual(list(result.columns), list(expected.columns))
+
+    def test_peak_rss_is_only_reset_in_place(self):
+        """Test that the process-wide peak RSS counter is left alone unless running in place."""
+        steps = app.get_preprocessing_steps()
+        with mock.patch("app._read_peak_rss_mb", return_value=None) as read_peak:
+            app.run_preprocessing_steps(lambda: self.data.copy(), steps)
+            self.assertFalse(read_peak.called)
+            app.run_preprocessing_steps(lambda: self.data.copy(), steps, inplace=True)
+            read_peak.assert_any_call(reset=True)
+
+
+class TestChunkedPreprocessing(unittest.TestCase):
+    """Test cases for preprocess_data_chunked."""
+
+    def setUp(self):
+        """Generate a seeded synthetic dataset."""
+        self.output_dir = tempfile.mkdtemp()
+        self.config = app.PipelineConfig(output_path=self.output_dir, sample_size=400, random_seed=7,
+                                         num_processes=2, batch_size=150)
+        self.data = app.generate_synthetic_data(self.config)
+
+    def tearDown(self):
+        """Clean up the output directory."""
+        shutil.rmtree(self.output_dir)
+
+    def test_matches_serial_output(self):
+        """Test that the chunked pipeline returns what preprocess_data returns."""
+        config = replace(self.config, chunked=True, cache_results=False)
+        expected = app.preprocess_data(self.data.copy(), self.config)
+        result = app.preprocess_data(self.data.copy(), config)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_cached_and_profiled(self):
+        """Test that chunked steps are profiled and served from the stage cache on a rerun."""
+        config = replace(self.config, chunked=True)
+        profiler = app.PipelineProfiler(trace_memory=False)
+        first = app.preprocess_data(self.data.copy(), config, profiler=profiler)
+        steps = [name for name, _, _ in app.get_chunked_preprocessing_steps(config)]
+        self.assertEqual([record.name for record in profiler.records], ["preprocess_data"] + steps)
+
+        rerun = app.PipelineProfiler(trace_memory=False)
+        with mock.patch("app.parallelize_dataframe") as parallelize:
+            second = app.preprocess_data(self.data.copy(), config, profiler=rerun)
+        self.assertFalse(parallelize.called)
+        self.assertEqual([record.name for record in rerun.records], ["preprocess_data"])
+        pd.testing.assert_frame_equal(second, first)
+
+
+class TestPipelineProfiler(unittest.TestCase):
+    """Test cases for PipelineProfiler."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up the output directory."""
+        shutil.rmtree(self.output_dir)
+
+    def test_every_step_reports_time_and_memory(self):
+        """Test that a profiled run records wall time and peak memory for the load and every step."""
+        config = app.PipelineConfig(output_path=self.output_dir, sample_size=300, cache_results=False)
+        profiler = app.PipelineProfiler()
+        app.load_and_preprocess(config, profiler=profiler)
+
+        steps = [name for name, _, _ in app.get_preprocessing_steps()]
+        self.assertEqual([record.name for record in profiler.records],
+                         ["load_data_from_source", "preprocess_data"] + steps)
+        for record in profiler.to_dict():
+            self.assertGreater(record['wall_time'], 0, record['name'])
+            self.assertGreater(record['peak_memory_mb'], 0, record['name'])
+        parent = profiler.records[1]
+        for record in profiler.records[2:]:
+            self.assertEqual(record.depth, 1)
+            self.assertLessEqual(record.peak_memory_mb, parent.peak_memory_mb)
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+class TestSyntheticData(unittest.TestCase):
+    """Test cases for synthetic data generation."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up the output directory."""
+        shutil.rmtree(self.output_dir)
+
+    def test_small_chunks(self):
+        """Test chunk sizes so small that the fitted quintile edges repeat."""
+        config = app.PipelineConfig(output_path=self.output_dir, sample_size=30)
+        for chunk_size in (1, 2, 3):
+            df = pd.concat(app.generate_synthetic_data_chunks(config, chunk_size))
+            self.assertEqual(len(df), 30)
+            self.assertEqual(list(df['income_bracket'].cat.categories),
+                             ['Very Low', 'Low', 'Medium', 'High', 'Very High'])
+            for col in ('recency_score', 'frequency_score', 'monetary_score'):
+                self.assertTrue(df[col].between(1, 5).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
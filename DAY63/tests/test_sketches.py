@@ -0,0 +1,187 @@
+"""
+Tests for the mergeable sketches behind streamed and approximate statistics.
+"""
+
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import app
+
+
+# Rank error allowed for QuantileSketch(k=200), about twice its expected 1.7 / k
+RANK_ERROR = 0.02
+
+# Relative error allowed for HyperLogLog(14), three times its standard error
+DISTINCT_ERROR = 3 * 1.04 / np.sqrt(2 ** 14)
+
+
+def assert_rank_within(test, values, estimate, q):
+    """Assert that an estimated q-quantile of values is within the allowed rank error."""
+    test.assertLessEqual(np.mean(values < estimate), q + RANK_ERROR)
+    test.assertGreaterEqual(np.mean(values <= estimate), q - RANK_ERROR)
+
+
+class TestRunningMoments(unittest.TestCase):
+    """Test cases for RunningMoments."""
+
+    def setUp(self):
+        """Draw skewed values and split them into uneven partitions."""
+        rng = np.random.default_rng(0)
+        self.values = rng.lognormal(size=10000)
+        self.partitions = np.split(self.values, [1, 700, 4000, 4001, 9000])
+
+    def test_merged_partitions_match_single_pass(self):
+        """Test that merged partition moments equal the moments of one pass."""
+        single = app.RunningMoments()
+        single.update(self.values)
+        merged = app.RunningMoments()
+        for partition in self.partitions:
+            moments = app.RunningMoments()
+            moments.update(partition)
+            merged.merge(moments)
+
+        self.assertEqual(merged.count, single.count)
+        self.assertEqual(merged.min, single.min)
+        self.assertEqual(merged.max, single.max)
+        for name in ('mean', 'm2', 'm3', 'm4', 'std', 'skew', 'kurtosis'):
+            self.assertAlmostEqual(getattr(merged, name) / getattr(single, name), 1.0, places=9, msg=name)
+
+    def test_matches_pandas(self):
+        """Test the moments against numpy and pandas, ignoring NaNs."""
+        moments = app.RunningMoments()
+        for partition in self.partitions:
+            moments.update(np.append(partition, np.nan))
+        series = pd.Series(self.values)
+
+        self.assertEqual(moments.count, len(self.values))
+        self.assertAlmostEqual(moments.mean, series.mean())
+        self.assertAlmostEqual(moments.std, np.std(self.values))
+        self.assertAlmostEqual(moments.sample_std, series.std())
+        self.assertAlmostEqual(moments.skew, series.skew())
+        self.assertAlmostEqual(moments.kurtosis, series.kurt())
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test cases for QuantileSketch."""
+
+    def test_merged_partitions_within_rank_error(self):
+        """Test that quantiles of merged partition sketches stay within the rank error."""
+        rng = np.random.default_rng(1)
+        values = np.concatenate([rng.normal(size=30000), rng.exponential(5, size=30000)])
+        rng.shuffle(values)
+        merged = app.QuantileSketch(seed=0)
+        for i, partition in enumerate(np.array_split(values, 12)):
+            sketch = app.QuantileSketch(seed=i)
+            sketch.update(partition)
+            merged.merge(sketch)
+
+        self.assertEqual(merged.count, len(values))
+        for q in (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+            assert_rank_within(self, values, merged.quantile(q), q)
+
+    def test_memory_is_bounded(self):
+        """Test that the sketch keeps far fewer items than it has seen."""
+        sketch = app.QuantileSketch(seed=0)
+        for _ in range(20):
+            sketch.update(np.random.default_rng(2).random(10000))
+        self.assertLess(sum(len(items) for items in sketch.compactors), 4 * sketch.k)
+
+
+class TestHyperLogLog(unittest.TestCase):
+    """Test cases for HyperLogLog."""
+
+    def test_merged_partitions_match_single_pass(self):
+        """Test that merged sketches of overlapping partitions count distinct values within the error."""
+        values = np.arange(60000) % 50000
+        single = app.HyperLogLog()
+        single.update(values)
+        merged = app.HyperLogLog()
+        for partition in np.array_split(np.random.default_rng(3).permutation(values), 7):
+            sketch = app.HyperLogLog()
+            sketch.update(partition)
+            merged.merge(sketch)
+
+        np.testing.assert_array_equal(merged.registers, single.registers)
+        self.assertLessEqual(abs(merged.count() - 50000), DISTINCT_ERROR * 50000)
+
+    def test_small_cardinality_and_nulls(self):
+        """Test that small counts are near exact and nulls are ignored."""
+        sketch = app.HyperLogLog()
+        sketch.update(pd.Series(["a", "b", None, "c", "a"]))
+        self.assertEqual(sketch.count(), 3)
+
+    def test_precision_mismatch(self):
+        """Test that sketches of different precision refuse to merge."""
+        with self.assertRaises(ValueError):
+            app.HyperLogLog(14).merge(app.HyperLogLog(12))
+
+
+class TestSummarySketch(unittest.TestCase):
+    """Test cases for SummarySketch and approximate summary statistics."""
+
+    def setUp(self):
+        """Generate a seeded synthetic dataset."""
+        self.output_dir = tempfile.mkdtemp()
+        self.data = app.generate_synthetic_data(app.PipelineConfig(output_path=self.output_dir,
+                                                                   sample_size=5000, random_seed=5))
+
+    def tearDown(self):
+        """Clean up the output directory."""
+        shutil.rmtree(self.output_dir)
+
+    def test_merged_partitions_match_single_pass(self):
+        """Test that merging partition summaries gives the single-pass summary."""
+        single = app.SummarySketch()
+        single.update(self.data)
+        merged = app.SummarySketch()
+        for start in range(0, len(self.data), 800):
+            sketch = app.SummarySketch()
+            sketch.update(self.data[start:start + 800])
+            merged.merge(sketch)
+
+        self.assertEqual(merged.row_count, single.row_count)
+        self.assertEqual(merged.dtypes, single.dtypes)
+        self.assertEqual(merged.missing, single.missing)
+        self.assertEqual(merged.value_counts, single.value_counts)
+        for col, moments in single.moments.items():
+            self.assertEqual(merged.moments[col].count, moments.count)
+            self.assertAlmostEqual(merged.moments[col].mean, moments.mean, msg=col)
+            self.assertAlmostEqual(merged.moments[col].std, moments.std, msg=col)
+        for col, sketch in single.distinct.items():
+            np.testing.assert_array_equal(merged.distinct[col].registers, sketch.registers)
+
+    def test_approximate_summary_matches_exact(self):
+        """Test compute_summary_statistics(approximate=True) against the exact path."""
+        exact = app.compute_summary_statistics(self.data)
+        approximate = app.compute_summary_statistics(self.data, approximate=True)
+
+        for key in ('row_count', 'column_count', 'data_types', 'categorical_stats'):
+            self.assertEqual(approximate[key], exact[key], key)
+        self.assertEqual(approximate['missing_values']['total_missing'],
+                         exact['missing_values']['total_missing'])
+        self.assertAlmostEqual(approximate['missing_values']['percent_missing'],
+                               exact['missing_values']['percent_missing'])
+        self.assertEqual(approximate['missing_values']['columns_with_missing'],
+                         exact['missing_values']['columns_with_missing'])
+
+        for col in exact['numerical_stats']['mean']:
+            for stat in ('count', 'mean', 'std', 'min', 'max'):
+                self.assertAlmostEqual(approximate['numerical_stats'][stat][col],
+                                       exact['numerical_stats'][stat][col], msg=f"{col} {stat}")
+            values = self.data[col].dropna().to_numpy(dtype=float)
+            for stat, q in (('25%', 0.25), ('50%', 0.5), ('75%', 0.75)):
+                assert_rank_within(self, values, approximate['numerical_stats'][stat][col], q)
+            self.assertAlmostEqual(approximate['skew'][col], exact['skew'][col], msg=col)
+            self.assertAlmostEqual(approximate['kurtosis'][col], exact['kurtosis'][col], msg=col)
+
+        for col, count in approximate['distinct_counts'].items():
+            actual = self.data[col].nunique()
+            self.assertLessEqual(abs(count - actual), DISTINCT_ERROR * actual, col)
+
+
+if __name__ == '__main__':
+    unittest.main()
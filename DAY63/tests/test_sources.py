@@ -0,0 +1,109 @@
+"""
+Tests for loading data from files, databases and APIs.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import app
+
+
+class TestSourceFingerprint(unittest.TestCase):
+    """Test cases for source fingerprints and the stage cache."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        app.get_db_engine.cache_clear()
+        shutil.rmtree(self.temp_dir)
+
+    def config(self, **kwargs):
+        kwargs.setdefault('output_path', os.path.join(self.temp_dir, "output"))
+        return app.PipelineConfig(**kwargs)
+
+    def test_file_fingerprint_follows_content(self):
+        """Test that rewriting the input file changes the fingerprint."""
+        path = os.path.join(self.temp_dir, "data.csv")
+        with open(path, "w") as f:
+            f.write("a,b\n1,2\n")
+        config = self.config(data_source=app.DataSource.CSV, input_path=path)
+        before = app.source_fingerprint(config)
+        with open(path, "w") as f:
+            f.write("a,b\n1,2\n3,4\n")
+        self.assertIsNotNone(before)
+        self.assertNotEqual(app.source_fingerprint(config), before)
+        self.assertIsNone(app.source_fingerprint(self.config(data_source=app.DataSource.CSV,
+                                                             input_path=path + ".missing")))
+
+    def test_loads_only_when_the_source_changes(self):
+        """Test that a rerun is served from the cache and a changed load setting is not."""
+        with mock.patch.object(app, 'load_data_from_source', wraps=app.load_data_from_source) as load:
+            first = app.load_and_preprocess(self.config(sample_size=300))
+            second = app.load_and_preprocess(self.config(sample_size=300))
+            self.assertEqual(load.call_count, 1)
+            app.load_and_preprocess(self.config(sample_size=300, compact_dtypes=True))
+            self.assertEqual(load.call_count, 2)
+            app.load_and_preprocess(self.config(sample_size=300, random_seed=1))
+            self.assertEqual(load.call_count, 3)
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_hash_dataframe_with_nested_values(self):
+        """Test that object columns holding lists and dicts are hashed by value."""
+        df = pd.DataFrame({'id': [1, 2], 'tags': [['a'], ['b', 'c']], 'meta': [{'x': 1}, {}]})
+        changed = df.copy()
+        changed.at[1, 'meta'] = {'x': 2}
+
+        self.assertEqual(app.hash_dataframe(df), app.hash_dataframe(df.copy()))
+        self.assertNotEqual(app.hash_dataframe(df), app.hash_dataframe(changed))
+
+    def test_compact_dtypes_is_not_served_from_cache(self):
+        """Test that flipping compact_dtypes reloads the source with the new dtypes."""
+        real_load = app.load_data_from_source
+        loaded = []
+        def load(config):
+            loaded.append(real_load(config))
+            return loaded[-1]
+
+        with mock.patch.object(app, 'load_data_from_source', side_effect=load):
+            app.load_and_preprocess(self.config(sample_size=300))
+            app.load_and_preprocess(self.config(sample_size=300, compact_dtypes=True))
+
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[0]['age'].dtype, 'float64')
+        self.assertEqual(loaded[1]['age'].dtype, 'float32')
+        self.assertEqual(loaded[1]['gender'].dtype, 'category')
+
+    def test_database_and_api_have_no_fingerprint(self):
+        """Test that sources without a content stamp are not fingerprinted."""
+        self.assertIsNone(app.source_fingerprint(self.config(data_source=app.DataSource.API,
+                                                             api_url="http://localhost/")))
+        self.assertIsNone(app.source_fingerprint(self.config(data_source=app.DataSource.DATABASE,
+                                                             db_connection_string="sqlite://", db_table="t")))
+
+    def test_changed_table_is_not_served_from_cache(self):
+        """Test that load_and_preprocess sees a table that changed between runs."""
+        path = os.path.join(self.temp_dir, "data.sqlite")
+        data = app.generate_synthetic_data(self.config(sample_size=300))
+        config = self.config(data_source=app.DataSource.DATABASE,
+                             db_connection_string=f"sqlite:///{path}", db_table="customers")
+
+        engine = app.get_db_engine(config.db_connection_string)
+        data.to_sql("customers", engine, index=False)
+        first = app.load_and_preprocess(config)
+        data.head(100).to_sql("customers", engine, index=False, if_exists="replace")
+        second = app.load_and_preprocess(config)
+
+        self.assertGreater(len(first), len(second))
+        self.assertTrue(os.listdir(os.path.join(config.output_path, "cache")))
+
+
+if __name__ == '__main__':
+    unittest.main()
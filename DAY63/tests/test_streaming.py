@@ -0,0 +1,76 @@
+"""
+Tests for out-of-core preprocessing.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import app
+
+
+# Rank error allowed for QuantileSketch(k=200), about twice its expected 1.7 / k
+RANK_ERROR = 0.02
+
+
+class TestStreamingPreprocessing(unittest.TestCase):
+    """Test cases for fit_streaming_params and preprocess_data_streaming."""
+
+    def setUp(self):
+        """Write a seeded synthetic dataset to a CSV source read in small chunks."""
+        self.temp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.temp_dir, "data.csv")
+        app.generate_synthetic_data(app.PipelineConfig(output_path=self.temp_dir, sample_size=3000,
+                                                       random_seed=3)).to_csv(path, index=False)
+        self.config = app.PipelineConfig(output_path=self.temp_dir, data_source=app.DataSource.CSV,
+                                         input_path=path, batch_size=250)
+        self.data = app.remove_duplicates(app.clean_column_names(pd.read_csv(path)))
+        self.exact = app.fit_partition_params(self.data)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_fitted_params_match_in_memory_fit(self):
+        """Test that sketched medians and IQR bounds are within the sketch error of the exact ones."""
+        state = app.fit_streaming_params(app.stream_data_from_source(self.config))
+
+        self.assertEqual(state.onehot, self.exact.onehot)
+        self.assertEqual(state.label, self.exact.label)
+        self.assertEqual(sorted(state.medians), sorted(self.exact.medians))
+        self.assertEqual(sorted(state.outlier_bounds), sorted(self.exact.outlier_bounds))
+        for col, median in state.medians.items():
+            values = self.data[col].dropna()
+            self.assertLessEqual((values < median).mean(), 0.5 + RANK_ERROR, col)
+            self.assertGreaterEqual((values <= median).mean(), 0.5 - RANK_ERROR, col)
+        for col, (low, high) in state.outlier_bounds.items():
+            exact_low, exact_high = self.exact.outlier_bounds[col]
+            # Bounds are quartiles +- 1.5 IQR, so compare them in units of the IQR
+            tolerance = 0.1 * (exact_high - exact_low) / 4
+            self.assertLessEqual(abs(low - exact_low), tolerance, col)
+            self.assertLessEqual(abs(high - exact_high), tolerance, col)
+
+    def test_output_matches_in_memory_pipeline(self):
+        """Test that the streamed output is close to the same pipeline run in memory."""
+        result = pd.read_csv(app.preprocess_data_streaming(self.config), parse_dates=['registration_date'])
+        expected = self.exact.transform_rows(self.data)
+        self.exact.fit_scaler(expected)
+        expected = self.exact.normalize(expected)
+
+        self.assertEqual(list(result.columns), list(expected.columns))
+        self.assertEqual(len(result), len(expected))
+        numerical = expected.select_dtypes(include=['number']).columns
+        others = expected.columns.difference(numerical)
+        pd.testing.assert_frame_equal(result[others], expected[others], check_dtype=False)
+        # Values only differ where outlier capping used slightly different bounds
+        diff = np.abs(result[numerical].to_numpy() - expected[numerical].to_numpy(dtype=float))
+        self.assertLess(diff.mean(), 0.01)
+        self.assertLess(diff.max(), 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import argparse
+import contextlib
+import io
 import json
 import time
 import os
@@ -9,7 +11,8 @@ from datetime import datetime
 try:
     from system_monitor import (
         get_system_info, get_cpu_info, get_memory_info, 
-        get_disk_info, get_network_info, format_bytes, main as curses_main
+        get_disk_info, get_network_info, get_process_info, get_process_table, format_bytes,
+        configure_sampler, get_sampler, main as curses_main
     )
     print("Successfully imported system_monitor module")
 except ImportError as e:
@@ -20,6 +23,8 @@ except Exception as e:
     print(f"Unexpected error when importing system_monitor.py: {e}")
     sys.exit(1)
 
+from renderer import TerminalRenderer
+
 def print_header(title):
     """Print a formatted header"""
     term_width = os.get_terminal_size().columns
@@ -172,6 +177,29 @@ def print_network_info():
             60, 10
         )
 
+def print_process_info(count=10, sort="cpu"):
+    """Print the top processes"""
+    processes = get_process_info(count, sort)
+    show_io = get_process_table().io
+    
+    print_section(f"Top Processes (by {sort})", "")
+    
+    rows = []
+    for proc in processes:
+        rows.append([
+            proc['pid'],
+            proc['username'][:10],
+            f"{proc['cpu_percent']:.1f}",
+            format_bytes(proc['rss']),
+            f"{proc['memory_percent']:.1f}",
+            f"{format_bytes(proc['read_rate'])}/s" if show_io else "-",
+            f"{format_bytes(proc['write_rate'])}/s" if show_io else "-",
+            proc['num_threads'] if proc['num_threads'] is not None else "-",
+            proc['open_files'] if proc['open_files'] is not None else "-",
+            (proc['cmdline'] or proc['name'])[:40]
+        ])
+    print_table(["PID", "User", "CPU%", "RSS", "MEM%", "Read", "Write", "Threads", "Files", "Command"], rows)
+
 def print_ascii_graph(values, width=60, height=10):
     """Print an ASCII graph of values"""
     if not values:
@@ -200,56 +228,75 @@ def print_ascii_graph(values, width=60, height=10):
     current = values[0] if values else 0
     print(f"    Current: {current:.1f}%")
 
-def monitor_continuously(interval, output_format):
-    """Monitor system resources continuously"""
-    try:
-        print(f"Starting continuous monitoring (Press Ctrl+C to exit)...")
-        time.sleep(1)  # Give user a chance to see the message
+def build_frame(output_format, top=10, sort="cpu"):
+    """Render one monitor frame and return it as a list of lines"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"System Monitor - {current_time} (Press Ctrl+C to exit)")
         
-        while True:
-            # Clear screen - use cls on Windows, clear on Unix
-            os.system('cls' if os.name == 'nt' else 'clear')
-            
-            # Print current time
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            print(f"System Monitor - {current_time} (Press Ctrl+C to exit)")
+        if output_format == "text":
+            print_system_info()
+            print_cpu_info()
+            print_memory_info()
+            print_disk_info()
+            print_network_info()
+            print_process_info(top, sort)
+        
+        elif output_format == "json":
+            data = {
+                "timestamp": current_time,
+                "system": get_system_info(),
+                "cpu": get_cpu_info(),
+                "memory": get_memory_info(),
+                "disk": get_disk_info(),
+                "network": get_network_info(),
+                "processes": get_process_info(top, sort)
+            }
+            print(json.dumps(data, indent=2))
+        
+        elif output_format == "compact":
+            cpu_info = get_cpu_info()
+            memory_info = get_memory_info()
+            network_info = get_network_info()
             
-            if output_format == "text":
-                print_system_info()
-                print_cpu_info()
-                print_memory_info()
-                print_disk_info()
-                print_network_info()
+            print(f"\nCPU: {cpu_info['percent']}% | Memory: {memory_info['percent']}% | "
+                  f"Download: {format_bytes(network_info['recv_rate'])}/s | "
+                  f"Upload: {format_bytes(network_info['sent_rate'])}/s")
             
-            elif output_format == "json":
-                data = {
-                    "timestamp": current_time,
-                    "system": get_system_info(),
-                    "cpu": get_cpu_info(),
-                    "memory": get_memory_info(),
-                    "disk": get_disk_info(),
-                    "network": get_network_info()
-                }
-                print(json.dumps(data, indent=2))
+            # Print compact ASCII graphs
+            print("\nCPU Usage:    ", end="")
+            print_compact_bar(cpu_info['percent'])
             
-            elif output_format == "compact":
-                cpu_info = get_cpu_info()
-                memory_info = get_memory_info()
-                network_info = get_network_info()
-                
-                print(f"\nCPU: {cpu_info['percent']}% | Memory: {memory_info['percent']}% | "
-                      f"Download: {format_bytes(network_info['recv_rate'])}/s | "
-                      f"Upload: {format_bytes(network_info['sent_rate'])}/s")
-                
-                # Print compact ASCII graphs
-                print("\nCPU Usage:    ", end="")
-                print_compact_bar(cpu_info['percent'])
+            print("Memory Usage: ", end="")
+            print_compact_bar(memory_info['percent'])
+    
+    return buffer.getvalue().rstrip("\n").split("\n")
+
+def monitor_continuously(interval, output_format, top=10, sort="cpu"):
+    """
+    Monitor system resources continuously.
+    
+    Frames are drawn by a TerminalRenderer, which rewrites only the lines
+    that changed since the previous frame, so short intervals (down to 0.1s
+    for 10 updates per second) neither flicker nor spawn a shell per frame.
+    """
+    print(f"Starting continuous monitoring (Press Ctrl+C to exit)...")
+    get_sampler().min_interval = interval / 2
+    
+    try:
+        with TerminalRenderer() as renderer:
+            next_frame = time.monotonic()
+            while True:
+                renderer.draw(build_frame(output_format, top, sort))
                 
-                print("Memory Usage: ", end="")
-                print_compact_bar(memory_info['percent'])
-            
-            # Wait for the next update
-            time.sleep(interval)
+                # Wait for the next update, without drifting
+                next_frame += interval
+                delay = next_frame - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame = time.monotonic()
     
     except KeyboardInterrupt:
         print("\nMonitoring stopped.")
@@ -333,31 +380,51 @@ def main():
     command_group.add_argument("--monitor", action="store_true", help="Monitor system resources continuously")
     command_group.add_argument("--snapshot", action="store_true", help="Take a snapshot of current system resources")
     command_group.add_argument("--export", metavar="FILENAME", help="Export system information to a file")
+    command_group.add_argument("--serve", action="store_true", help="Serve metrics over HTTP (Prometheus text and JSON)")
     
     # Options
     parser.add_argument("--interval", type=float, default=1.0, help="Update interval in seconds (default: 1.0)")
     parser.add_argument("--format", choices=["text", "json", "compact"], default="text", help="Output format (default: text)")
     parser.add_argument("--export-format", choices=["text", "json"], default="text", help="Export format (default: text)")
+    parser.add_argument("--history-file", metavar="PATH", help="History ring buffer file shared by all monitor modes")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to serve metrics on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9877, help="Port to serve metrics on (default: 9877)")
+    parser.add_argument("--top", type=int, default=10, help="Number of top processes to show or export (default: 10)")
+    parser.add_argument("--sort", choices=["cpu", "rss", "io"], default="cpu", help="Rank processes by CPU, memory or I/O (default: cpu)")
     
     args = parser.parse_args()
     
+    if args.history_file:
+        configure_sampler(args.history_file)
+    
     # Handle export command
     if args.export:
         export_to_file(args.export, args.export_format)
         return
     
+    # Handle serve command
+    if args.serve:
+        from exporter import serve
+        serve(args.host, args.port, args.interval, args.top, get_sampler())
+        return
+    
     # Handle snapshot command
     if args.snapshot:
+        # Prime the process counters; CPU and I/O rates need two readings
+        table = get_process_table(io=args.sort == "io")
         print_system_info()
         print_cpu_info()
         print_memory_info()
         print_disk_info()
         print_network_info()
+        time.sleep(0.5)
+        table.update()
+        print_process_info(args.top, args.sort)
         return
     
     # Handle monitor command
     if args.monitor:
-        monitor_continuously(args.interval, args.format)
+        monitor_continuously(args.interval, args.format, args.top, args.sort)
         return
     
     # Default to interactive mode
@@ -0,0 +1,245 @@
+import gzip
+import json
+import time
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import psutil
+
+from processes import ProcessTable
+from sampler import Sampler
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+
+
+def escape_label(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusWriter:
+    """Accumulates metric families in the Prometheus text exposition format"""
+
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name, metric_type, help_text, samples):
+        """
+        Add one metric family.
+
+        Args:
+            name: Metric name
+            metric_type: "gauge" or "counter"
+            help_text: HELP description
+            samples: Iterable of (labels dict or None, value)
+        """
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            if labels:
+                label_text = ",".join(f'{key}="{escape_label(val)}"' for key, val in labels.items())
+                self.lines.append(f"{name}{{{label_text}}} {float(value)!r}")
+            else:
+                self.lines.append(f"{name} {float(value)!r}")
+
+    def render(self):
+        return ("\n".join(self.lines) + "\n").encode("utf-8")
+
+
+class MetricsExporter:
+    """
+    Samples metrics once per tick and keeps ready-to-send responses.
+
+    A background thread ticks the sampler, collects per-disk, per-NIC and
+    top-N process metrics (from a ProcessTable kept between ticks), then serializes Prometheus text and JSON (plain
+    and gzip-compressed) once. HTTP requests only hand out the latest
+    pre-built bytes, so scrapes never trigger psutil calls.
+    """
+
+    def __init__(self, sampler=None, interval=1.0, top=10):
+        self.sampler = sampler or Sampler()
+        self.interval = interval
+        self.top = top
+        self.processes = ProcessTable(io=True)
+        self.payloads = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def top_processes(self):
+        """Update the process table and return the top processes by CPU, RSS and I/O (union)"""
+        self.processes.update()
+        rows = {}
+        for key in ("cpu", "rss", "io"):
+            for row in self.processes.top(self.top, key):
+                rows.setdefault(row["pid"], row)
+        return list(rows.values())
+
+    def collect(self):
+        """Collect one tick of metrics"""
+        sample = self.sampler.tick()
+
+        disk_io = psutil.disk_io_counters(perdisk=True) or {}
+        nic_io = psutil.net_io_counters(pernic=True) or {}
+        return {
+            "timestamp": sample["timestamp"],
+            "system": dict(self.sampler.static),
+            "sample": sample,
+            "disk_usage": self.sampler.disks(),
+            "disk_io": {name: counters._asdict() for name, counters in disk_io.items()},
+            "network": {name: counters._asdict() for name, counters in nic_io.items()},
+            "processes": self.top_processes(),
+        }
+
+    def render_prometheus(self, data):
+        """Serialize collected metrics in the Prometheus text format"""
+        sample = data["sample"]
+        static = data["system"]
+        out = PrometheusWriter()
+
+        out.family("system_cpu_usage_percent", "gauge", "CPU utilisation over the last tick.",
+                   [(None, sample["cpu_percent"])])
+        out.family("system_cpu_count", "gauge", "Number of logical CPUs.", [(None, static["cpu_count"])])
+        out.family("system_boot_time_seconds", "gauge", "System boot time as a Unix timestamp.",
+                   [(None, psutil.boot_time())])
+        out.family("system_memory_total_bytes", "gauge", "Total physical memory.", [(None, sample["memory_total"])])
+        out.family("system_memory_used_bytes", "gauge", "Used physical memory.", [(None, sample["memory_used"])])
+        out.family("system_memory_available_bytes", "gauge", "Available physical memory.",
+                   [(None, sample["memory_available"])])
+        out.family("system_swap_total_bytes", "gauge", "Total swap space.", [(None, sample["swap_total"])])
+        out.family("system_swap_used_bytes", "gauge", "Used swap space.", [(None, sample["swap_used"])])
+
+        disks = data["disk_usage"]
+        for name, key, help_text in (("system_filesystem_size_bytes", "total", "Filesystem size."),
+                                     ("system_filesystem_used_bytes", "used", "Filesystem space used."),
+                                     ("system_filesystem_free_bytes", "free", "Filesystem space free.")):
+            out.family(name, "gauge", help_text,
+                       [({"device": d["device"], "mountpoint": d["mountpoint"], "fstype": d["fstype"]}, d[key])
+                        for d in disks])
+
+        disk_io = data["disk_io"]
+        for name, key, help_text in (("system_disk_read_bytes_total", "read_bytes", "Bytes read from disk."),
+                                     ("system_disk_written_bytes_total", "write_bytes", "Bytes written to disk."),
+                                     ("system_disk_reads_completed_total", "read_count", "Disk reads completed."),
+                                     ("system_disk_writes_completed_total", "write_count", "Disk writes completed.")):
+            out.family(name, "counter", help_text, [({"disk": disk}, c[key]) for disk, c in disk_io.items()])
+
+        nics = data["network"]
+        for name, key, help_text in (
+                ("system_network_receive_bytes_total", "bytes_recv", "Bytes received."),
+                ("system_network_transmit_bytes_total", "bytes_sent", "Bytes sent."),
+                ("system_network_receive_packets_total", "packets_recv", "Packets received."),
+                ("system_network_transmit_packets_total", "packets_sent", "Packets sent."),
+                ("system_network_receive_errors_total", "errin", "Receive errors."),
+                ("system_network_transmit_errors_total", "errout", "Transmit errors."),
+                ("system_network_receive_drop_total", "dropin", "Incoming packets dropped."),
+                ("system_network_transmit_drop_total", "dropout", "Outgoing packets dropped.")):
+            out.family(name, "counter", help_text, [({"interface": nic}, c[key]) for nic, c in nics.items()])
+
+        processes = data["processes"]
+        out.family("process_cpu_usage_percent", "gauge", "CPU utilisation of the top processes.",
+                   [({"pid": p["pid"], "name": p["name"]}, p["cpu_percent"]) for p in processes])
+        out.family("process_resident_memory_bytes", "gauge", "Resident memory of the top processes.",
+                   [({"pid": p["pid"], "name": p["name"]}, p["rss"]) for p in processes])
+        out.family("process_io_read_bytes_per_second", "gauge", "Disk read rate of the top processes.",
+                   [({"pid": p["pid"], "name": p["name"]}, p["read_rate"]) for p in processes])
+        out.family("process_io_write_bytes_per_second", "gauge", "Disk write rate of the top processes.",
+                   [({"pid": p["pid"], "name": p["name"]}, p["write_rate"]) for p in processes])
+        out.family("process_threads", "gauge", "Thread count of the top processes.",
+                   [({"pid": p["pid"], "name": p["name"]}, p["num_threads"])
+                    for p in processes if p["num_threads"] is not None])
+        out.family("process_open_files", "gauge", "Open files of the top processes.",
+                   [({"pid": p["pid"], "name": p["name"]}, p["open_files"])
+                    for p in processes if p["open_files"] is not None])
+
+        out.family("system_monitor_last_sample_timestamp_seconds", "gauge", "Time of the latest sample.",
+                   [(None, data["timestamp"])])
+        return out.render()
+
+    def render_json(self, data):
+        """Serialize collected metrics as JSON"""
+        payload = dict(data)
+        payload["timestamp"] = datetime.fromtimestamp(data["timestamp"]).isoformat()
+        return json.dumps(payload).encode("utf-8")
+
+    def refresh(self):
+        """Collect one tick and swap in freshly serialized responses"""
+        data = self.collect()
+        prometheus = self.render_prometheus(data)
+        as_json = self.render_json(data)
+        # Replace the whole dict so request threads always see a consistent set
+        self.payloads = {
+            "prometheus": (prometheus, gzip.compress(prometheus, compresslevel=5)),
+            "json": (as_json, gzip.compress(as_json, compresslevel=5)),
+        }
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error collecting metrics: {e}")
+            next_tick += self.interval
+            self._stop.wait(max(0.0, next_tick - time.monotonic()))
+
+    def start(self):
+        """Start the background sampling thread (after one synchronous refresh)"""
+        self.refresh()
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def make_handler(exporter):
+    """Build a request handler class bound to an exporter"""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        routes = {
+            "/metrics": ("prometheus", PROMETHEUS_CONTENT_TYPE),
+            "/metrics.json": ("json", JSON_CONTENT_TYPE),
+            "/json": ("json", JSON_CONTENT_TYPE),
+        }
+
+        def do_GET(self):
+            route = self.routes.get(self.path.split("?", 1)[0])
+            if route is None:
+                self.send_error(404, "Try /metrics or /metrics.json")
+                return
+            plain, compressed = exporter.payloads[route[0]]
+            use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            body = compressed if use_gzip else plain
+
+            self.send_response(200)
+            self.send_header("Content-Type", route[1])
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes are frequent; keep the console quiet
+            pass
+
+    return MetricsHandler
+
+
+def serve(host="127.0.0.1", port=9877, interval=1.0, top=10, sampler=None):
+    """Run the metrics endpoint until interrupted"""
+    exporter = MetricsExporter(sampler, interval, top)
+    exporter.start()
+    server = ThreadingHTTPServer((host, port), make_handler(exporter))
+    print(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics (JSON at /metrics.json)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nExporter stopped.")
+    finally:
+        server.server_close()
+        exporter.stop()
@@ -0,0 +1,168 @@
+import heapq
+import time
+
+import psutil
+
+# Ranking keys accepted by ProcessTable.top
+SORT_KEYS = {
+    "cpu": lambda entry: entry.cpu_percent,
+    "rss": lambda entry: entry.rss,
+    "io": lambda entry: entry.read_rate + entry.write_rate,
+}
+
+
+class _Entry:
+    """Cached state of one process between updates"""
+
+    __slots__ = ("proc", "name", "cpu_total", "cpu_percent", "rss",
+                 "io_read", "io_write", "read_rate", "write_rate", "cmdline", "username")
+
+    def __init__(self, proc):
+        self.proc = proc
+        self.name = ""
+        self.cpu_total = None
+        self.cpu_percent = 0.0
+        self.rss = 0
+        self.io_read = None
+        self.io_write = None
+        self.read_rate = 0.0
+        self.write_rate = 0.0
+        # Expensive fields, only read once a process reaches the top N
+        self.cmdline = None
+        self.username = None
+
+
+class ProcessTable:
+    """
+    Keeps psutil.Process handles alive between updates to rank processes.
+
+    Every update reads only cheap fields (name, CPU times, RSS and, when io
+    is enabled, I/O counters) for each process, and turns them into deltas
+    against the previous update. Expensive fields such as the command line,
+    open files and thread count are only read for the processes returned by
+    top(), and the command line and user are cached for the life of the
+    process. Ranking uses a bounded heap (heapq.nlargest), so it costs
+    O(n log N) for N rows instead of sorting every process.
+    """
+
+    def __init__(self, io=False, min_interval=1.0):
+        self.io = io
+        self.min_interval = min_interval
+        self._entries = {}
+        self._last_update = None
+        self._memory_total = psutil.virtual_memory().total
+        # The first update only primes the counters
+        self.update()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def update(self):
+        """Read the cheap fields of every process and compute per-second deltas"""
+        now = time.monotonic()
+        elapsed = now - self._last_update if self._last_update is not None else None
+        self._last_update = now
+
+        pids = psutil.pids()
+        alive = set(pids)
+        for pid in [pid for pid in self._entries if pid not in alive]:
+            del self._entries[pid]
+
+        for pid in pids:
+            entry = self._entries.get(pid)
+            if entry is None:
+                try:
+                    entry = _Entry(psutil.Process(pid))
+                except psutil.Error:
+                    continue
+                self._entries[pid] = entry
+            try:
+                self._read(entry, elapsed)
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                del self._entries[pid]
+            except psutil.AccessDenied:
+                continue
+
+    def _read(self, entry, elapsed):
+        proc = entry.proc
+        with proc.oneshot():
+            entry.name = proc.name()
+            times = proc.cpu_times()
+            entry.rss = proc.memory_info().rss
+            io = None
+            if self.io:
+                try:
+                    io = proc.io_counters()
+                except (psutil.AccessDenied, AttributeError):
+                    # Other users' processes, or no per-process I/O on this platform
+                    pass
+
+        cpu_total = times.user + times.system
+        # A lower total means the PID was reused by a new process
+        if elapsed and entry.cpu_total is not None and cpu_total >= entry.cpu_total:
+            entry.cpu_percent = (cpu_total - entry.cpu_total) / elapsed * 100
+        else:
+            entry.cpu_percent = 0.0
+        entry.cpu_total = cpu_total
+
+        if io is not None:
+            if elapsed and entry.io_read is not None and io.read_bytes >= entry.io_read:
+                entry.read_rate = (io.read_bytes - entry.io_read) / elapsed
+                entry.write_rate = max(io.write_bytes - entry.io_write, 0) / elapsed
+            entry.io_read = io.read_bytes
+            entry.io_write = io.write_bytes
+
+    def refresh(self):
+        """Update, unless the last update is more recent than min_interval"""
+        if time.monotonic() - self._last_update >= self.min_interval:
+            self.update()
+
+    def top(self, count=10, key="cpu", details=True):
+        """
+        Return the top processes as dicts, highest first.
+
+        Args:
+            count: Number of processes
+            key: "cpu", "rss" or "io" ("io" needs a table created with io=True)
+            details: Also read cmdline, user, thread count and open files
+
+        Returns:
+            list: One dict per process
+        """
+        if key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {key}")
+        if key == "io" and not self.io:
+            raise ValueError("Sorting by I/O needs a ProcessTable created with io=True")
+
+        rows = []
+        for entry in heapq.nlargest(count, self._entries.values(), key=SORT_KEYS[key]):
+            row = {
+                "pid": entry.proc.pid,
+                "name": entry.name,
+                "cpu_percent": entry.cpu_percent,
+                "rss": entry.rss,
+                "memory_percent": entry.rss / self._memory_total * 100,
+                "read_rate": entry.read_rate,
+                "write_rate": entry.write_rate,
+            }
+            if details:
+                row.update(self._details(entry))
+            rows.append(row)
+        return rows
+
+    def _details(self, entry):
+        proc = entry.proc
+        details = {"cmdline": "", "username": "", "num_threads": None, "open_files": None}
+        try:
+            if entry.cmdline is None:
+                entry.cmdline = " ".join(proc.cmdline())
+            if entry.username is None:
+                entry.username = proc.username()
+            details["num_threads"] = proc.num_threads()
+            details["open_files"] = len(proc.open_files())
+        except psutil.Error:
+            # Access denied or the process just exited: keep what we have
+            pass
+        details["cmdline"] = entry.cmdline or ""
+        details["username"] = entry.username or ""
+        return details
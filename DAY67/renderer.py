@@ -0,0 +1,85 @@
+import os
+import sys
+import shutil
+
+# ANSI escape sequences
+ALT_SCREEN_ON = "\x1b[?1049h"
+ALT_SCREEN_OFF = "\x1b[?1049l"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+
+
+def move_to(row):
+    """Escape sequence moving the cursor to the start of a (0-based) row"""
+    return f"\x1b[{row + 1};1H"
+
+
+class TerminalRenderer:
+    """
+    Draws full-screen text frames, rewriting only the lines that changed.
+
+    Each frame is a list of lines. The renderer keeps the previous frame and
+    emits cursor addressing plus the new text for changed rows only, in a
+    single write. Lines are cut to the terminal size so that no row wraps,
+    and a resize forces one full redraw. When the output is not a terminal
+    frames are simply printed one after another.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        self._previous = []
+        self._size = None
+
+    def start(self):
+        if self.interactive:
+            if os.name == 'nt':
+                # Enables ANSI escape processing in the Windows console
+                os.system('')
+            self.stream.write(ALT_SCREEN_ON + HIDE_CURSOR)
+            self.stream.flush()
+
+    def stop(self):
+        if self.interactive:
+            self.stream.write(SHOW_CURSOR + ALT_SCREEN_OFF)
+            self.stream.flush()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def draw(self, lines):
+        """Draw a frame (a list of strings without newlines)"""
+        if not self.interactive:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+            return
+
+        size = shutil.get_terminal_size()
+        if size != self._size:
+            # The old frame is meaningless after a resize
+            self._size = size
+            self._previous = []
+            out = [CLEAR_SCREEN]
+        else:
+            out = []
+
+        width, height = size
+        lines = [line[:width] for line in lines[:height]]
+        previous = self._previous
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                out.append(move_to(row) + line + CLEAR_LINE)
+        if len(lines) < len(previous):
+            out.append(move_to(len(lines)) + CLEAR_BELOW)
+
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+        self._previous = lines
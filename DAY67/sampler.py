@@ -0,0 +1,380 @@
+import os
+import sys
+import time
+import mmap
+import struct
+import platform
+from array import array
+from datetime import datetime
+from functools import lru_cache
+
+import psutil
+
+# Metrics stored in the history ring buffer, one double each per sample
+FIELDS = (
+    "timestamp",
+    "cpu_percent",
+    "memory_percent",
+    "memory_used",
+    "memory_available",
+    "swap_percent",
+    "swap_used",
+    "net_recv_rate",
+    "net_sent_rate",
+)
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+# Resolution name -> (seconds per record, number of records kept)
+RESOLUTIONS = {
+    "1s": (1, 24 * 3600),        # one day of per-second samples
+    "1min": (60, 30 * 24 * 60),  # thirty days of per-minute averages
+    "1h": (3600, 2 * 365 * 24),  # two years of hourly averages
+}
+
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".cache", "system_monitor", "history.ring")
+
+# How often slowly changing values (CPU frequency) are re-read, in ticks
+SLOW_TICKS = 10
+
+# How long disk partition usage is reused before it is read again, in seconds
+DISK_MAX_AGE = 10.0
+
+MAGIC = b"SMRB"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")   # magic, version, field count, ring count
+RING_HEADER = struct.Struct("<QQQ")  # capacity, head (next write position), count
+DOUBLE_SIZE = 8
+
+
+@lru_cache(maxsize=None)
+def get_static_info():
+    """Collect information that does not change while the monitor runs (cached)"""
+    uname = platform.uname()
+    cpu_freq = psutil.cpu_freq()
+    return {
+        "system": uname.system,
+        "node": uname.node,
+        "release": uname.release,
+        "version": uname.version,
+        "machine": uname.machine,
+        "processor": uname.processor if uname.processor else "Unknown",
+        "python_version": platform.python_version(),
+        "boot_time": datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S"),
+        "cpu_count": psutil.cpu_count(logical=True),
+        "cpu_freq_max": cpu_freq.max if cpu_freq and cpu_freq.max else "N/A",
+    }
+
+
+class RingBuffer:
+    """
+    Fixed-size, memory-mapped time series store with several resolutions.
+
+    The file holds a small header followed by one ring of records per
+    resolution; each record is len(FIELDS) doubles. Records are read and
+    written through a memoryview cast to doubles, so appending a sample is a
+    slice assignment and reading a metric is a strided slice of the mapping.
+    """
+
+    def __init__(self, path=None, fields=FIELDS, resolutions=RESOLUTIONS, readonly=False):
+        self.path = path
+        self.fields = fields
+        self.names = list(resolutions)
+        self.capacities = [capacity for _, capacity in resolutions.values()]
+        self.readonly = readonly
+
+        nfields = len(fields)
+        self._header_size = HEADER.size + RING_HEADER.size * len(self.names)
+        # Keep the data region aligned to whole doubles
+        self._data_offset = -(-self._header_size // DOUBLE_SIZE) * DOUBLE_SIZE
+        self._bases = []
+        offset = 0
+        for capacity in self.capacities:
+            self._bases.append(offset)
+            offset += capacity * nfields
+        size = self._data_offset + offset * DOUBLE_SIZE
+
+        self._file = None
+        if path is None:
+            # Anonymous mapping: history lives only as long as this process
+            self._mmap = mmap.mmap(-1, size)
+            self._init_header()
+        else:
+            self._file = open(path, "rb" if readonly else "a+b")
+            if readonly:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if not self._header_matches():
+                    self.close()
+                    raise ValueError(f"{path} is not a compatible history file")
+            else:
+                if os.fstat(self._file.fileno()).st_size != size:
+                    self._file.truncate(size)
+                self._mmap = mmap.mmap(self._file.fileno(), size)
+                if not self._header_matches():
+                    self._init_header()
+
+        self._data = memoryview(self._mmap)[self._data_offset:size].cast("d")
+
+    def _init_header(self):
+        self._mmap[:self._data_offset] = bytes(self._data_offset)
+        HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, len(self.fields), len(self.names))
+        for i, capacity in enumerate(self.capacities):
+            RING_HEADER.pack_into(self._mmap, HEADER.size + i * RING_HEADER.size, capacity, 0, 0)
+
+    def _header_matches(self):
+        if len(self._mmap) < self._data_offset:
+            return False
+        magic, version, nfields, nrings = HEADER.unpack_from(self._mmap, 0)
+        if (magic, version, nfields, nrings) != (MAGIC, VERSION, len(self.fields), len(self.names)):
+            return False
+        return all(self._ring_state(i)[0] == capacity for i, capacity in enumerate(self.capacities))
+
+    def _ring_state(self, ring):
+        return RING_HEADER.unpack_from(self._mmap, HEADER.size + ring * RING_HEADER.size)
+
+    def append(self, resolution, values):
+        """Append one record (a sequence of len(FIELDS) floats) to a resolution's ring"""
+        ring = self.names.index(resolution)
+        capacity, head, count = self._ring_state(ring)
+        nfields = len(self.fields)
+        start = self._bases[ring] + (head % capacity) * nfields
+        self._data[start:start + nfields] = array("d", values)
+        # Publish the record only after it is fully written
+        RING_HEADER.pack_into(self._mmap, HEADER.size + ring * RING_HEADER.size,
+                              capacity, head + 1, min(count + 1, capacity))
+
+    def count(self, resolution):
+        """Number of records currently stored at a resolution"""
+        return self._ring_state(self.names.index(resolution))[2]
+
+    def column(self, resolution, field, length):
+        """
+        Return the most recent values of one field, oldest first.
+
+        Args:
+            resolution: Resolution name, e.g. "1s"
+            field: Field name from FIELDS
+            length: Maximum number of values
+
+        Returns:
+            list: Up to length values
+        """
+        ring = self.names.index(resolution)
+        capacity, head, count = self._ring_state(ring)
+        length = min(length, count)
+        if length <= 0:
+            return []
+
+        nfields = len(self.fields)
+        offset = self._bases[ring] + self.fields.index(field)
+        start = (head - length) % capacity
+        end = start + length
+        if end <= capacity:
+            return self._data[offset + start * nfields:offset + end * nfields:nfields].tolist()
+        # The requested window wraps around the end of the ring
+        first = self._data[offset + start * nfields:offset + capacity * nfields:nfields].tolist()
+        return first + self._data[offset:offset + (end - capacity) * nfields:nfields].tolist()
+
+    def latest(self, resolution):
+        """Return the most recent record at a resolution as a dict, or None"""
+        ring = self.names.index(resolution)
+        capacity, head, count = self._ring_state(ring)
+        if not count:
+            return None
+        nfields = len(self.fields)
+        start = self._bases[ring] + ((head - 1) % capacity) * nfields
+        return dict(zip(self.fields, self._data[start:start + nfields].tolist()))
+
+    def flush(self):
+        self._mmap.flush()
+
+    def close(self):
+        if getattr(self, "_data", None) is not None:
+            self._data.release()
+            self._data = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def _try_lock(f):
+    """Take an exclusive, non-blocking lock on an open file; True if we got it"""
+    try:
+        import fcntl
+    except ImportError:
+        # No advisory locks (Windows): assume a single writer
+        return True
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+class Sampler:
+    """
+    Collects all live metrics in one tick and records them in a RingBuffer.
+
+    Static information is read once. Every tick makes one call each to
+    cpu_percent, virtual_memory, swap_memory and net_io_counters; CPU
+    frequency is only re-read every SLOW_TICKS ticks and disk usage at most
+    every DISK_MAX_AGE seconds. At most one sample per second is recorded,
+    however fast the sampler ticks; per-second samples are averaged into
+    the 1min and 1h rings as their buckets close.
+
+    Only one process writes a history file at a time. If another monitor
+    already holds it, this sampler still collects live values but reads
+    history from the shared file instead of writing to it.
+    """
+
+    def __init__(self, history_file=HISTORY_FILE, min_interval=0.5):
+        self.min_interval = min_interval
+        self.static = get_static_info()
+        self.ring, self.writable = self._open_ring(history_file)
+
+        # Prime the delta-based counters
+        psutil.cpu_percent(interval=None)
+        self._last_net = psutil.net_io_counters()
+        self._last_time = time.monotonic()
+        self._last_tick = None
+        self._ticks = 0
+        self._cpu_freq = None
+        self._last_second = None
+        self._disks = None
+        self._disks_time = None
+        self._buckets = {name: [None, [0.0] * len(FIELDS), 0] for name in self.ring.names[1:]}
+        self.latest = None
+
+    def _open_ring(self, history_file):
+        if history_file is None:
+            return RingBuffer(), True
+        try:
+            os.makedirs(os.path.dirname(history_file), exist_ok=True)
+            lock_file = open(history_file + ".lock", "a")
+            if _try_lock(lock_file):
+                self._lock_file = lock_file
+                return RingBuffer(history_file), True
+            lock_file.close()
+            return RingBuffer(history_file, readonly=True), False
+        except (OSError, ValueError) as e:
+            print(f"Warning: history file unavailable ({e}); keeping history in memory", file=sys.stderr)
+            return RingBuffer(), True
+
+    def tick(self):
+        """Collect one sample of every metric and record it"""
+        now = time.monotonic()
+        timestamp = time.time()
+
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        net = psutil.net_io_counters()
+        if self._ticks % SLOW_TICKS == 0:
+            self._cpu_freq = psutil.cpu_freq()
+
+        time_delta = (now - self._last_time) or 1e-9
+        recv_rate = (net.bytes_recv - self._last_net.bytes_recv) / time_delta
+        sent_rate = (net.bytes_sent - self._last_net.bytes_sent) / time_delta
+        self._last_net = net
+        self._last_time = now
+
+        sample = {
+            "timestamp": timestamp,
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory_percent": mem.percent,
+            "memory_used": mem.used,
+            "memory_available": mem.available,
+            "swap_percent": swap.percent,
+            "swap_used": swap.used,
+            "net_recv_rate": recv_rate,
+            "net_sent_rate": sent_rate,
+            # Not stored in the ring buffer
+            "memory_total": mem.total,
+            "swap_total": swap.total,
+            "bytes_sent": net.bytes_sent,
+            "bytes_recv": net.bytes_recv,
+            "packets_sent": net.packets_sent,
+            "packets_recv": net.packets_recv,
+            "cpu_freq_current": self._cpu_freq.current if self._cpu_freq else "N/A",
+        }
+
+        if self.writable and int(timestamp) != self._last_second:
+            self._last_second = int(timestamp)
+            self._record([sample[field] for field in FIELDS])
+
+        self.latest = sample
+        self._last_tick = now
+        self._ticks += 1
+        return sample
+
+    def _record(self, values):
+        self.ring.append("1s", values)
+        # Fold the sample into the coarser resolutions' open buckets
+        for name, bucket in self._buckets.items():
+            step = RESOLUTIONS[name][0]
+            bucket_id = int(values[0] // step)
+            if bucket[0] is not None and bucket_id != bucket[0] and bucket[2]:
+                averaged = [total / bucket[2] for total in bucket[1]]
+                averaged[0] = bucket[0] * step
+                self.ring.append(name, averaged)
+                bucket[1] = [0.0] * len(FIELDS)
+                bucket[2] = 0
+            bucket[0] = bucket_id
+            bucket[1] = [total + value for total, value in zip(bucket[1], values)]
+            bucket[2] += 1
+
+    def disks(self, max_age=DISK_MAX_AGE):
+        """Return usage of mounted partitions, re-read only when older than max_age seconds"""
+        now = time.monotonic()
+        if self._disks is not None and now - self._disks_time < max_age:
+            return self._disks
+
+        partitions = []
+        for part in psutil.disk_partitions(all=False):
+            if os.name == 'nt' and ('cdrom' in part.opts or part.fstype == ''):
+                # Skip CD-ROM on Windows
+                continue
+            try:
+                usage = psutil.disk_usage(part.mountpoint)
+            except OSError:
+                # Skip if we don't have permission or the mount went away
+                continue
+            partitions.append({
+                "device": part.device,
+                "mountpoint": part.mountpoint,
+                "fstype": part.fstype,
+                "total": usage.total,
+                "used": usage.used,
+                "free": usage.free,
+                "percent": usage.percent
+            })
+        self._disks = partitions
+        self._disks_time = now
+        return partitions
+
+    def current(self):
+        """Return the latest sample, ticking first if it is older than min_interval"""
+        if self._last_tick is None or time.monotonic() - self._last_tick >= self.min_interval:
+            self.tick()
+        return self.latest
+
+    def history(self, field, length=60, resolution="1s"):
+        """
+        Return recent values of a metric, oldest first, zero-padded to length.
+
+        Args:
+            field: Field name from FIELDS
+            length: Number of values
+            resolution: "1s", "1min" or "1h"
+
+        Returns:
+            list: Exactly length values
+        """
+        values = self.ring.column(resolution, field, length)
+        return [0] * (length - len(values)) + values
+
+    def close(self):
+        self.ring.flush()
+        self.ring.close()
+        lock_file = getattr(self, "_lock_file", None)
+        if lock_file is not None:
+            lock_file.close()
@@ -1,132 +1,107 @@
-import os
-import time
 import curses
-import psutil
-import platform
 from datetime import datetime
-from collections import deque
 import signal
 import sys
+from processes import ProcessTable
+from sampler import HISTORY_FILE, Sampler, get_static_info
 
 # Configuration
 UPDATE_INTERVAL = 1.0  # seconds
 HISTORY_LENGTH = 60    # data points to keep (for graphs)
 GRAPH_WIDTH = 50       # width of graphs in characters
 
-# Initialize data stores
-cpu_history = deque([0] * HISTORY_LENGTH, maxlen=HISTORY_LENGTH)
-memory_history = deque([0] * HISTORY_LENGTH, maxlen=HISTORY_LENGTH)
-net_recv_history = deque([0] * HISTORY_LENGTH, maxlen=HISTORY_LENGTH)
-net_sent_history = deque([0] * HISTORY_LENGTH, maxlen=HISTORY_LENGTH)
+# Shared sampler: one tick collects every metric and records it in the
+# memory-mapped history ring buffer
+_sampler = None
 
-# Network stats for delta calculation
-last_net_io = psutil.net_io_counters()
-last_net_time = time.time()
+def get_sampler():
+    """Return the process-wide sampler, creating it on first use"""
+    global _sampler
+    if _sampler is None:
+        _sampler = Sampler()
+    return _sampler
+
+def configure_sampler(history_file=HISTORY_FILE):
+    """Replace the process-wide sampler, e.g. to use another history file (None keeps it in memory)"""
+    global _sampler
+    if _sampler is not None:
+        _sampler.close()
+    _sampler = Sampler(history_file)
+    return _sampler
+
+# Shared process table, created on first use since priming it walks every process
+_process_table = None
+
+def get_process_table(io=False):
+    """Return the process-wide process table, enabling I/O counters if asked"""
+    global _process_table
+    if _process_table is None:
+        _process_table = ProcessTable(io=io)
+    elif io:
+        _process_table.io = True
+    return _process_table
 
 def get_system_info():
     """Get basic system information"""
-    uname = platform.uname()
-    return {
-        "system": uname.system,
-        "node": uname.node,
-        "release": uname.release,
-        "version": uname.version,
-        "machine": uname.machine,
-        "processor": uname.processor if uname.processor else "Unknown",
-        "python_version": platform.python_version(),
-        "boot_time": datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
-    }
+    static = get_static_info()
+    return {key: static[key] for key in
+            ("system", "node", "release", "version", "machine", "processor", "python_version", "boot_time")}
 
 def get_cpu_info():
     """Get CPU information"""
-    cpu_percent = psutil.cpu_percent(interval=None)
-    cpu_count = psutil.cpu_count(logical=True)
-    cpu_freq = psutil.cpu_freq()
-    
-    cpu_history.append(cpu_percent)
+    sampler = get_sampler()
+    sample = sampler.current()
     
     return {
-        "percent": cpu_percent,
-        "count": cpu_count,
-        "freq_current": cpu_freq.current if cpu_freq else "N/A",
-        "freq_max": cpu_freq.max if cpu_freq and cpu_freq.max else "N/A",
-        "history": list(cpu_history)
+        "percent": sample["cpu_percent"],
+        "count": sampler.static["cpu_count"],
+        "freq_current": sample["cpu_freq_current"],
+        "freq_max": sampler.static["cpu_freq_max"],
+        "history": sampler.history("cpu_percent", HISTORY_LENGTH)
     }
 
 def get_memory_info():
     """Get memory information"""
-    mem = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-    
-    memory_percent = mem.percent
-    memory_history.append(memory_percent)
+    sampler = get_sampler()
+    sample = sampler.current()
     
     return {
-        "total": mem.total,
-        "available": mem.available,
-        "used": mem.used,
-        "percent": memory_percent,
-        "swap_total": swap.total,
-        "swap_used": swap.used,
-        "swap_percent": swap.percent,
-        "history": list(memory_history)
+        "total": sample["memory_total"],
+        "available": sample["memory_available"],
+        "used": sample["memory_used"],
+        "percent": sample["memory_percent"],
+        "swap_total": sample["swap_total"],
+        "swap_used": sample["swap_used"],
+        "swap_percent": sample["swap_percent"],
+        "history": sampler.history("memory_percent", HISTORY_LENGTH)
     }
 
 def get_disk_info():
-    """Get disk information"""
-    partitions = []
-    for part in psutil.disk_partitions(all=False):
-        if os.name == 'nt' and ('cdrom' in part.opts or part.fstype == ''):
-            # Skip CD-ROM on Windows
-            continue
-        try:
-            usage = psutil.disk_usage(part.mountpoint)
-            partitions.append({
-                "device": part.device,
-                "mountpoint": part.mountpoint,
-                "fstype": part.fstype,
-                "total": usage.total,
-                "used": usage.used,
-                "free": usage.free,
-                "percent": usage.percent
-            })
-        except PermissionError:
-            # Skip if we don't have permission
-            continue
-    
-    return partitions
+    """Get disk information (partition usage is refreshed on a slower cadence)"""
+    return get_sampler().disks()
 
 def get_network_info():
     """Get network information"""
-    global last_net_io, last_net_time
-    
-    current_net_io = psutil.net_io_counters()
-    current_time = time.time()
-    
-    # Calculate rates
-    time_delta = current_time - last_net_time
-    recv_rate = (current_net_io.bytes_recv - last_net_io.bytes_recv) / time_delta
-    sent_rate = (current_net_io.bytes_sent - last_net_io.bytes_sent) / time_delta
-    
-    # Update histories
-    net_recv_history.append(recv_rate)
-    net_sent_history.append(sent_rate)
-    
-    # Update last values
-    last_net_io = current_net_io
-    last_net_time = current_time
+    sampler = get_sampler()
+    sample = sampler.current()
     
     return {
-        "bytes_sent": current_net_io.bytes_sent,
-        "bytes_recv": current_net_io.bytes_recv,
-        "packets_sent": current_net_io.packets_sent,
-        "packets_recv": current_net_io.packets_recv,
-        "sent_rate": sent_rate,
-        "recv_rate": recv_rate,
-        "sent_history": list(net_sent_history),
-        "recv_history": list(net_recv_history)
+        "bytes_sent": sample["bytes_sent"],
+        "bytes_recv": sample["bytes_recv"],
+        "packets_sent": sample["packets_sent"],
+        "packets_recv": sample["packets_recv"],
+        "sent_rate": sample["net_sent_rate"],
+        "recv_rate": sample["net_recv_rate"],
+        "sent_history": sampler.history("net_sent_rate", HISTORY_LENGTH),
+        "recv_history": sampler.history("net_recv_rate", HISTORY_LENGTH)
     }
 
+def get_process_info(count=10, sort="cpu"):
+    """Get the top processes by CPU, resident memory or I/O ("cpu", "rss" or "io")"""
+    table = get_process_table(io=sort == "io")
+    table.refresh()
+    return table.top(count, sort)
+
 def format_bytes(bytes_value):
     """Format bytes to human-readable format"""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -203,6 +178,7 @@ def main(stdscr):
     
     # Get initial system info (static data)
     system_info = get_system_info()
+    get_sampler().min_interval = UPDATE_INTERVAL / 2
     
     # Main loop
     try:
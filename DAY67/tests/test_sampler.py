@@ -0,0 +1,150 @@
+"""
+Tests for the sampler module.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from sampler import FIELDS, RESOLUTIONS, RingBuffer, Sampler
+
+# An hour boundary, so every resolution's buckets start at BASE
+BASE = 999997200.0
+
+
+def record(timestamp, value):
+    """Build a ring record with every metric set to value."""
+    return [timestamp] + [value] * (len(FIELDS) - 1)
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Test cases for the memory-mapped ring buffer."""
+
+    def setUp(self):
+        """Create a temporary directory for history files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "history.ring")
+        self.resolutions = {"1s": (1, 4), "1min": (60, 3)}
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_wraparound(self):
+        """Test that the ring keeps the newest records, oldest first, across the wrap."""
+        ring = RingBuffer(resolutions=self.resolutions)
+        self.assertEqual(ring.column("1s", "cpu_percent", 10), [])
+        self.assertIsNone(ring.latest("1s"))
+
+        for i in range(6):
+            ring.append("1s", record(BASE + i, i))
+
+        self.assertEqual(ring.count("1s"), 4)
+        self.assertEqual(ring.count("1min"), 0)
+        self.assertEqual(ring.column("1s", "cpu_percent", 10), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(ring.column("1s", "timestamp", 3), [BASE + 3, BASE + 4, BASE + 5])
+        self.assertEqual(ring.latest("1s")["memory_used"], 5.0)
+        ring.close()
+
+    def test_reopen_file(self):
+        """Test that records survive reopening the file, read-only or not."""
+        ring = RingBuffer(self.path, resolutions=self.resolutions)
+        for i in range(5):
+            ring.append("1s", record(BASE + i, i))
+        ring.close()
+
+        reader = RingBuffer(self.path, resolutions=self.resolutions, readonly=True)
+        self.assertEqual(reader.column("1s", "cpu_percent", 4), [1.0, 2.0, 3.0, 4.0])
+        reader.close()
+
+        writer = RingBuffer(self.path, resolutions=self.resolutions)
+        writer.append("1s", record(BASE + 5, 5))
+        self.assertEqual(writer.column("1s", "cpu_percent", 4), [2.0, 3.0, 4.0, 5.0])
+        writer.close()
+
+    def test_incompatible_file(self):
+        """Test that a read-only ring refuses a file with another layout."""
+        RingBuffer(self.path, resolutions=self.resolutions).close()
+        with self.assertRaises(ValueError):
+            RingBuffer(self.path, resolutions={"1s": (1, 5)}, readonly=True)
+
+
+class TestSampler(unittest.TestCase):
+    """Test cases for recording and downsampling samples."""
+
+    def setUp(self):
+        """Create a sampler writing to a temporary history file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "history", "history.ring")
+        self.sampler = Sampler(self.path)
+
+    def tearDown(self):
+        """Close the sampler and clean up the temporary directory."""
+        self.sampler.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_one_sample_per_second(self):
+        """Test that ticks within the same second record a single sample."""
+        self.assertTrue(self.sampler.writable)
+        for timestamp in (BASE, BASE + 0.2, BASE + 0.9, BASE + 1.1):
+            with mock.patch("time.time", return_value=timestamp):
+                self.sampler.tick()
+
+        self.assertEqual(self.sampler.ring.count("1s"), 2)
+        self.assertEqual(self.sampler.history("timestamp", 3), [0, BASE, BASE + 1.1])
+        self.assertEqual(self.sampler.current()["timestamp"], BASE + 1.1)
+
+    def test_downsampling(self):
+        """Test that per-second samples are averaged into 1min and 1h records as buckets close."""
+        samples = [(0, 1.0), (1, 2.0), (30, 3.0), (59, 6.0), (60, 10.0), (61, 20.0),
+                   (3600, 100.0), (3601, 200.0)]
+        for offset, value in samples:
+            self.sampler._record(record(BASE + offset, value))
+
+        ring = self.sampler.ring
+        self.assertEqual(ring.count("1s"), len(samples))
+        self.assertEqual(ring.column("1min", "timestamp", 10), [BASE, BASE + 60])
+        self.assertEqual(ring.column("1min", "cpu_percent", 10), [3.0, 15.0])
+        self.assertEqual(ring.column("1h", "timestamp", 10), [BASE])
+        self.assertEqual(ring.column("1h", "net_sent_rate", 10), [7.0])
+        # The buckets starting at BASE + 3600 are still open
+        self.assertEqual(self.sampler.history("cpu_percent", 3, "1h"), [0, 0, 7.0])
+        self.assertEqual(set(self.sampler._buckets), set(RESOLUTIONS) - {"1s"})
+
+    @unittest.skipIf(os.name == "nt", "history file locking needs fcntl")
+    def test_read_only_when_locked_by_another_process(self):
+        """Test that a second monitor reads the shared history without writing to it."""
+        self.sampler._record(record(BASE, 42.0))
+        self.sampler.close()
+
+        holder = subprocess.Popen(
+            [sys.executable, "-c",
+             "import fcntl, sys\n"
+             "f = open(sys.argv[1], 'a')\n"
+             "fcntl.flock(f.fileno(), fcntl.LOCK_EX)\n"
+             "print('locked', flush=True)\n"
+             "sys.stdin.read()\n",
+             self.path + ".lock"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        try:
+            self.assertEqual(holder.stdout.readline().strip(), "locked")
+            self.sampler = Sampler(self.path)
+            self.assertFalse(self.sampler.writable)
+            self.assertEqual(self.sampler.history("cpu_percent", 2), [0, 42.0])
+
+            with mock.patch("time.time", return_value=BASE + 5):
+                sample = self.sampler.tick()
+            self.assertEqual(sample["timestamp"], BASE + 5)
+            self.assertEqual(self.sampler.ring.count("1s"), 1)
+        finally:
+            holder.stdin.close()
+            holder.wait()
+            holder.stdout.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
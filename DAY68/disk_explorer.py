@@ -9,6 +9,11 @@ import os
 import sys
 import argparse
 from file_analyzer import scan_directory, format_size, get_directory_summary
+from scan_index import DEFAULT_INDEX_PATH, ScanIndex
+from duplicates import find_duplicates, format_duplicates
+
+# How long interactive mode trusts an index refresh before checking the tree again
+INTERACTIVE_MAX_AGE = 60
 
 
 def create_bar_chart(data, max_width=50):
@@ -40,16 +45,32 @@ def create_bar_chart(data, max_width=50):
     return "\n".join(chart)
 
 
-def find_large_files(directory, min_size_mb=100, count=20):
+def run_scan(directory, index=None, max_age=0, **scan_options):
+    """Scan a directory, answering from the scan index when one is given."""
+    if index is None:
+        return scan_directory(directory, keep_files=False, **scan_options)
+    return index.scan_result(directory, min_size=scan_options.get("min_size", 0),
+                             workers=scan_options.get("workers"), max_age=max_age)
+
+
+def find_large_files(directory, min_size_mb=100, count=20, index=None, max_age=0, **scan_options):
     """Find large files in a directory."""
-    min_size_bytes = min_size_mb * 1024 * 1024
-    scan_result = scan_directory(directory, min_size=min_size_bytes)
-    
-    if "error" in scan_result:
-        return scan_result["error"]
+    min_size_bytes = int(min_size_mb * 1024 * 1024)
     
-    # Sort all files by size
-    sorted_files = sorted(scan_result["files"], key=lambda x: x["size"], reverse=True)
+    if index is not None:
+        if not os.path.isdir(directory):
+            return f"Directory does not exist or is not accessible: {directory}"
+        index.update(directory, workers=scan_options.get("workers"), max_age=max_age)
+        sorted_files = index.largest_files(directory, count, min_size=min_size_bytes)
+    else:
+        # Only the top `count` files are needed, so skip the per-file list
+        scan_result = scan_directory(directory, min_size=min_size_bytes, top_n=count, keep_files=False,
+                                     **scan_options)
+        
+        if "error" in scan_result:
+            return scan_result["error"]
+        
+        sorted_files = scan_result["largest_files"]
     
     result = []
     result.append(f"Top {min(count, len(sorted_files))} largest files in {directory}:")
@@ -66,9 +87,9 @@ def find_large_files(directory, min_size_mb=100, count=20):
     return "\n".join(result)
 
 
-def analyze_dir_types(directory):
+def analyze_dir_types(directory, index=None, max_age=0, **scan_options):
     """Analyze file types in a directory and display as chart."""
-    scan_result = scan_directory(directory)
+    scan_result = run_scan(directory, index, max_age, **scan_options)
     
     if "error" in scan_result:
         return scan_result["error"]
@@ -83,8 +104,21 @@ def analyze_dir_types(directory):
     return "\n".join(result)
 
 
-def interactive_mode():
-    """Run in interactive mode."""
+def find_duplicate_files(directory, min_size_mb=0, count=20, index=None, processes=None, **scan_options):
+    """Find duplicate files in a directory."""
+    min_size_bytes = max(1, int(min_size_mb * 1024 * 1024))
+    result = find_duplicates(directory, min_size=min_size_bytes, workers=scan_options.get("workers"),
+                             processes=processes, index=index)
+    return format_duplicates(result, count)
+
+
+def interactive_mode(index=None):
+    """
+    Run in interactive mode.
+    
+    When a scan index is given, it is shared by all menu options, and a tree
+    refreshed less than INTERACTIVE_MAX_AGE seconds ago is not rechecked.
+    """
     print("Disk Explorer - Interactive Mode")
     print("--------------------------------")
     
@@ -93,9 +127,10 @@ def interactive_mode():
         print("1. Scan directory")
         print("2. Find large files")
         print("3. Analyze file types")
-        print("4. Exit")
+        print("4. Find duplicate files")
+        print("5. Exit")
         
-        choice = input("\nEnter your choice (1-4): ")
+        choice = input("\nEnter your choice (1-5): ")
         
         if choice == "1":
             directory = input("Enter directory path (or press Enter for current directory): ")
@@ -107,7 +142,7 @@ def interactive_mode():
                 continue
                 
             print(f"\nScanning {directory}...")
-            result = scan_directory(directory)
+            result = run_scan(directory, index, INTERACTIVE_MAX_AGE)
             print("\n" + get_directory_summary(result))
             
         elif choice == "2":
@@ -127,7 +162,7 @@ def interactive_mode():
                 continue
                 
             print(f"\nSearching for large files in {directory}...")
-            print("\n" + find_large_files(directory, min_size, count))
+            print("\n" + find_large_files(directory, min_size, count, index, INTERACTIVE_MAX_AGE))
             
         elif choice == "3":
             directory = input("Enter directory path (or press Enter for current directory): ")
@@ -139,9 +174,28 @@ def interactive_mode():
                 continue
                 
             print(f"\nAnalyzing file types in {directory}...")
-            print("\n" + analyze_dir_types(directory))
+            print("\n" + analyze_dir_types(directory, index, INTERACTIVE_MAX_AGE))
             
         elif choice == "4":
+            directory = input("Enter directory path (or press Enter for current directory): ")
+            if not directory:
+                directory = os.getcwd()
+                
+            if not os.path.exists(directory):
+                print(f"Error: Directory '{directory}' does not exist.")
+                continue
+                
+            try:
+                min_size = float(input("Minimum file size in MB (default: 0): ") or "0")
+                count = int(input("Number of groups to show (default: 20): ") or "20")
+            except ValueError:
+                print("Error: Please enter valid numbers.")
+                continue
+                
+            print(f"\nSearching for duplicate files in {directory}...")
+            print("\n" + find_duplicate_files(directory, min_size, count, index))
+            
+        elif choice == "5":
             print("Goodbye!")
             break
             
@@ -158,34 +212,68 @@ def main():
     command_group.add_argument("--scan", "-s", metavar="DIR", help="Scan a directory and show summary")
     command_group.add_argument("--large", "-l", metavar="DIR", help="Find large files in a directory")
     command_group.add_argument("--types", "-t", metavar="DIR", help="Analyze file types in a directory")
+    command_group.add_argument("--duplicates", "-d", metavar="DIR", help="Find duplicate files in a directory")
     command_group.add_argument("--interactive", "-i", action="store_true", help="Run in interactive mode")
     
     # Additional options
-    parser.add_argument("--min-size", type=int, default=100, help="Minimum file size in MB (for --large)")
-    parser.add_argument("--count", type=int, default=20, help="Number of files to show (for --large)")
+    parser.add_argument("--min-size", type=float, default=None,
+                        help="Minimum file size in MB (default: 100 for --large, 0 for --duplicates)")
+    parser.add_argument("--count", type=int, default=20, help="Number of files or groups to show (for --large/--duplicates)")
+    parser.add_argument("--processes", type=int, default=None, help="Hashing processes for --duplicates (0 to hash in-process)")
+    parser.add_argument("--max-depth", type=int, default=None, help="Maximum directory depth to scan (default: unlimited)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of scanner threads")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help=f"Scan index file (default: {DEFAULT_INDEX_PATH})")
+    parser.add_argument("--no-index", action="store_true", help="Scan the tree directly instead of using the index")
+    parser.add_argument("--rescan", "--full", action="store_true",
+                        help="Re-list every indexed directory, picking up files changed in place")
     
     args = parser.parse_args()
     
-    # Run in interactive mode if no arguments or --interactive is specified
-    if args.interactive or len(sys.argv) == 1:
-        interactive_mode()
-        return
+    # The index covers whole trees, so a depth-limited scan bypasses it
+    index = None if args.no_index or args.max_depth is not None else ScanIndex(args.index)
     
-    # Handle scan command
-    if args.scan:
-        target_dir = args.scan if os.path.exists(args.scan) else os.getcwd()
-        result = scan_directory(target_dir)
-        print(get_directory_summary(result))
+    try:
+        # Run in interactive mode if no arguments or --interactive is specified
+        if args.interactive or len(sys.argv) == 1:
+            interactive_mode(index)
+            return
+        
+        scan_options = {"workers": args.workers}
+        if index is None:
+            scan_options["max_depth"] = args.max_depth
         
-    # Handle large files command
-    elif args.large:
-        target_dir = args.large if os.path.exists(args.large) else os.getcwd()
-        print(find_large_files(target_dir, args.min_size, args.count))
+        # Files rewritten in place do not touch their directory's mtime, so an
+        # incremental refresh misses them; the command's own refresh after a
+        # full one has nothing left to re-list
+        target_dir = args.scan or args.large or args.types or args.duplicates
+        if args.rescan and index is not None and target_dir and os.path.isdir(target_dir):
+            index.update(target_dir, workers=args.workers, full=True)
         
-    # Handle file types command
-    elif args.types:
-        target_dir = args.types if os.path.exists(args.types) else os.getcwd()
-        print(analyze_dir_types(target_dir))
+        # Handle scan command
+        if args.scan:
+            target_dir = args.scan if os.path.exists(args.scan) else os.getcwd()
+            result = run_scan(target_dir, index, **scan_options)
+            print(get_directory_summary(result))
+            
+        # Handle large files command
+        elif args.large:
+            target_dir = args.large if os.path.exists(args.large) else os.getcwd()
+            min_size = 100 if args.min_size is None else args.min_size
+            print(find_large_files(target_dir, min_size, args.count, index, **scan_options))
+            
+        # Handle file types command
+        elif args.types:
+            target_dir = args.types if os.path.exists(args.types) else os.getcwd()
+            print(analyze_dir_types(target_dir, index, **scan_options))
+            
+        # Handle duplicate files command
+        elif args.duplicates:
+            target_dir = args.duplicates if os.path.exists(args.duplicates) else os.getcwd()
+            print(find_duplicate_files(target_dir, args.min_size or 0, args.count, index, args.processes,
+                                       **scan_options))
+    finally:
+        if index is not None:
+            index.close()
 
 
 if __name__ == "__main__":
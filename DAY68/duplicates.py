@@ -0,0 +1,239 @@
+"""
+Disk Explorer - Duplicate File Finder
+Day 68 of 365 Days of Python
+
+This module finds duplicate files in three narrowing passes: files are
+grouped by size, then by a hash of their first and last 64 KiB, and only
+the files still colliding are hashed in full. Hashing runs in a process
+pool, and hashes are cached in the scan index so unchanged files are not
+read again.
+"""
+
+import hashlib
+import mmap
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from file_analyzer import FileRecord, format_size, scan_directory
+
+# Bytes hashed from each end of a file in the partial pass
+PARTIAL_BYTES = 64 * 1024
+
+# Files up to this size are fully covered by the partial hash
+PARTIAL_COVERS_FILE = 2 * PARTIAL_BYTES
+
+# Chunk size for full-content hashing
+CHUNK_SIZE = 1024 * 1024
+
+# Below this many files the process pool costs more than it saves
+MIN_PARALLEL_FILES = 64
+
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=20)
+
+
+def partial_hash(path, size):
+    """Hash a file's size plus its first and last PARTIAL_BYTES."""
+    digest = _new_hash()
+    digest.update(size.to_bytes(8, "little"))
+    with open(path, "rb") as f:
+        digest.update(f.read(PARTIAL_BYTES))
+        if size > PARTIAL_BYTES:
+            f.seek(max(PARTIAL_BYTES, size - PARTIAL_BYTES))
+            digest.update(f.read(PARTIAL_BYTES))
+    return digest.hexdigest()
+
+
+def full_hash(path):
+    """Hash a file's whole content, memory-mapped and in CHUNK_SIZE pieces."""
+    digest = _new_hash()
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for offset in range(0, len(view), CHUNK_SIZE):
+                        digest.update(view[offset:offset + CHUNK_SIZE])
+        except (ValueError, OSError):
+            # Empty files and file systems that do not support mmap
+            f.seek(0)
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_task(task):
+    """Process pool entry point: (kind, path, size) -> (path, digest or None)."""
+    kind, path, size = task
+    try:
+        if kind == "partial":
+            return path, partial_hash(path, size)
+        return path, full_hash(path)
+    except OSError:
+        return path, None
+
+
+def _run_hashes(tasks, processes):
+    """Hash files, in a process pool when there are enough of them."""
+    if not tasks:
+        return {}
+    if processes == 0 or len(tasks) < MIN_PARALLEL_FILES:
+        return dict(map(_hash_task, tasks))
+
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return dict(pool.map(_hash_task, tasks, chunksize=chunksize))
+
+
+def _collisions(groups):
+    """Keep only groups with more than one member."""
+    return {key: members for key, members in groups.items() if len(members) > 1}
+
+
+def _same_size(records):
+    """Return the records that share their size with another record."""
+    by_size = defaultdict(list)
+    for record in records:
+        by_size[record.size].append(record)
+    return [record for members in _collisions(by_size).values() for record in members]
+
+
+def _restat(records, absolute):
+    """Refresh size and mtime from the file system, dropping files that are gone."""
+    current = []
+    for record in records:
+        try:
+            stat = os.stat(absolute[record.path])
+        except OSError:
+            continue
+        current.append(FileRecord(record.path, stat.st_size, record.type, stat.st_mtime))
+    return current
+
+
+def find_duplicates(directory, min_size=1, include_hidden=False, workers=None, processes=None, index=None):
+    """
+    Find groups of files with identical content.
+
+    Args:
+        directory: Directory to search
+        min_size: Minimum file size in bytes to consider
+        include_hidden: Whether to include hidden files and directories
+        workers: Number of scanner threads
+        processes: Hashing processes (None for one per CPU, 0 to hash in-process)
+        index: Optional ScanIndex used for the file list and to cache hashes
+
+    Returns:
+        dict: Duplicate groups, largest reclaimable space first, plus statistics
+    """
+    if not os.path.isdir(directory):
+        return {"error": f"Directory does not exist or is not accessible: {directory}", "groups": []}
+
+    start_time = time.perf_counter()
+    root = os.path.abspath(directory)
+
+    # Pass 1: group by size
+    if index is not None:
+        index.update(root, workers=workers)
+        records = index.size_collisions(root, min_size, include_hidden)
+    else:
+        records = scan_directory(root, min_size=min_size, include_hidden=include_hidden, workers=workers)["files"]
+
+    candidates = _same_size(records)
+    absolute = {record.path: os.path.join(root, record.path) for record in candidates}
+
+    # Cached hashes are only trusted if the file's size and mtime are unchanged.
+    # The index does not re-stat files in directories whose mtime is unchanged,
+    # so an in-place edit leaves a stale size and mtime there: compare with
+    # the files' live stat instead.
+    cached = {}
+    if index is not None:
+        candidates = _same_size(_restat(candidates, absolute))
+        stored = index.cached_hashes(absolute.values())
+        for record in candidates:
+            entry = stored.get(absolute[record.path])
+            if entry and entry[0] == record.size and entry[1] == record.mtime:
+                cached[record.path] = entry
+    partials = {path: entry[2] for path, entry in cached.items() if entry[2]}
+    fulls = {path: entry[3] for path, entry in cached.items() if entry[3]}
+    cache_hits = len(partials)
+
+    # Pass 2: hash the first and last PARTIAL_BYTES
+    tasks = [("partial", absolute[r.path], r.size) for r in candidates if r.path not in partials]
+    hashed = _run_hashes(tasks, processes)
+    partials.update((r.path, hashed[absolute[r.path]]) for r in candidates
+                    if r.path not in partials and hashed.get(absolute[r.path]))
+
+    by_partial = defaultdict(list)
+    for record in candidates:
+        if record.path in partials:
+            by_partial[(record.size, partials[record.path])].append(record)
+    finalists = [record for members in _collisions(by_partial).values() for record in members]
+
+    # Pass 3: full-content hash, unless the partial hash already covered the whole file
+    for record in finalists:
+        if record.size <= PARTIAL_COVERS_FILE:
+            fulls[record.path] = partials[record.path]
+    tasks = [("full", absolute[r.path], r.size) for r in finalists if r.path not in fulls]
+    full_hashed = _run_hashes(tasks, processes)
+    fulls.update((r.path, full_hashed[absolute[r.path]]) for r in finalists
+                 if r.path not in fulls and full_hashed.get(absolute[r.path]))
+
+    by_content = defaultdict(list)
+    for record in finalists:
+        if record.path in fulls:
+            by_content[(record.size, fulls[record.path])].append(record)
+
+    if index is not None:
+        index.store_hashes([
+            (absolute[r.path], r.size, r.mtime, partials[r.path], fulls.get(r.path))
+            for r in candidates if r.path in partials
+        ])
+
+    groups = [
+        {
+            "size": size,
+            "hash": content_hash,
+            "paths": sorted(record.path for record in members),
+            "reclaimable": size * (len(members) - 1),
+        }
+        for (size, content_hash), members in _collisions(by_content).items()
+    ]
+    groups.sort(key=lambda group: group["reclaimable"], reverse=True)
+
+    return {
+        "directory": root,
+        "groups": groups,
+        "duplicate_files": sum(len(group["paths"]) - 1 for group in groups),
+        "reclaimable": sum(group["reclaimable"] for group in groups),
+        "size_candidates": len(candidates),
+        "partial_hashed": len(hashed),
+        "full_hashed": len(full_hashed),
+        "cache_hits": cache_hits,
+        "duration": time.perf_counter() - start_time,
+    }
+
+
+def format_duplicates(result, count=20):
+    """Format the largest duplicate groups for display."""
+    if "error" in result:
+        return result["error"]
+
+    lines = []
+    lines.append(f"Duplicate files in {result['directory']}:")
+    lines.append(f"{result['duplicate_files']} redundant copies, {format_size(result['reclaimable'])} reclaimable")
+    lines.append(f"(checked {result['size_candidates']} same-size files: {result['partial_hashed']} partial "
+                 f"and {result['full_hashed']} full hashes, {result['cache_hits']} cached, "
+                 f"took {result['duration']:.2f} seconds)")
+    lines.append("")
+
+    for i, group in enumerate(result["groups"][:count], 1):
+        lines.append(f"{i}. {len(group['paths'])} copies of {format_size(group['size'])} "
+                     f"({format_size(group['reclaimable'])} reclaimable)")
+        for path in group["paths"]:
+            lines.append(f"   {path}")
+        lines.append("")
+
+    return "\n".join(lines)
@@ -1,6 +1,8 @@
+import heapq
 import os
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 
 
@@ -11,42 +13,282 @@ def get_file_size(file_path):
         return 0
 
 
+# Group file types
+FILE_TYPE_GROUPS = {
+    "image": ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp'],
+    "video": ['mp4', 'avi', 'mov', 'mkv', 'flv', 'wmv', 'webm'],
+    "audio": ['mp3', 'wav', 'ogg', 'flac', 'aac', 'm4a'],
+    "document": ['pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'txt', 'csv'],
+    "archive": ['zip', 'rar', '7z', 'tar', 'gz', 'bz2'],
+    "code": ['py', 'js', 'html', 'css', 'java', 'c', 'cpp', 'h', 'php', 'rb'],
+}
+
+# Extension (without the dot) -> file type, built once instead of per file
+EXTENSION_TYPES = {ext: file_type for file_type, exts in FILE_TYPE_GROUPS.items() for ext in exts}
+
+
 def get_file_type(file_path):
     """Determine file type based on extension."""
     _, ext = os.path.splitext(file_path)
-    ext = ext.lower()
     
     if not ext:
         return "unknown"
     
     # Remove the dot from extension
-    ext = ext[1:]
-    
-    # Group file types
-    image_types = ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp']
-    video_types = ['mp4', 'avi', 'mov', 'mkv', 'flv', 'wmv', 'webm']
-    audio_types = ['mp3', 'wav', 'ogg', 'flac', 'aac', 'm4a']
-    document_types = ['pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'txt', 'csv']
-    archive_types = ['zip', 'rar', '7z', 'tar', 'gz', 'bz2']
-    code_types = ['py', 'js', 'html', 'css', 'java', 'c', 'cpp', 'h', 'php', 'rb']
-    
-    if ext in image_types:
-        return "image"
-    elif ext in video_types:
-        return "video"
-    elif ext in audio_types:
-        return "audio"
-    elif ext in document_types:
-        return "document"
-    elif ext in archive_types:
-        return "archive"
-    elif ext in code_types:
-        return "code"
-    else:
-        return "other"
+    return EXTENSION_TYPES.get(ext[1:].lower(), "other")
+
+
+def format_timestamp(timestamp):
+    """Format a modification time the way scan results display it."""
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
 
+def default_workers():
+    """Default scanner thread count; scanning is I/O bound, so oversubscribe the CPUs."""
+    return min(32, (os.cpu_count() or 1) + 4)
 
-def scan_directory(directory_path, min_size=0, include_hidden=False):
+
+class FileRecord:
+    """
+    Compact per-file scan record.
+    
+    Uses __slots__ instead of a per-file dict, and still supports
+    record["size"]-style access so callers can treat it like the dicts
+    scan_directory used to return. The display date is formatted on demand.
+    """
+    
+    __slots__ = ("path", "size", "type", "mtime")
+    
+    def __init__(self, path, size, file_type, mtime):
+        self.path = path
+        self.size = size
+        self.type = file_type
+        self.mtime = mtime
+    
+    @property
+    def modified(self):
+        return format_timestamp(self.mtime)
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def to_dict(self):
+        return {"path": self.path, "size": self.size, "type": self.type, "modified": self.modified}
+    
+    def __repr__(self):
+        return f"FileRecord({self.path!r}, {self.size}, {self.type!r})"
+
+
+class ScanAccumulator:
+    """
+    Streaming aggregation of scanned files.
+    
+    Keeps running totals, bytes per type and a bounded min-heap of the top_n
+    largest files. The full per-file list is only kept when keep_files is
+    set, so memory stays constant in the number of files otherwise.
+    """
+    
+    __slots__ = ("top_n", "files", "type_stats", "total_size", "file_count", "_heap", "_seq")
+    
+    def __init__(self, top_n=10, keep_files=True):
+        self.top_n = top_n
+        self.files = [] if keep_files else None
+        self.type_stats = defaultdict(int)
+        self.total_size = 0
+        self.file_count = 0
+        self._heap = []
+        self._seq = 0
+    
+    def add(self, prefix, name, size, mtime):
+        """Account for one file; the record is only built if it is kept or ranked."""
+        file_type = get_file_type(name)
+        self.type_stats[file_type] += size
+        self.total_size += size
+        self.file_count += 1
+        
+        record = None
+        if self.files is not None:
+            record = FileRecord(prefix + name, size, file_type, mtime)
+            self.files.append(record)
+        
+        heap = self._heap
+        if len(heap) < self.top_n or size > heap[0][0]:
+            if record is None:
+                record = FileRecord(prefix + name, size, file_type, mtime)
+            # The sequence number breaks size ties without comparing records
+            self._seq += 1
+            item = (size, self._seq, record)
+            if len(heap) < self.top_n:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heapreplace(heap, item)
+    
+    def largest(self):
+        """Return the ranked records, largest first."""
+        return [record for _, _, record in sorted(self._heap, key=lambda x: x[0], reverse=True)]
+    
+    @classmethod
+    def merge(cls, partials, top_n=10, keep_files=True):
+        """Combine per-worker accumulators into one."""
+        merged = cls(top_n, keep_files)
+        for partial in partials:
+            if keep_files:
+                merged.files.extend(partial.files)
+            for file_type, size in partial.type_stats.items():
+                merged.type_stats[file_type] += size
+            merged.total_size += partial.total_size
+            merged.file_count += partial.file_count
+            merged._heap.extend(partial._heap)
+        # Sequence numbers are per worker, so renumber before heapify can
+        # fall through to comparing the records of equal-sized files
+        largest = heapq.nlargest(top_n, merged._heap, key=lambda x: x[0])
+        merged._heap = [(size, seq, record) for seq, (size, _, record) in enumerate(largest, 1)]
+        merged._seq = len(merged._heap)
+        heapq.heapify(merged._heap)
+        return merged
+
+
+class DirectoryScanner:
+    """
+    Parallel directory scanner built on os.scandir.
+    
+    Each worker thread owns a deque of pending directories. New subdirectories
+    are pushed onto the worker's own deque and popped from the same end, so a
+    worker walks its subtree depth-first; an idle worker steals the oldest
+    (shallowest, usually largest) pending directory from another worker.
+    File sizes and mtimes come from DirEntry.stat(), which reuses the data
+    returned by the directory read where the platform provides it.
+    """
+    
+    def __init__(self, directory_path, min_size=0, include_hidden=False, max_depth=None, workers=None,
+                 top_n=10, keep_files=True):
+        self.root = directory_path
+        self.min_size = min_size
+        self.include_hidden = include_hidden
+        self.max_depth = max_depth
+        self.workers = workers or default_workers()
+        self.top_n = top_n
+        self.keep_files = keep_files
+        self._queues = [deque() for _ in range(self.workers)]
+        self._pending = 0
+        self._lock = threading.Lock()
+        # Idle workers wait here until a directory is queued or the scan ends
+        self._work = threading.Condition(self._lock)
+        self._done = False
+        self.errors = 0
+    
+    def _push(self, worker_id, rel_dir, depth):
+        with self._work:
+            self._pending += 1
+            self._queues[worker_id].append((rel_dir, depth))
+            self._work.notify()
+    
+    def _next_directory(self, worker_id):
+        """Pop from our own deque, or steal from another worker's."""
+        try:
+            return self._queues[worker_id].pop()
+        except IndexError:
+            pass
+        for offset in range(1, self.workers):
+            try:
+                return self._queues[(worker_id + offset) % self.workers].popleft()
+            except IndexError:
+                continue
+        return None
+    
+    def _record_error(self):
+        with self._lock:
+            self.errors += 1
+    
+    def _finish_directory(self):
+        with self._work:
+            self._pending -= 1
+            if self._pending == 0:
+                self._done = True
+                self._work.notify_all()
+    
+    def _new_partial(self):
+        """Per-worker result container."""
+        return ScanAccumulator(self.top_n, self.keep_files)
+    
+    def _merge(self, partials):
+        return ScanAccumulator.merge(partials, self.top_n, self.keep_files)
+    
+    def _scan_one(self, worker_id, rel_dir, depth, accumulator):
+        """Scan a single directory, queueing its subdirectories."""
+        path = os.path.join(self.root, rel_dir) if rel_dir else self.root
+        prefix = rel_dir + os.sep if rel_dir else ""
+        descend = self.max_depth is None or depth < self.max_depth
+        
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not self.include_hidden and name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if descend:
+                                self._push(worker_id, prefix + name, depth + 1)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        self._record_error()
+                        continue
+                    
+                    # Skip files smaller than min_size
+                    if stat.st_size < self.min_size:
+                        continue
+                    
+                    accumulator.add(prefix, name, stat.st_size, stat.st_mtime)
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            self._record_error()
+    
+    def _worker(self, worker_id, partial):
+        while True:
+            item = self._next_directory(worker_id)
+            if item is None:
+                with self._work:
+                    # Queues only grow under the lock, so no push is missed here
+                    while not self._done and not any(self._queues):
+                        self._work.wait()
+                    if self._done:
+                        return
+                continue
+            try:
+                self._scan_one(worker_id, item[0], item[1], partial)
+            finally:
+                self._finish_directory()
+    
+    def scan(self):
+        """
+        Scan the tree and return the merged per-worker results.
+        
+        Returns:
+            ScanAccumulator: Totals, type stats, the largest files and, if
+            keep_files is set, one FileRecord per file (path relative to the root)
+        """
+        self._push(0, "", 0)
+        partial_results = [self._new_partial() for _ in range(self.workers)]
+        threads = [
+            threading.Thread(target=self._worker, args=(i, partial_results[i]), daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self._merge(partial_results)
+
+
+def scan_directory(directory_path, min_size=0, include_hidden=False, max_depth=None, workers=None,
+                   top_n=10, keep_files=True):
     """
     Scan a directory and return information about files and subdirectories.
     
@@ -54,6 +296,12 @@ def scan_directory(directory_path, min_size=0, include_hidden=False):
         directory_path: Path to directory to scan
         min_size: Minimum file size in bytes to include in results
         include_hidden: Whether to include hidden files and directories
+        max_depth: How many directory levels below directory_path to descend
+            (0 scans only the top level; None means unlimited)
+        workers: Number of scanner threads (defaults to default_workers())
+        top_n: Number of largest files to report
+        keep_files: Whether to return the per-file list; without it only the
+            aggregates and the top_n largest files are kept in memory
         
     Returns:
         dict: Dictionary containing scan results
@@ -67,70 +315,27 @@ def scan_directory(directory_path, min_size=0, include_hidden=False):
             "largest_files": []
         }
     
-    files = []
-    largest_files = []
-    type_stats = defaultdict(int)
-    total_size = 0
-    
     # Start time for performance tracking
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    for root, dirs, filenames in os.walk(directory_path):
-        # Skip hidden directories if not included
-        if not include_hidden:
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            filenames = [f for f in filenames if not f.startswith('.')]
-        
-        for filename in filenames:
-            file_path = os.path.join(root, filename)
-            file_size = get_file_size(file_path)
-            
-            # Skip files smaller than min_size
-            if file_size < min_size:
-                continue
-            
-            file_type = get_file_type(file_path)
-            modified_time = os.path.getmtime(file_path)
-            modified_date = datetime.fromtimestamp(modified_time).strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Calculate relative path from the scanned directory
-            rel_path = os.path.relpath(file_path, directory_path)
-            
-            file_info = {
-                "path": rel_path,
-                "size": file_size,
-                "type": file_type,
-                "modified": modified_date
-            }
-            
-            files.append(file_info)
-            
-            # Update type statistics
-            type_stats[file_type] += file_size
-            
-            # Update total size
-            total_size += file_size
-            
-            # Maintain a list of largest files
-            if len(largest_files) < 10:
-                largest_files.append(file_info)
-                largest_files.sort(key=lambda x: x["size"], reverse=True)
-            elif file_size > largest_files[-1]["size"]:
-                largest_files[-1] = file_info
-                largest_files.sort(key=lambda x: x["size"], reverse=True)
+    scanner = DirectoryScanner(directory_path, min_size, include_hidden, max_depth, workers, top_n, keep_files)
+    result = scanner.scan()
     
     # Calculate scan duration
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     
     return {
         "directory": directory_path,
         "scan_time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         "duration": f"{duration:.2f} seconds",
-        "files": files,
-        "file_count": len(files),
-        "type_stats": dict(type_stats),
-        "total_size": total_size,
-        "largest_files": largest_files
+        "files_per_second": result.file_count / duration if duration > 0 else 0.0,
+        "workers": scanner.workers,
+        "errors": scanner.errors,
+        "files": result.files if keep_files else [],
+        "file_count": result.file_count,
+        "type_stats": dict(result.type_stats),
+        "total_size": result.total_size,
+        "largest_files": result.largest()
     }
 
 
@@ -150,7 +355,8 @@ def get_directory_summary(scan_result):
     
     summary = []
     summary.append(f"Directory: {scan_result['directory']}")
-    summary.append(f"Scan time: {scan_result['scan_time']} (took {scan_result['duration']})")
+    summary.append(f"Scan time: {scan_result['scan_time']} (took {scan_result['duration']}, "
+                   f"{scan_result['files_per_second']:,.0f} files/s with {scan_result['workers']} threads)")
     summary.append(f"Total files: {scan_result['file_count']}")
     summary.append(f"Total size: {format_size(scan_result['total_size'])}")
     
@@ -0,0 +1,372 @@
+"""
+Disk Explorer - Persistent Scan Index
+Day 68 of 365 Days of Python
+
+This module keeps an on-disk SQLite index of scanned directories so that
+repeated queries do not rescan the whole tree. Each directory is stored with
+its mtime; a refresh only re-lists directories whose mtime changed and
+reuses the stored entries of all others.
+"""
+
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from file_analyzer import DirectoryScanner, FileRecord, get_file_type
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".disk_explorer", "index.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    parent_id INTEGER,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS directories_parent ON directories(parent_id);
+CREATE TABLE IF NOT EXISTS files (
+    dir_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    PRIMARY KEY (dir_id, name)
+);
+CREATE INDEX IF NOT EXISTS files_size ON files(size);
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    partial_hash TEXT,
+    full_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _subtree_bounds(path):
+    """
+    Return (lower, upper) bounds matching every path strictly below path.
+
+    '0' sorts directly after the separator, so path + '/' <= p < path + '0'
+    selects the subtree with an index range scan and no LIKE escaping.
+    """
+    base = path.rstrip(os.sep)
+    return base + os.sep, base + chr(ord(os.sep) + 1)
+
+
+class IndexingScanner(DirectoryScanner):
+    """
+    DirectoryScanner that skips re-listing directories whose mtime is unchanged.
+
+    Unchanged directories only queue their indexed subdirectories, since a
+    change deeper in the tree does not touch the parent's mtime. Changed or
+    new directories are listed in full and returned as records for the index.
+    """
+
+    def __init__(self, directory_path, known, children, full=False, workers=None):
+        # The index stores hidden entries too; queries filter them out
+        super().__init__(directory_path, include_hidden=True, workers=workers)
+        self.known = known
+        self.children = children
+        self.full = full
+        self.reused = 0
+
+    def _new_partial(self):
+        return []
+
+    def _merge(self, partials):
+        return [record for partial in partials for record in partial]
+
+    def _scan_one(self, worker_id, rel_dir, depth, records):
+        path = os.path.join(self.root, rel_dir) if rel_dir else self.root
+        prefix = rel_dir + os.sep if rel_dir else ""
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self._record_error()
+            return
+
+        if not self.full and self.known.get(path) == mtime_ns:
+            with self._lock:
+                self.reused += 1
+            for name in self.children.get(path, ()):
+                self._push(worker_id, prefix + name, depth + 1)
+            return
+
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            self._push(worker_id, prefix + entry.name, depth + 1)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            files.append((entry.name, stat.st_size, get_file_type(entry.name), stat.st_mtime))
+                    except OSError:
+                        self._record_error()
+        except OSError:
+            self._record_error()
+            return
+
+        records.append((path, mtime_ns, files, subdirs))
+
+
+class ScanIndex:
+    """Persistent per-directory scan index backed by SQLite."""
+
+    def __init__(self, index_path=DEFAULT_INDEX_PATH):
+        self.index_path = index_path
+        if index_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        self.conn = sqlite3.connect(index_path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _where_under(self, root):
+        """SQL condition and parameters selecting directories at or below root."""
+        lower, upper = _subtree_bounds(root)
+        return "(d.path = ? OR (d.path >= ? AND d.path < ?))", [root, lower, upper]
+
+    def _hidden_filter(self, root):
+        """SQL condition excluding hidden files and files below hidden directories."""
+        return "f.name NOT LIKE '.%' AND substr(d.path, ?) NOT LIKE ?", [len(root.rstrip(os.sep)) + 1, f"%{os.sep}.%"]
+
+    def last_updated(self, root):
+        """Return the time root (or an ancestor of it) was last refreshed, or None."""
+        root = os.path.abspath(root)
+        best = None
+        for path, updated_at in self.conn.execute("SELECT path, updated_at FROM roots"):
+            if root == path or root.startswith(path.rstrip(os.sep) + os.sep):
+                best = max(best or 0, updated_at)
+        return best
+
+    def update(self, root, workers=None, full=False, max_age=0):
+        """
+        Bring the index for a directory tree up to date.
+
+        Args:
+            root: Directory to index
+            workers: Number of scanner threads
+            full: Re-list every directory, even ones whose mtime is unchanged
+                (needed to pick up in-place file size changes, which do not
+                touch the directory mtime)
+            max_age: Skip the refresh if root was refreshed less than this many seconds ago
+
+        Returns:
+            dict: Refresh statistics
+        """
+        root = os.path.abspath(root)
+        start_time = time.perf_counter()
+
+        updated_at = self.last_updated(root)
+        if max_age and updated_at is not None and time.time() - updated_at < max_age:
+            return {"directories_scanned": 0, "directories_reused": 0, "errors": 0,
+                    "duration": 0.0, "workers": 0, "skipped": True}
+
+        where, params = self._where_under(root)
+        rows = self.conn.execute(
+            f"SELECT d.id, d.path, d.parent_id, d.mtime_ns FROM directories d WHERE {where}", params
+        ).fetchall()
+        known = {path: mtime_ns for _, path, _, mtime_ns in rows}
+        paths_by_id = {dir_id: path for dir_id, path, _, _ in rows}
+        children = {}
+        for _, path, parent_id, _ in rows:
+            parent = paths_by_id.get(parent_id)
+            if parent is not None:
+                children.setdefault(parent, []).append(os.path.basename(path))
+
+        scanner = IndexingScanner(root, known, children, full=full, workers=workers)
+        records = scanner.scan()
+        self._write(records, children)
+
+        self.conn.execute(
+            "INSERT INTO roots (path, updated_at) VALUES (?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET updated_at = excluded.updated_at",
+            (root, time.time())
+        )
+        self.conn.commit()
+
+        return {
+            "directories_scanned": len(records),
+            "directories_reused": scanner.reused,
+            "errors": scanner.errors,
+            "duration": time.perf_counter() - start_time,
+            "workers": scanner.workers,
+            "skipped": False,
+        }
+
+    def _write(self, records, old_children):
+        """Store rescanned directories, parents before children, in one transaction."""
+        cursor = self.conn.cursor()
+        for path, mtime_ns, files, subdirs in sorted(records, key=lambda r: r[0].count(os.sep)):
+            parent = cursor.execute(
+                "SELECT id FROM directories WHERE path = ?", (os.path.dirname(path),)
+            ).fetchone()
+            cursor.execute(
+                "INSERT INTO directories (path, parent_id, mtime_ns) VALUES (?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET parent_id = excluded.parent_id, mtime_ns = excluded.mtime_ns",
+                (path, parent[0] if parent else None, mtime_ns)
+            )
+            dir_id = cursor.execute("SELECT id FROM directories WHERE path = ?", (path,)).fetchone()[0]
+
+            cursor.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+            cursor.executemany(
+                "INSERT INTO files (dir_id, name, size, type, mtime) VALUES (?, ?, ?, ?, ?)",
+                [(dir_id,) + file_row for file_row in files]
+            )
+
+            # Drop subtrees of directories that no longer exist
+            for name in set(old_children.get(path, ())) - set(subdirs):
+                self._delete_subtree(cursor, os.path.join(path, name))
+
+    def _delete_subtree(self, cursor, path):
+        lower, upper = _subtree_bounds(path)
+        condition = "path = ? OR (path >= ? AND path < ?)"
+        cursor.execute(
+            f"DELETE FROM files WHERE dir_id IN (SELECT id FROM directories WHERE {condition})",
+            (path, lower, upper)
+        )
+        cursor.execute(f"DELETE FROM directories WHERE {condition}", (path, lower, upper))
+
+    def _file_query(self, root, include_hidden, min_size):
+        where, params = self._where_under(root)
+        conditions = [where, "f.size >= ?"]
+        params.append(min_size)
+        if not include_hidden:
+            hidden, hidden_params = self._hidden_filter(root)
+            conditions.append(hidden)
+            params.extend(hidden_params)
+        return "FROM files f JOIN directories d ON d.id = f.dir_id WHERE " + " AND ".join(conditions), params
+
+    def largest_files(self, root, count=10, min_size=0, include_hidden=False):
+        """
+        Return the largest indexed files below root.
+
+        Returns:
+            list: FileRecords with paths relative to root
+        """
+        root = os.path.abspath(root)
+        query, params = self._file_query(root, include_hidden, min_size)
+        rows = self.conn.execute(
+            f"SELECT d.path, f.name, f.size, f.type, f.mtime {query} ORDER BY f.size DESC LIMIT ?",
+            params + [count]
+        )
+        return [
+            FileRecord(os.path.relpath(os.path.join(path, name), root), size, file_type, mtime)
+            for path, name, size, file_type, mtime in rows
+        ]
+
+    def size_collisions(self, root, min_size=1, include_hidden=False):
+        """
+        Return indexed files below root that share their size with another file.
+
+        Returns:
+            list: FileRecords with paths relative to root, ordered by size
+        """
+        root = os.path.abspath(root)
+        query, params = self._file_query(root, include_hidden, min_size)
+        rows = self.conn.execute(
+            f"SELECT d.path, f.name, f.size, f.type, f.mtime {query} "
+            "AND f.size IN (SELECT size FROM files WHERE size >= ? GROUP BY size HAVING COUNT(*) > 1) "
+            "ORDER BY f.size",
+            params + [min_size]
+        )
+        return [
+            FileRecord(os.path.relpath(os.path.join(path, name), root), size, file_type, mtime)
+            for path, name, size, file_type, mtime in rows
+        ]
+
+    def cached_hashes(self, paths, batch_size=500):
+        """
+        Look up stored content hashes.
+
+        Returns:
+            dict: Absolute path -> (size, mtime, partial_hash, full_hash)
+        """
+        paths = list(paths)
+        cached = {}
+        for i in range(0, len(paths), batch_size):
+            batch = paths[i:i + batch_size]
+            placeholders = ",".join("?" * len(batch))
+            for path, size, mtime, partial_hash, full_hash in self.conn.execute(
+                f"SELECT path, size, mtime, partial_hash, full_hash FROM hashes WHERE path IN ({placeholders})", batch
+            ):
+                cached[path] = (size, mtime, partial_hash, full_hash)
+        return cached
+
+    def store_hashes(self, rows):
+        """Store (path, size, mtime, partial_hash, full_hash) rows."""
+        self.conn.executemany(
+            "INSERT INTO hashes (path, size, mtime, partial_hash, full_hash) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime = excluded.mtime, "
+            "partial_hash = excluded.partial_hash, full_hash = excluded.full_hash",
+            rows
+        )
+        self.conn.commit()
+
+    def type_stats(self, root, min_size=0, include_hidden=False):
+        """Return total bytes per file type below root."""
+        root = os.path.abspath(root)
+        query, params = self._file_query(root, include_hidden, min_size)
+        return dict(self.conn.execute(f"SELECT f.type, SUM(f.size) {query} GROUP BY f.type", params))
+
+    def totals(self, root, min_size=0, include_hidden=False):
+        """Return (file count, total bytes) below root."""
+        root = os.path.abspath(root)
+        query, params = self._file_query(root, include_hidden, min_size)
+        count, total = self.conn.execute(f"SELECT COUNT(*), SUM(f.size) {query}", params).fetchone()
+        return count, total or 0
+
+    def scan_result(self, root, min_size=0, include_hidden=False, workers=None, max_age=0):
+        """
+        Refresh the index for root and build a scan_directory-style result from it.
+
+        The per-file "files" list is left empty; use largest_files() and
+        type_stats() to query the index instead.
+        """
+        if not os.path.isdir(root):
+            return {
+                "error": f"Directory does not exist or is not accessible: {root}",
+                "files": [],
+                "type_stats": {},
+                "total_size": 0,
+                "largest_files": []
+            }
+
+        start_time = time.perf_counter()
+        stats = self.update(root, workers=workers, max_age=max_age)
+        file_count, total_size = self.totals(root, min_size, include_hidden)
+        largest_files = self.largest_files(root, 10, min_size, include_hidden)
+        duration = time.perf_counter() - start_time
+
+        return {
+            "directory": root,
+            "scan_time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "duration": f"{duration:.2f} seconds",
+            "files_per_second": file_count / duration if duration > 0 else 0.0,
+            "workers": stats["workers"],
+            "errors": stats["errors"],
+            "index": stats,
+            "files": [],
+            "file_count": file_count,
+            "type_stats": self.type_stats(root, min_size, include_hidden),
+            "total_size": total_size,
+            "largest_files": largest_files
+        }
@@ -0,0 +1,69 @@
+"""
+Tests for the duplicates module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from duplicates import find_duplicates
+from scan_index import ScanIndex
+
+
+class TestFindDuplicates(unittest.TestCase):
+    """Test cases for the duplicate file finder."""
+
+    def setUp(self):
+        """Create a directory with one pair of duplicates."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.write("a.txt", b"same content")
+        self.write("b.txt", b"same content")
+        self.write("c.txt", b"other")
+        self.index = ScanIndex(":memory:")
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.index.close()
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_finds_duplicates(self):
+        """Test that identical files are grouped and different ones are not."""
+        result = find_duplicates(self.temp_dir, processes=0)
+        self.assertEqual([group["paths"] for group in result["groups"]], [["a.txt", "b.txt"]])
+        self.assertEqual(result["reclaimable"], len(b"same content"))
+
+    def test_index_caches_hashes(self):
+        """Test that a second run reuses the hashes stored in the index."""
+        first = find_duplicates(self.temp_dir, processes=0, index=self.index)
+        second = find_duplicates(self.temp_dir, processes=0, index=self.index)
+        self.assertEqual(first["cache_hits"], 0)
+        self.assertEqual(second["cache_hits"], 2)
+        self.assertEqual(second["groups"], first["groups"])
+
+    def test_in_place_edit_with_same_size(self):
+        """Test that a same-size in-place edit is not hidden by cached hashes."""
+        find_duplicates(self.temp_dir, processes=0, index=self.index)
+
+        # Overwriting a file does not change its directory's mtime, so the
+        # index refresh keeps the file's old size and mtime
+        directory_mtime = os.stat(self.temp_dir).st_mtime_ns
+        path = self.write("b.txt", b"SAME CONTENT")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(os.stat(self.temp_dir).st_mtime_ns, directory_mtime)
+
+        result = find_duplicates(self.temp_dir, processes=0, index=self.index)
+        self.assertEqual(result["groups"], [])
+        self.assertEqual(result["cache_hits"], 1)
+        self.assertEqual(result["groups"], find_duplicates(self.temp_dir, processes=0)["groups"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the file_analyzer module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from file_analyzer import ScanAccumulator, scan_directory
+
+
+class TestScanAccumulator(unittest.TestCase):
+    """Test cases for streaming scan aggregation."""
+
+    def test_merge_with_equal_sizes(self):
+        """Test merging per-worker partials whose files all have the same size."""
+        # Every worker numbers its heap items from 1, so the merged items
+        # share (size, sequence number) pairs
+        partials = []
+        for worker in range(4):
+            partial = ScanAccumulator(top_n=3)
+            for i in range(2):
+                partial.add(f"w{worker}/", f"file{i}.txt", 100, 0.0)
+            partials.append(partial)
+
+        merged = ScanAccumulator.merge(partials, top_n=3)
+        self.assertEqual(merged.file_count, 8)
+        self.assertEqual(merged.total_size, 800)
+        self.assertEqual(len(merged.files), 8)
+        self.assertEqual([record.size for record in merged.largest()], [100, 100, 100])
+
+        # The merged heap stays usable
+        merged.add("", "big.bin", 500, 0.0)
+        merged.add("", "same.bin", 100, 0.0)
+        self.assertEqual([record.size for record in merged.largest()], [500, 100, 100])
+
+    def test_largest_first(self):
+        """Test that only the top_n largest files are ranked, largest first."""
+        partial = ScanAccumulator(top_n=2, keep_files=False)
+        for size in (5, 50, 10, 40):
+            partial.add("", f"{size}.txt", size, 0.0)
+        self.assertIsNone(partial.files)
+        self.assertEqual([record.path for record in partial.largest()], ["50.txt", "40.txt"])
+
+
+class TestScanDirectory(unittest.TestCase):
+    """Test cases for the parallel directory scanner."""
+
+    def setUp(self):
+        """Create a small tree of equally sized files."""
+        self.temp_dir = tempfile.mkdtemp()
+        for d in range(8):
+            os.makedirs(os.path.join(self.temp_dir, f"dir{d}", "sub"))
+            for f in range(3):
+                for parent in (f"dir{d}", os.path.join(f"dir{d}", "sub")):
+                    with open(os.path.join(self.temp_dir, parent, f"f{f}.txt"), "w") as fh:
+                        fh.write("x" * 10)
+        with open(os.path.join(self.temp_dir, ".hidden"), "w") as fh:
+            fh.write("x" * 10)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_scan(self):
+        """Test a multi-worker scan of files with equal sizes."""
+        result = scan_directory(self.temp_dir, workers=4, top_n=5)
+        self.assertEqual(result["file_count"], 48)
+        self.assertEqual(result["total_size"], 480)
+        self.assertEqual(len(result["largest_files"]), 5)
+        self.assertEqual(result["errors"], 0)
+
+    def test_include_hidden_and_max_depth(self):
+        """Test the hidden-file and depth filters."""
+        self.assertEqual(scan_directory(self.temp_dir, include_hidden=True)["file_count"], 49)
+        self.assertEqual(scan_directory(self.temp_dir, max_depth=1)["file_count"], 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests for the scan_index module.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import disk_explorer
+from scan_index import ScanIndex
+
+
+class TestScanIndex(unittest.TestCase):
+    """Test cases for incremental and full index refreshes."""
+
+    def setUp(self):
+        """Create a small tree and index it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.temp_dir, "tree")
+        os.makedirs(os.path.join(self.root, "sub", "deep"))
+        self.write("a.txt", 10)
+        self.write(os.path.join("sub", "b.py"), 20)
+        self.write(os.path.join("sub", "deep", "c.jpg"), 30)
+        self.index_path = os.path.join(self.temp_dir, "index.sqlite")
+        self.index = ScanIndex(self.index_path)
+        self.index.update(self.root)
+
+    def tearDown(self):
+        """Close the index and clean up the temporary directory."""
+        self.index.close()
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name, size):
+        with open(os.path.join(self.root, name), "wb") as f:
+            f.write(b"x" * size)
+
+    def files(self):
+        return {record.path: record.size for record in self.index.largest_files(self.root, count=100)}
+
+    def test_initial_index(self):
+        """Test that every file of the tree is indexed."""
+        self.assertEqual(self.files(), {"a.txt": 10, os.path.join("sub", "b.py"): 20,
+                                        os.path.join("sub", "deep", "c.jpg"): 30})
+        self.assertEqual(self.index.totals(self.root), (3, 60))
+
+    def test_added_file(self):
+        """Test that a new file is picked up by re-listing only its directory."""
+        self.write(os.path.join("sub", "new.txt"), 40)
+        stats = self.index.update(self.root)
+
+        self.assertEqual(stats["directories_scanned"], 1)
+        self.assertEqual(stats["directories_reused"], 2)
+        self.assertEqual(self.files()[os.path.join("sub", "new.txt")], 40)
+
+    def test_deleted_file_and_directory(self):
+        """Test that deleted files and whole deleted subtrees leave the index."""
+        os.remove(os.path.join(self.root, "a.txt"))
+        shutil.rmtree(os.path.join(self.root, "sub", "deep"))
+        self.index.update(self.root)
+
+        self.assertEqual(self.files(), {os.path.join("sub", "b.py"): 20})
+        self.assertEqual(self.index.type_stats(self.root), {"code": 20})
+
+    def test_modified_file_needs_full_rescan(self):
+        """Test that a file rewritten in place is only picked up by a full rescan."""
+        self.write(os.path.join("sub", "b.py"), 25)
+
+        stats = self.index.update(self.root)
+        self.assertEqual(stats["directories_scanned"], 0)
+        self.assertEqual(self.files()[os.path.join("sub", "b.py")], 20)
+
+        stats = self.index.update(self.root, full=True)
+        self.assertEqual(stats["directories_scanned"], 3)
+        self.assertEqual(stats["directories_reused"], 0)
+        self.assertEqual(self.files()[os.path.join("sub", "b.py")], 25)
+
+    def test_rescan_flag(self):
+        """Test that --rescan makes the CLI pick up a file rewritten in place."""
+        self.write("a.txt", 50)
+        self.index.close()
+
+        def large_files(*flags):
+            argv = ["disk_explorer.py", "--large", self.root, "--min-size", "0", "--index", self.index_path]
+            output = io.StringIO()
+            with mock.patch.object(sys, "argv", argv + list(flags)), contextlib.redirect_stdout(output):
+                disk_explorer.main()
+            return output.getvalue()
+
+        self.assertIn("Size: 10.00 B", large_files())
+        self.assertIn("Size: 50.00 B", large_files("--rescan"))
+        self.assertIn("Size: 50.00 B", large_files())
+        self.index = ScanIndex(self.index_path)
+
+
+if __name__ == "__main__":
+    unittest.main()